@@ -7,6 +7,8 @@ from __future__ import annotations
 import math
 from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Odds helpers
@@ -46,6 +48,14 @@ def american_profit(odds: Any) -> float:
     return odds / 100.0
 
 
+def american_profit_array(odds: np.ndarray) -> np.ndarray:
+    """Vectorized american_profit; zero or non-finite odds give 0.0."""
+    odds = np.asarray(odds, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit = np.where(odds < 0, 100.0 / np.abs(odds), odds / 100.0)
+    return np.where(np.isfinite(odds) & (odds != 0), profit, 0.0)
+
+
 def safe_float(x: Any) -> Optional[float]:
     try:
         return float(x) if x is not None else None
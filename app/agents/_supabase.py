@@ -9,6 +9,7 @@ from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # ---------------------------------------------------------------------------
 # Config
@@ -47,10 +48,16 @@ def _headers() -> Dict[str, str]:
 # Generic REST helpers
 # ---------------------------------------------------------------------------
 
+# One keep-alive session for every fetch, so paginated and concurrent reads
+# reuse pooled connections instead of paying a TCP+TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
 def sb_get(path: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
     base_url, _ = _get_sb_config()
     url = f"{base_url.rstrip('/')}{path}"
-    r = requests.get(url, headers=_headers(), params=params, timeout=60)
+    r = _SESSION.get(url, headers=_headers(), params=params, timeout=60)
     if not r.ok:
         raise RuntimeError(f"Supabase GET {r.status_code}: {r.text[:300]}")
     data = r.json()
@@ -1105,6 +1105,7 @@ def model_insights(tenant_id: str = Depends(get_tenant_id)):
     from app.model_insights import load_insights_for_tenant
     from app.engine.config import get_module as _get_module
     from app.engine import store as _store
+    from app.engine.predict import has_base_model
     insights = load_insights_for_tenant(tenant_id)
     if insights is None:
         raise HTTPException(status_code=404, detail="No trained model found for this tenant.")
@@ -1114,7 +1115,7 @@ def model_insights(tenant_id: str = Depends(get_tenant_id)):
         _run = _store.get_current_model_run(tenant_id, "churn")
         _adir = _run.get("artifact_path") if _run else _mod.get_artifact_dir(tenant_id)
         if _adir:
-            insights["has_base_model"] = os.path.exists(os.path.join(_adir, "base_model.joblib"))
+            insights["has_base_model"] = has_base_model(_adir)
             insights["has_shap_background"] = os.path.exists(os.path.join(_adir, "shap_background.npy"))
         else:
             insights["has_base_model"] = False
@@ -1630,7 +1631,9 @@ def predict_module(
             _spawn_hubspot_writeback(tenant_id, writeback_records)
 
         # Tier counts (from full active set)
-        tier_counts = scored_display["tier"].value_counts().to_dict()
+        # tier is categorical — drop the zero counts value_counts() reports
+        # for tiers with no accounts
+        tier_counts = {t: c for t, c in scored_display["tier"].value_counts().items() if c}
 
         # Summary stats for dashboard
         summary = {}
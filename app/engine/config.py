@@ -5,6 +5,7 @@ import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # Calibration settings
@@ -13,6 +14,11 @@ from typing import Dict, List, Optional
 class CalibrationConfig:
     method: str = "sigmoid"        # "sigmoid" (Platt) or "isotonic"
     cv_folds: int = 5              # used with CalibratedClassifierCV
+    # From this many training rows, calibrate the already-fitted base model on
+    # the most recent holdout slice of the training window (one base fit)
+    # instead of refitting it once per CV fold.
+    prefit_min_train: int = 1000
+    prefit_holdout_frac: float = 0.2
     prob_floor: float = 0.05
     prob_ceil: float = 0.95
 
@@ -36,6 +42,16 @@ class TierConfig:
             return self.medium_label
         return self.low_label
 
+    @property
+    def labels(self) -> List[str]:
+        """Tier labels in ascending order; a label's index is its tier code."""
+        return [self.low_label, self.medium_label, self.high_label]
+
+    def classify_codes(self, probs: np.ndarray) -> np.ndarray:
+        """Vectorized tier codes (0=low, 1=medium, 2=high) via one searchsorted."""
+        cutoffs = np.array([self.medium_threshold, self.high_threshold])
+        return np.searchsorted(cutoffs, probs, side="right")
+
 
 # ---------------------------------------------------------------------------
 # Module descriptor
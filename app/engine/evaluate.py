@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,6 +20,7 @@ def evaluate_model(
     output_dir: str = "outputs",
     tenant_id: str | None = None,
     artifacts: Optional[Dict[str, Any]] = None,
+    pretty_json: bool = False,
 ) -> Dict[str, Any]:
     """Run full evaluation on a labeled dataset.
 
@@ -30,15 +32,13 @@ def evaluate_model(
             provided, skips artifact discovery so the correct versioned path
             is used. Required when calling immediately after training a
             versioned run (run_id path) to avoid the no-run_id fallback.
+        pretty_json: Indent the evaluation JSON for human reading. The default
+            compact form is what the console reads back and is much smaller
+            for large lift/calibration payloads.
 
     Returns:
         Evaluation report dict.
     """
-    from sklearn.metrics import (
-        roc_auc_score, average_precision_score, brier_score_loss, log_loss,
-        confusion_matrix, classification_report, precision_recall_curve, f1_score,
-    )
-
     print(f"\n{'=' * 60}")
     print(f"  Evaluating: {module.display_name}")
     print(f"{'=' * 60}\n")
@@ -52,9 +52,9 @@ def evaluate_model(
     y = scored[module.label_column].astype(int).values
     n = len(y)
 
-    # Core metrics
-    eps = 1e-15
-    probs_clipped = np.clip(probs, eps, 1 - eps)
+    # One descending sort shared by the threshold scan, calibration bins,
+    # lift table and top-decile summary.
+    desc_order = np.argsort(-probs, kind="stable")
 
     metrics: Dict[str, Any] = {
         "module": module.name,
@@ -63,75 +63,56 @@ def evaluate_model(
         "base_rate": round(float(y.mean()), 4),
     }
 
-    try:
-        metrics["auc"] = round(float(roc_auc_score(y, probs)), 5)
-    except ValueError:
-        metrics["auc"] = None
+    # Core metrics
+    metrics.update(_core_metrics(probs, y))
 
-    try:
-        metrics["pr_auc"] = round(float(average_precision_score(y, probs)), 5)
-    except ValueError:
-        metrics["pr_auc"] = None
-
-    metrics["brier"] = round(float(brier_score_loss(y, probs)), 5)
-    metrics["logloss"] = round(float(log_loss(y, probs_clipped)), 5)
-
-    # Find optimal threshold by maximizing F1
-    if int(y.sum()) > 0:
-        pr_vals, rc_vals, thresholds = precision_recall_curve(y, probs)
-        # F1 for each threshold (pr_vals and rc_vals have len = thresholds + 1)
-        f1_scores = np.where(
-            (pr_vals[:-1] + rc_vals[:-1]) > 0,
-            2 * pr_vals[:-1] * rc_vals[:-1] / (pr_vals[:-1] + rc_vals[:-1]),
-            0.0,
-        )
-        best_idx = int(np.argmax(f1_scores))
-        best_threshold = float(thresholds[best_idx])
-    else:
-        best_threshold = 0.5
+    # Find optimal threshold by maximizing F1 — one sorted scan yields the
+    # threshold and its confusion counts together.
+    best_threshold, (tn, fp, fn, tp) = _optimal_f1_threshold(probs, y, desc_order)
 
     metrics["threshold"] = round(best_threshold, 4)
-
-    # Confusion matrix using optimal threshold
-    preds = (probs >= best_threshold).astype(int)
-    cm = confusion_matrix(y, preds, labels=[0, 1])
-    metrics["confusion_matrix"] = cm.tolist()
-    tn, fp, fn, tp = cm.ravel()
+    metrics["confusion_matrix"] = [[tn, fp], [fn, tp]]
     metrics["accuracy"] = round(float((tp + tn) / n), 4)
     metrics["precision"] = round(float(tp / (tp + fp)), 4) if (tp + fp) > 0 else 0.0
     metrics["recall"] = round(float(tp / (tp + fn)), 4) if (tp + fn) > 0 else 0.0
-    metrics["f1"] = round(float(f1_score(y, preds)), 4) if int(y.sum()) > 0 else 0.0
+    metrics["f1"] = round(float(2 * tp / (2 * tp + fp + fn)), 4) if (tp + fn) > 0 else 0.0
 
     # Calibration bins
     n_bins = min(10, max(3, n // 50))
-    sorted_idx = np.argsort(probs)
     chunk = max(1, n // n_bins)
-    calibration_bins = []
-    for i in range(0, n, chunk):
-        sl = sorted_idx[i:i + chunk]
-        if len(sl) == 0:
-            continue
-        calibration_bins.append({
-            "bin_lo": round(float(probs[sl].min()), 4),
-            "bin_hi": round(float(probs[sl].max()), 4),
-            "n": int(len(sl)),
-            "predicted_avg": round(float(probs[sl].mean()), 4),
-            "actual_rate": round(float(y[sl].mean()), 4),
-            "delta": round(float(probs[sl].mean() - y[sl].mean()), 4),
-        })
+    counts, bin_lo, bin_hi, prob_sums, pos_counts = _chunk_stats(
+        probs, y, desc_order[::-1], chunk,
+    )
+    predicted_avg = prob_sums / counts
+    actual_rate = pos_counts / counts
+    calibration_bins = pd.DataFrame({
+        "bin_lo": bin_lo,
+        "bin_hi": bin_hi,
+        "n": counts,
+        "predicted_avg": predicted_avg,
+        "actual_rate": actual_rate,
+        "delta": predicted_avg - actual_rate,
+    }).round(4).to_dict("records")
     metrics["calibration_bins"] = calibration_bins
     metrics["calibration_error"] = round(
         float(np.mean([abs(b["delta"]) for b in calibration_bins])), 4
     )
 
     # Lift / decile table
-    lift_table = _compute_lift_table(probs, y)
+    lift_table = _compute_lift_table(probs, y, desc_order)
     metrics["lift_table"] = lift_table
     if lift_table:
         metrics["lift_at_top10"] = lift_table[0]["lift"]
         top_decile = lift_table[0]
         metrics["capture_at_top10"] = top_decile["cumulative_capture"]
 
+    # Value column and predict()'s value_at_risk (= value * probability),
+    # pulled out once for the tier and business-impact blocks below.
+    has_value = bool(module.value_column) and module.value_column in scored.columns
+    if has_value:
+        values = scored[module.value_column].to_numpy(dtype=float)
+        value_at_risk = scored["value_at_risk"].to_numpy(dtype=float)
+
     # Tier breakdown
     tier_breakdown = {}
     for tier_label in [module.tiers.high_label, module.tiers.medium_label, module.tiers.low_label]:
@@ -145,25 +126,24 @@ def evaluate_model(
             "actual_rate": round(float(tier_y.mean()), 4),
             "avg_probability": round(float(tier_p.mean()), 4),
         }
-        if module.value_column and module.value_column in scored.columns:
-            tier_vals = scored.loc[mask, module.value_column].values.astype(float)
-            tier_breakdown[tier_label]["total_value"] = round(float(tier_vals.sum()), 2)
+        if has_value:
+            tier_breakdown[tier_label]["total_value"] = round(float(values[mask].sum()), 2)
             tier_breakdown[tier_label]["value_at_risk"] = round(
-                float((tier_vals * tier_p).sum()), 2
+                float(value_at_risk[mask].sum()), 2
             )
     metrics["tier_breakdown"] = tier_breakdown
 
     # Business impact summary
-    if module.value_column and module.value_column in scored.columns:
-        total_value = scored[module.value_column].sum()
+    if has_value:
+        total_value = np.nansum(values)
         # Value captured in top decile
         top_n = max(1, n // 10)
-        top_idx = np.argsort(-probs)[:top_n]
-        top_value = scored.iloc[top_idx][module.value_column].sum()
+        top_idx = desc_order[:top_n]
+        top_value = np.nansum(values[top_idx])
         top_positives = int(y[top_idx].sum())
         # ARR at risk in top decile
-        arr_at_risk_top = float((scored.iloc[top_idx][module.value_column] * probs[top_idx]).sum())
-        total_arr_at_risk = float((scored[module.value_column] * probs).sum())
+        arr_at_risk_top = float(np.nansum(value_at_risk[top_idx]))
+        total_arr_at_risk = float(np.nansum(value_at_risk))
         metrics["business_impact"] = {
             "total_value": round(float(total_value), 2),
             "value_in_top_decile": round(float(top_value), 2),
@@ -178,12 +158,16 @@ def evaluate_model(
 
     report_path = os.path.join(output_dir, f"{module.name}_evaluation.json")
     with open(report_path, "w") as f:
-        json.dump(metrics, f, indent=2, default=str)
+        if pretty_json:
+            json.dump(metrics, f, indent=2, default=str)
+        else:
+            json.dump(metrics, f, separators=(",", ":"), default=str)
     print(f"[eval] Saved report -> {report_path}")
 
     # Scored CSV
     scored_path = os.path.join(output_dir, f"{module.name}_scored.csv")
-    scored.to_csv(scored_path, index=False)
+    # Chunked so pandas never materializes the whole CSV text in memory
+    scored.to_csv(scored_path, index=False, chunksize=50_000)
     print(f"[eval] Saved scored data -> {scored_path}")
 
     # Print summary
@@ -199,36 +183,136 @@ def evaluate_model(
     return metrics
 
 
-def _compute_lift_table(probs: np.ndarray, y: np.ndarray) -> List[Dict[str, Any]]:
-    """Compute lift/decile table."""
+# Above this many rows the four core sklearn metrics run on a thread pool;
+# below it the pool costs more than the passes it overlaps.
+_PARALLEL_METRICS_MIN_ROWS = 50_000
+
+
+def _core_metrics(probs: np.ndarray, y: np.ndarray) -> Dict[str, Optional[float]]:
+    """AUC, PR-AUC, Brier and log loss, each rounded to 5 places.
+
+    AUC and PR-AUC are None when undefined (single-class labels). The four
+    are independent full passes, so large inputs compute them concurrently.
+    """
+    from sklearn.metrics import (
+        roc_auc_score, average_precision_score, brier_score_loss, log_loss,
+    )
+
+    eps = 1e-15
+    probs_clipped = np.clip(probs, eps, 1 - eps)
+
+    def _score(fn: Any, p: np.ndarray, undefined_ok: bool) -> Optional[float]:
+        try:
+            return round(float(fn(y, p)), 5)
+        except ValueError:
+            if undefined_ok:
+                return None
+            raise
+
+    jobs = {
+        "auc": (roc_auc_score, probs, True),
+        "pr_auc": (average_precision_score, probs, True),
+        "brier": (brier_score_loss, probs, False),
+        "logloss": (log_loss, probs_clipped, False),
+    }
+    if len(y) < _PARALLEL_METRICS_MIN_ROWS:
+        return {name: _score(*job) for name, job in jobs.items()}
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {name: pool.submit(_score, *job) for name, job in jobs.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+def _optimal_f1_threshold(
+    probs: np.ndarray, y: np.ndarray, desc_order: Optional[np.ndarray] = None,
+) -> Tuple[float, Tuple[int, int, int, int]]:
+    """Return the F1-maximizing threshold and its (tn, fp, fn, tp) counts.
+
+    Sorts once by descending probability and derives precision/recall/F1 at
+    every distinct threshold from cumulative TP/FP counts. Ties in F1 resolve
+    to the lowest threshold, matching the previous precision_recall_curve path.
+    Falls back to 0.5 when there are no positives. ``desc_order`` may be a
+    precomputed ``np.argsort(-probs, kind="stable")`` to skip the sort.
+    """
+    n = len(y)
+    total_pos = int(y.sum())
+    if total_pos == 0:
+        pred_pos = int((probs >= 0.5).sum())
+        return 0.5, (n - pred_pos, pred_pos, 0, 0)
+
+    if desc_order is None:
+        desc_order = np.argsort(-probs, kind="stable")
+    probs_desc = probs[desc_order]
+    tps = np.cumsum(y[desc_order])
+    # Only the last index of each run of tied probabilities is a valid cut.
+    cuts = np.r_[np.flatnonzero(np.diff(probs_desc)), n - 1]
+    tps = tps[cuts]
+    fps = (cuts + 1) - tps
+    f1 = 2 * tps / (tps + fps + total_pos)
+    best = len(f1) - 1 - int(np.argmax(f1[::-1]))
+
+    tp = int(tps[best])
+    fp = int(fps[best])
+    fn = total_pos - tp
+    tn = n - tp - fp - fn
+    return float(probs_desc[cuts[best]]), (tn, fp, fn, tp)
+
+
+def _compute_lift_table(
+    probs: np.ndarray, y: np.ndarray, desc_order: Optional[np.ndarray] = None,
+) -> List[Dict[str, Any]]:
+    """Compute lift/decile table.
+
+    ``desc_order`` may be a precomputed descending argsort of ``probs``.
+    """
     n = len(y)
     n_deciles = min(10, max(2, n // 20))
-    sorted_idx = np.argsort(-probs)
+    sorted_idx = desc_order if desc_order is not None else np.argsort(-probs)
     chunk = max(1, n // n_deciles)
     base_rate = float(y.mean())
-    table = []
-    cumulative_positives = 0
     total_positives = int(y.sum())
 
-    for i in range(0, n, chunk):
-        sl = sorted_idx[i:i + chunk]
-        if len(sl) == 0:
-            continue
-        decile = len(table) + 1
-        actual_rate = float(y[sl].mean())
-        cumulative_positives += int(y[sl].sum())
-        capture_rate = cumulative_positives / total_positives if total_positives > 0 else 0.0
-        lift = actual_rate / base_rate if base_rate > 0 else 0.0
-        table.append({
-            "decile": decile,
-            "n": int(len(sl)),
-            "avg_prob": round(float(probs[sl].mean()), 4),
-            "actual_rate": round(actual_rate, 4),
-            "lift": round(lift, 2),
-            "cumulative_capture": round(capture_rate, 4),
-        })
-
-    return table
+    counts, _, _, prob_sums, pos_counts = _chunk_stats(probs, y, sorted_idx, chunk)
+    actual_rate = pos_counts / counts
+    cumulative_capture = (
+        np.cumsum(pos_counts) / total_positives if total_positives > 0
+        else np.zeros(len(counts))
+    )
+    lift = actual_rate / base_rate if base_rate > 0 else np.zeros(len(counts))
+
+    return pd.DataFrame({
+        "decile": np.arange(1, len(counts) + 1),
+        "n": counts,
+        "avg_prob": prob_sums / counts,
+        "actual_rate": actual_rate,
+        "lift": lift,
+        "cumulative_capture": cumulative_capture,
+    }).round({"avg_prob": 4, "actual_rate": 4, "lift": 2, "cumulative_capture": 4}).to_dict("records")
+
+
+def _chunk_stats(
+    probs: np.ndarray, y: np.ndarray, order: np.ndarray, chunk: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-chunk (count, min prob, max prob, prob sum, positives) over ``order``.
+
+    Consecutive runs of ``chunk`` indexes form one bin (the last may be
+    short); every statistic comes from a single reduceat per array. Sums
+    accumulate in float64/int64, so narrow (float32/int8) inputs are safe.
+    """
+    n = len(order)
+    if n == 0:
+        empty = np.zeros(0)
+        return empty.astype(int), empty, empty, empty, empty.astype(int)
+    starts = np.arange(0, n, chunk)
+    counts = np.diff(np.r_[starts, n])
+    p_sorted = probs[order]
+    return (
+        counts,
+        np.minimum.reduceat(p_sorted, starts).astype(np.float64),
+        np.maximum.reduceat(p_sorted, starts).astype(np.float64),
+        np.add.reduceat(p_sorted, starts, dtype=np.float64),
+        np.add.reduceat(y[order], starts, dtype=np.int64),
+    )
 
 
 def generate_pdf_report(
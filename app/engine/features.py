@@ -25,7 +25,21 @@ def prepare_features(
 
     Returns:
         (X, y, feature_names, meta) where meta stores learned params.
+
+    At fit time meta also records an ``inference_recipe`` — one
+    (kind, source_column, param) entry per output feature. When it is present
+    and fit=False, X is filled column-by-column straight from the recipe,
+    skipping dtype classification and the intermediate working frame.
     """
+    if not fit and feature_meta and feature_meta.get("inference_recipe"):
+        X = _apply_recipe(df, feature_meta["inference_recipe"])
+        if X is not None:
+            if module.label_column in df.columns:
+                y = df[module.label_column].astype(int).values
+            else:
+                y = np.zeros(len(df), dtype=int)
+            return X, y, list(feature_meta["feature_names"]), feature_meta
+
     work = df.copy()
     label_col = module.label_column
 
@@ -48,6 +62,8 @@ def prepare_features(
     numeric_cols: List[str] = []
     categorical_cols: List[str] = []
     datetime_cols: List[str] = []
+    # Parsed datetime columns, kept so feature extraction doesn't re-parse
+    dt_series: Dict[str, pd.Series] = {}
 
     for col in candidate_cols:
         series = work[col]
@@ -55,6 +71,7 @@ def prepare_features(
             numeric_cols.append(col)
         elif pd.api.types.is_datetime64_any_dtype(series):
             datetime_cols.append(col)
+            dt_series[col] = series
         else:
             # Try numeric conversion
             try:
@@ -65,7 +82,7 @@ def prepare_features(
                 pass
             # Try datetime
             try:
-                work[col] = pd.to_datetime(series, format="mixed", errors="raise")
+                work[col] = dt_series[col] = pd.to_datetime(series, format="mixed", errors="raise")
                 datetime_cols.append(col)
                 continue
             except (ValueError, TypeError):
@@ -103,16 +120,21 @@ def prepare_features(
         if col in work.columns:
             work[col] = work[col].fillna(medians.get(col, 0.0)).astype(float)
 
+    # Output feature name -> (kind, source column, param) for the recipe
+    recipe_by_name: Dict[str, List[Any]] = {
+        col: ["numeric", col, medians.get(col, 0.0)] for col in numeric_cols
+    }
+
     # --- Datetime: extract day_of_week, month, days_since_epoch ---
     dt_features: List[str] = []
     for col in datetime_cols:
         if col in work.columns:
-            dt = pd.to_datetime(work[col], format="mixed", errors="coerce")
             dow_col = f"{col}_dow"
             month_col = f"{col}_month"
-            work[dow_col] = dt.dt.dayofweek.fillna(0).astype(float)
-            work[month_col] = dt.dt.month.fillna(1).astype(float)
+            work[dow_col], work[month_col] = _datetime_parts(dt_series[col])
             dt_features.extend([dow_col, month_col])
+            recipe_by_name[dow_col] = ["dt_dow", col, None]
+            recipe_by_name[month_col] = ["dt_month", col, None]
     if fit:
         meta["dt_features"] = dt_features
 
@@ -130,6 +152,7 @@ def prepare_features(
                 ohe_name = f"{col}_{val}"
                 work[ohe_name] = (work[col].fillna("__missing__") == val).astype(float)
                 ohe_cols.append(ohe_name)
+                recipe_by_name[ohe_name] = ["ohe", col, val]
         meta["cat_mappings"] = cat_mappings
         meta["ohe_cols"] = ohe_cols
     else:
@@ -152,6 +175,7 @@ def prepare_features(
 
     if fit:
         meta["feature_names"] = feature_names
+        meta["inference_recipe"] = [recipe_by_name[f] for f in feature_names]
 
     if not feature_names:
         raise ValueError("No usable features found in the dataset.")
@@ -162,3 +186,65 @@ def prepare_features(
     X = np.nan_to_num(X, nan=0.0, posinf=0.0, neginf=0.0)
 
     return X, y, feature_names, meta
+
+
+def _apply_recipe(df: pd.DataFrame, recipe: List[List[Any]]) -> Optional[np.ndarray]:
+    """Build X from a fit-time inference recipe.
+
+    Returns None when a numeric or datetime source column is missing, so the
+    caller falls back to the generic path (which drops the feature). Unlike
+    that path, categorical columns are compared as-is rather than re-classified
+    per batch — a one-row batch whose category happens to parse as a date
+    (e.g. "11-50") keeps its one-hot encoding.
+    """
+    needed = {col for kind, col, _ in recipe if kind != "ohe"}
+    if not needed.issubset(df.columns):
+        return None
+
+    X = np.empty((len(df), len(recipe)), dtype=np.float64)
+    dt_parts: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    cat_values: Dict[str, np.ndarray] = {}
+
+    for j, (kind, col, param) in enumerate(recipe):
+        if kind == "numeric":
+            series = df[col]
+            if not pd.api.types.is_numeric_dtype(series):
+                series = pd.to_numeric(series, errors="raise")
+            vals = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            X[:, j] = np.where(np.isnan(vals), param, vals)
+        elif kind in ("dt_dow", "dt_month"):
+            if col not in dt_parts:
+                dt_parts[col] = _datetime_parts(df[col])
+            X[:, j] = dt_parts[col][0 if kind == "dt_dow" else 1]
+        elif col in df.columns:
+            if col not in cat_values:
+                cat_values[col] = df[col].fillna("__missing__").to_numpy()
+            X[:, j] = cat_values[col] == param
+        else:
+            X[:, j] = 0.0
+
+    return np.nan_to_num(X, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _datetime_parts(dt: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (day_of_week, month) float arrays via datetime64 arithmetic.
+
+    Missing values map to 0 (Monday) and 1 (January), matching the defaults
+    used for imputation elsewhere. Timezone-aware input uses local wall time.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dt):
+        dt = pd.to_datetime(dt, format="mixed", errors="coerce")
+    if isinstance(dt.dtype, pd.DatetimeTZDtype):
+        dt = dt.dt.tz_localize(None)
+
+    values = dt.to_numpy(dtype="datetime64[ns]")
+    missing = np.isnat(values)
+    days = values.astype("datetime64[D]").astype(np.int64)
+    months = values.astype("datetime64[M]").astype(np.int64)
+
+    # 1970-01-01 was a Thursday (dayofweek == 3)
+    dow = ((days + 3) % 7).astype(float)
+    month = (months % 12 + 1).astype(float)
+    dow[missing] = 0.0
+    month[missing] = 1.0
+    return dow, month
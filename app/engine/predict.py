@@ -41,7 +41,9 @@ def load_model(
             f"Expected: {model_path}. Train first."
         )
 
-    model = joblib.load(model_path)
+    # Memory-map the numpy arrays inside the pickle: pages load on demand and
+    # are shared between workers. Estimators only read them at predict time.
+    model = joblib.load(model_path, mmap_mode="r")
 
     feature_meta = {}
     if os.path.exists(meta_path):
@@ -53,11 +55,13 @@ def load_model(
         with open(metadata_path) as f:
             metadata = json.load(f)
 
-    # Load base model (needed for SHAP — TreeExplainer can't wrap CalibratedClassifierCV)
-    base_model = None
+    # Load base model (needed for SHAP — TreeExplainer can't wrap CalibratedClassifierCV).
+    # Prefit-calibrated models carry it inside model.joblib instead.
     base_model_path = os.path.join(artifact_dir, "base_model.joblib")
     if os.path.exists(base_model_path):
-        base_model = joblib.load(base_model_path)
+        base_model = joblib.load(base_model_path, mmap_mode="r")
+    else:
+        base_model = base_model_from_calibrated(model)
 
     # Load SHAP background array
     shap_background = None
@@ -74,6 +78,33 @@ def load_model(
     }
 
 
+def base_model_from_calibrated(model: Any) -> Optional[Any]:
+    """Return the fitted base model wrapped by a prefit-calibrated model.
+
+    train_model's prefit path calibrates ``FrozenEstimator(base_model)`` with
+    a single calibrator, so the base model lives inside model.joblib.
+    CV-calibrated models hold per-fold refits instead; those return None.
+    """
+    from sklearn.frozen import FrozenEstimator
+
+    calibrated = getattr(model, "calibrated_classifiers_", None)
+    if not calibrated or len(calibrated) != 1:
+        return None
+    inner = calibrated[0].estimator
+    return inner.estimator if isinstance(inner, FrozenEstimator) else None
+
+
+def has_base_model(artifact_dir: str) -> bool:
+    """Whether the artifacts in ``artifact_dir`` provide a base model for SHAP."""
+    if os.path.exists(os.path.join(artifact_dir, "base_model.joblib")):
+        return True
+    try:
+        with open(os.path.join(artifact_dir, "metadata.json")) as f:
+            return json.load(f).get("calibration_cv") == "prefit"
+    except (OSError, ValueError):
+        return False
+
+
 def predict(
     df: pd.DataFrame,
     module: ModuleConfig,
@@ -98,19 +129,20 @@ def predict(
         df, module, fit=False, feature_meta=feature_meta,
     )
 
-    # Predict probabilities
-    raw_probs = model.predict_proba(X)[:, 1]
-
-    # Clamp
-    floor = module.calibration.prob_floor
-    ceil = module.calibration.prob_ceil
-    probs = np.clip(raw_probs, floor, ceil)
+    # Predict probabilities (contiguous copy of the positive-class column,
+    # clamped in place)
+    probs = np.ascontiguousarray(model.predict_proba(X)[:, 1])
+    np.clip(probs, module.calibration.prob_floor, module.calibration.prob_ceil, out=probs)
 
     # Build result
     result = df.copy()
     result["probability"] = probs
-    result["tier"] = [module.tiers.classify(p) for p in probs]
-    result["rank"] = result["probability"].rank(ascending=False, method="min").astype(int)
+    # Low-cardinality labels are stored as categoricals (int8 codes)
+    result["tier"] = pd.Categorical.from_codes(
+        module.tiers.classify_codes(probs), categories=module.tiers.labels,
+    )
+    # Descending "min" rank: 1 + number of strictly higher probabilities
+    result["rank"] = len(probs) - np.searchsorted(np.sort(probs), probs, side="right") + 1
 
     # Add value-at-risk if value column exists
     if module.value_column and module.value_column in result.columns:
@@ -230,17 +262,22 @@ def predict(
 def _enrich_churn_predictions(result: pd.DataFrame) -> None:
     """Add churn-specific columns in-place."""
     from app.modules.churn.adapter import (
-        compute_urgency_score, compute_renewal_window_label,
+        RENEWAL_WINDOW_LABELS, compute_urgency_score, compute_renewal_window_codes,
         compute_recommended_action, compute_account_status, compute_action_tier,
     )
 
+    probs = result["probability"].to_numpy()
+
     # churn_risk_pct (0-100, 1 decimal)
-    result["churn_risk_pct"] = (result["probability"] * 100).round(1)
+    pct = np.multiply(probs, 100.0)
+    np.round(pct, 1, out=pct)
+    result["churn_risk_pct"] = pct
 
     # renewal_window_label
     if "days_until_renewal" in result.columns:
-        result["renewal_window_label"] = result["days_until_renewal"].apply(
-            compute_renewal_window_label
+        result["renewal_window_label"] = pd.Categorical.from_codes(
+            compute_renewal_window_codes(result["days_until_renewal"].to_numpy(dtype=float)),
+            categories=RENEWAL_WINDOW_LABELS,
         )
     else:
         result["renewal_window_label"] = "unknown"
@@ -254,7 +291,9 @@ def _enrich_churn_predictions(result: pd.DataFrame) -> None:
 
     # arr_at_risk
     if "arr" in result.columns:
-        result["arr_at_risk"] = (result["arr"] * result["probability"]).round(2)
+        arr_at_risk = np.multiply(result["arr"].to_numpy(dtype=float), probs)
+        np.round(arr_at_risk, 2, out=arr_at_risk)
+        result["arr_at_risk"] = arr_at_risk
 
     # recommended_action — days_since_last_activity is the HubSpot-normalized alias
     if "days_since_last_login" in result.columns:
@@ -295,25 +334,79 @@ def predict_single(
     module: ModuleConfig,
     artifacts: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Score a single row and return prediction dict."""
-    df = pd.DataFrame([row])
-    result = predict(df, module, artifacts)
-    row_result = result.iloc[0]
+    """Score a single row and return prediction dict.
+
+    Skips the batch-only work in predict() — SHAP drivers, ranking and
+    sorting — none of which appear in the single-row output.
+    """
+    if artifacts is None:
+        artifacts = load_model(module)
 
-    output = {
-        "probability": round(float(row_result["probability"]), 4),
-        "tier": row_result["tier"],
-        "rank": int(row_result["rank"]),
+    df = pd.DataFrame([row])
+    X, _, _, _ = prepare_features(
+        df, module, fit=False, feature_meta=artifacts["feature_meta"],
+    )
+    prob = float(np.clip(
+        artifacts["model"].predict_proba(X)[0, 1],
+        module.calibration.prob_floor, module.calibration.prob_ceil,
+    ))
+    values = df.iloc[0]
+
+    output: Dict[str, Any] = {
+        "probability": round(prob, 4),
+        "tier": module.tiers.classify(prob),
+        "rank": 1,
     }
 
-    for col in ["value_at_risk", "churn_risk_pct", "urgency_score",
-                "renewal_window_label", "arr_at_risk", "recommended_action",
-                "account_status"]:
-        if col in result.columns:
-            val = row_result[col]
-            if isinstance(val, (float, np.floating)):
-                output[col] = round(float(val), 2)
-            else:
-                output[col] = val
+    extra: Dict[str, Any] = {}
+    if module.value_column and module.value_column in values.index:
+        extra["value_at_risk"] = values[module.value_column] * prob
+    if module.name == "churn":
+        extra.update(_churn_fields_single(values, prob))
+
+    for col, val in extra.items():
+        if isinstance(val, (float, np.floating)):
+            output[col] = round(float(val), 2)
+        else:
+            output[col] = val
 
     return output
+
+
+def _churn_fields_single(values: pd.Series, prob: float) -> Dict[str, Any]:
+    """Scalar counterpart of _enrich_churn_predictions for one row."""
+    from app.modules.churn.adapter import (
+        compute_urgency_score, compute_renewal_window_label,
+        compute_recommended_action, compute_account_status,
+    )
+
+    fields: Dict[str, Any] = {}
+    pct = float(np.round(prob * 100, 1))
+    fields["churn_risk_pct"] = pct
+
+    if "days_until_renewal" in values.index:
+        dur = values["days_until_renewal"]
+        renewal_label = compute_renewal_window_label(dur)
+    else:
+        dur = 999
+        renewal_label = "unknown"
+    fields["urgency_score"] = compute_urgency_score(prob, dur)
+    fields["renewal_window_label"] = renewal_label
+
+    if "arr" in values.index:
+        fields["arr_at_risk"] = float(np.round(values["arr"] * prob, 2))
+
+    if "days_since_last_login" in values.index:
+        dsll = values["days_since_last_login"]
+    elif "days_since_last_activity" in values.index:
+        dsll = values["days_since_last_activity"]
+    else:
+        dsll = 0
+    fields["recommended_action"] = compute_recommended_action(pct, renewal_label, dsll)
+
+    fields["account_status"] = compute_account_status(
+        values["churned"] if "churned" in values.index else 0,
+        values["renewal_status"] if "renewal_status" in values.index else "active",
+        dur,
+    )
+    return fields
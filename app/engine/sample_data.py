@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -13,99 +14,140 @@ import pandas as pd
 # ---------------------------------------------------------------------------
 # Original generator (kept for backwards compatibility)
 # ---------------------------------------------------------------------------
-def generate_churn_dataset(n: int = 2000, seed: int = 42) -> pd.DataFrame:
-    """Generate a realistic customer churn dataset with renewal fields."""
-    rng = np.random.RandomState(seed)
-    random.seed(seed)
+# Above this many rows generate_churn_dataset fans out to worker processes;
+# below it process start-up costs more than the draws themselves.
+_PARALLEL_GENERATE_MIN_ROWS = 100_000
+# Rows per independently seeded block in the parallel path. Fixed (rather
+# than derived from the worker count) so output never depends on core count.
+_GENERATE_BLOCK_ROWS = 50_000
 
-    plans = ["Enterprise", "Professional", "Starter", "Free Trial"]
-    industries = ["SaaS", "E-commerce", "FinTech", "HealthTech", "EdTech",
-                  "MarTech", "HR Tech", "Logistics", "Media", "Gaming"]
-    sizes = ["1-10", "11-50", "51-200", "201-1000", "1000+"]
-    renewal_statuses = ["active", "active", "active", "active",
-                        "renewed", "in_notice", "cancelled", "unknown"]
 
-    rows = []
-    base_date = datetime(2024, 1, 1)
-
-    for i in range(n):
-        customer_id = f"CUST-{20000 + i}"
-        plan = random.choice(plans)
-        industry = random.choice(industries)
-        size = random.choice(sizes)
-
-        # ARR varies by plan
-        arr_base = {
-            "Enterprise": 120000, "Professional": 36000,
-            "Starter": 9600, "Free Trial": 0,
-        }[plan]
-        arr = max(0, int(rng.normal(arr_base, arr_base * 0.3))) if arr_base > 0 else 0
-
-        seats = max(1, int(rng.exponential({"Enterprise": 50, "Professional": 15,
-                                             "Starter": 5, "Free Trial": 2}[plan])))
-        monthly_logins = max(0, int(rng.poisson(seats * 8)))
-        support_tickets = max(0, int(rng.poisson(2)))
-        nps_score = int(np.clip(rng.normal(7, 2), 0, 10))
-        days_since_last_login = max(0, int(rng.exponential(15)))
-        contract_months = max(0, int(rng.uniform(0, 24)))
-
-        # Renewal fields
-        days_until_renewal = max(-30, int(rng.normal(contract_months * 30, 60)))
-        auto_renew = int(rng.random() < (0.7 if plan in ["Enterprise", "Professional"] else 0.3))
-        renewal_status = random.choice(renewal_statuses)
-        # Override renewal_status for consistency
-        if days_until_renewal < 0:
-            renewal_status = random.choice(["renewed", "cancelled", "active"])
-        elif days_until_renewal <= 30:
-            renewal_status = random.choice(["active", "in_notice", "active"])
-
-        snapshot_date = base_date + timedelta(days=int(rng.uniform(0, 540)))
-
-        # Churn probability depends on features
-        logit = -1.5  # base churn rate ~18%
-        logit -= 0.02 * monthly_logins / max(seats, 1)
-        logit += 0.15 * support_tickets
-        logit -= 0.05 * nps_score
-        logit += 0.02 * days_since_last_login
-        logit -= 0.08 * contract_months
-        logit += {"Free Trial": 1.2, "Starter": 0.3,
-                  "Professional": -0.2, "Enterprise": -0.6}[plan]
-        # Renewal risk factors
-        if days_until_renewal <= 30 and not auto_renew:
-            logit += 0.6
-        elif days_until_renewal <= 90 and not auto_renew:
-            logit += 0.3
-        if renewal_status == "in_notice":
-            logit += 0.8
-        elif renewal_status == "cancelled":
-            logit += 2.0
-        # Noise
-        logit += rng.normal(0, 0.4)
-
-        prob = 1 / (1 + np.exp(-logit))
-        churned = int(rng.random() < prob)
-
-        rows.append({
-            "customer_id": customer_id,
-            "snapshot_date": snapshot_date.strftime("%Y-%m-%d"),
-            "churned": churned,
-            "arr": arr,
-            "plan": plan,
-            "seats": seats,
-            "monthly_logins": monthly_logins,
-            "support_tickets": support_tickets,
-            "nps_score": nps_score,
-            "days_since_last_login": days_since_last_login,
-            "contract_months_remaining": contract_months,
-            "industry": industry,
-            "company_size": size,
-            "days_until_renewal": days_until_renewal,
-            "auto_renew_flag": auto_renew,
-            "renewal_status": renewal_status,
-        })
+def generate_churn_dataset(
+    n: int = 2000, seed: int = 42, n_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """Generate a realistic customer churn dataset with renewal fields.
+
+    Every column is drawn for all ``n`` rows at once, so the cost is a
+    handful of NumPy calls rather than a Python loop per customer. From
+    ``_PARALLEL_GENERATE_MIN_ROWS`` rows up, the rows are split into fixed
+    blocks with seeds spawned from ``seed`` and drawn on a process pool of
+    ``n_workers`` (default: CPU count); with a single worker the blocks are
+    drawn in-process. The result is the same for any worker count.
+    """
+    if n < _PARALLEL_GENERATE_MIN_ROWS:
+        return _churn_rows(n, seed, 0)
+
+    starts = list(range(0, n, _GENERATE_BLOCK_ROWS))
+    sizes = [min(_GENERATE_BLOCK_ROWS, n - start) for start in starts]
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    workers = min(n_workers or os.cpu_count() or 1, len(starts))
+    if workers <= 1:
+        blocks = list(map(_churn_rows, sizes, seeds, starts))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(_churn_rows, sizes, seeds, starts))
+    return pd.concat(blocks, ignore_index=True)
+
+
+def _churn_rows(n: int, seed: Any, id_start: int) -> pd.DataFrame:
+    """Draw ``n`` churn rows from ``default_rng(seed)``.
+
+    ``seed`` is an int or a ``SeedSequence``; customer ids start at
+    ``CUST-{20000 + id_start}``.
+    """
+    rng = np.random.default_rng(seed)
+
+    plans = np.array(["Enterprise", "Professional", "Starter", "Free Trial"])
+    industries = np.array(["SaaS", "E-commerce", "FinTech", "HealthTech", "EdTech",
+                           "MarTech", "HR Tech", "Logistics", "Media", "Gaming"])
+    sizes = np.array(["1-10", "11-50", "51-200", "201-1000", "1000+"])
+    # Renewal statuses are carried as integer codes into this vocabulary and
+    # only turned into strings for the output frame.
+    status_labels = np.array(["active", "renewed", "in_notice", "cancelled", "unknown"])
+    status_logit = np.array([0.0, 0.0, 0.8, 2.0, 0.0])
+    renewal_statuses = np.array([0, 0, 0, 0, 1, 2, 3, 4])  # weighted toward active
+
+    # Per-plan parameters, indexed by plan code (same order as ``plans``)
+    plan_arr_base = np.array([120000, 36000, 9600, 0])
+    plan_seat_scale = np.array([50, 15, 5, 2])
+    plan_logit = np.array([-0.6, -0.2, 0.3, 1.2])
+    plan_auto_renew = np.array([0.7, 0.7, 0.3, 0.3])
+
+    plan_code = rng.integers(0, len(plans), size=n)
+    industry = industries[rng.integers(0, len(industries), size=n)]
+    size = sizes[rng.integers(0, len(sizes), size=n)]
+
+    # ARR varies by plan (Free Trial has a zero base, so it stays at 0)
+    arr_base = plan_arr_base[plan_code]
+    arr = np.maximum(0, rng.normal(arr_base, arr_base * 0.3).astype(int))
+
+    seats = np.maximum(1, rng.exponential(plan_seat_scale[plan_code]).astype(int))
+    monthly_logins = rng.poisson(seats * 8)
+    support_tickets = rng.poisson(2, size=n)
+    nps_score = np.clip(rng.normal(7, 2, size=n), 0, 10).astype(int)
+    days_since_last_login = rng.exponential(15, size=n).astype(int)
+    contract_months = rng.uniform(0, 24, size=n).astype(int)
+
+    # Renewal fields
+    days_until_renewal = np.maximum(-30, rng.normal(contract_months * 30, 60).astype(int))
+    auto_renew = (rng.random(n) < plan_auto_renew[plan_code]).astype(int)
+    # Renewal status, overridden for consistency with the renewal date
+    renewal_status = renewal_statuses[rng.integers(0, len(renewal_statuses), size=n)]
+    lapsed_status = np.array([1, 3, 0])[rng.integers(0, 3, size=n)]  # renewed/cancelled/active
+    notice_status = np.array([0, 2, 0])[rng.integers(0, 3, size=n)]  # active/in_notice/active
+    renewal_status = np.where(
+        days_until_renewal < 0, lapsed_status,
+        np.where(days_until_renewal <= 30, notice_status, renewal_status),
+    )
 
-    df = pd.DataFrame(rows)
-    return df
+    # Snapshot dates: base epoch plus whole days, formatted in one pass
+    snapshot_offsets = rng.integers(0, 540, size=n)
+    snapshot_date = (
+        np.datetime64("2024-01-01") + snapshot_offsets.astype("timedelta64[D]")
+    ).astype(str).astype(object)
+
+    # Churn probability depends on features
+    logit = np.full(n, -1.5)  # base churn rate ~18%
+    logit -= 0.02 * monthly_logins / seats
+    logit += 0.15 * support_tickets
+    logit -= 0.05 * nps_score
+    logit += 0.02 * days_since_last_login
+    logit -= 0.08 * contract_months
+    logit += plan_logit[plan_code]
+    # Renewal risk factors
+    no_auto_renew = auto_renew == 0
+    logit += np.where(
+        no_auto_renew & (days_until_renewal <= 30), 0.6,
+        np.where(no_auto_renew & (days_until_renewal <= 90), 0.3, 0.0),
+    )
+    logit += status_logit[renewal_status]
+    # Noise
+    logit += rng.normal(0, 0.4, size=n)
+
+    prob = 1 / (1 + np.exp(-logit))
+    churned = rng.random(n) < prob
+
+    # Pre-typed columns go straight into pandas blocks without per-row
+    # inference. String columns stay object dtype (not Categorical) so
+    # prepare_features can fillna("__missing__") on them.
+    return pd.DataFrame({
+        "customer_id": np.char.add("CUST-", (20000 + id_start + np.arange(n)).astype(str)).astype(object),
+        "snapshot_date": snapshot_date,
+        "churned": churned.astype(np.int8),
+        "arr": arr.astype(np.int32),
+        "plan": plans[plan_code].astype(object),
+        "seats": seats.astype(np.int32),
+        "monthly_logins": monthly_logins.astype(np.int32),
+        "support_tickets": support_tickets.astype(np.int16),
+        "nps_score": nps_score.astype(np.int8),
+        "days_since_last_login": days_since_last_login.astype(np.int32),
+        "contract_months_remaining": contract_months.astype(np.int8),
+        "industry": industry.astype(object),
+        "company_size": size.astype(object),
+        "days_until_renewal": days_until_renewal.astype(np.int32),
+        "auto_renew_flag": auto_renew.astype(np.int8),
+        "renewal_status": status_labels[renewal_status].astype(object),
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -290,6 +332,9 @@ def _generate_demo_accounts(
         "Starter": int(9600 * arr_multiplier),
         "Free Trial": 0,
     }
+    seat_scale_map = {"Enterprise": 50, "Professional": 15, "Starter": 5, "Free Trial": 2}
+    plan_logit_map = {"Free Trial": 1.2, "Starter": 0.3,
+                      "Professional": -0.2, "Enterprise": -0.6}
 
     base_date = datetime(2024, 1, 1)
     rows: List[Dict[str, Any]] = []
@@ -306,9 +351,7 @@ def _generate_demo_accounts(
         # Latent "account health" factor — drives correlated signals
         health = rng.normal(0, 1)  # positive = healthy, negative = distressed
 
-        seats = max(1, int(rng.exponential(
-            {"Enterprise": 50, "Professional": 15, "Starter": 5, "Free Trial": 2}[plan]
-        )))
+        seats = max(1, int(rng.exponential(seat_scale_map[plan])))
         # Logins influenced by health
         login_rate = max(1, seats * 8 + health * seats * 2)
         monthly_logins = max(0, int(rng.poisson(login_rate)))
@@ -354,8 +397,7 @@ def _generate_demo_accounts(
         logit -= 0.05 * nps_score
         logit += 0.02 * days_since_last_login
         logit -= 0.08 * contract_months
-        logit += {"Free Trial": 1.2, "Starter": 0.3,
-                  "Professional": -0.2, "Enterprise": -0.6}[plan]
+        logit += plan_logit_map[plan]
         if days_until_renewal <= 30 and not auto_renew:
             logit += 0.6
         elif days_until_renewal <= 90 and not auto_renew:
@@ -483,13 +525,24 @@ def save_sample_datasets(output_dir: str = "data/sample") -> dict:
 
     churn_df = generate_churn_dataset()
     churn_path = os.path.join(output_dir, "churn_customers.csv")
-    churn_df.to_csv(churn_path, index=False)
+    _write_csv(churn_df, churn_path)
 
     return {
         "churn": {"path": churn_path, "rows": len(churn_df)},
     }
 
 
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write ``df`` as CSV, via Arrow's C++ writer when pyarrow is installed."""
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False, chunksize=50_000)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
 DEMO_GENERATORS = {
     "balanced": generate_balanced_demo,
     "high_risk": generate_high_risk_demo,
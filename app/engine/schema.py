@@ -32,7 +32,28 @@ class ValidationResult:
     label_distribution: Dict[str, int] = field(default_factory=dict)
 
 
-def _infer_dtype(series: pd.Series) -> str:
+# ISO-style dates (YYYY-MM-DD, optionally followed by a naive time) are by far
+# the most common upload format; they are checked with a fixed-format parse
+# instead of format="mixed" guessing. The regex only gates that fast path.
+_ISO_DATE_RE = r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?"
+
+
+def _n_unique(series: pd.Series) -> int:
+    """Distinct non-null values, as ``series.nunique()``, from one hash pass."""
+    uniques = pd.unique(series)
+    return len(uniques) - int(pd.isna(uniques).sum())
+
+
+def _infer_dtype(
+    series: pd.Series,
+    non_null: Optional[pd.Series] = None,
+    n_unique: Optional[int] = None,
+) -> str:
+    """Classify a column for the schema report.
+
+    ``non_null`` (``series.dropna()``) and ``n_unique`` (``series.nunique()``)
+    may be passed in when the caller already has them, to skip rescanning.
+    """
     if pd.api.types.is_bool_dtype(series):
         return "boolean"
     if pd.api.types.is_numeric_dtype(series):
@@ -40,12 +61,19 @@ def _infer_dtype(series: pd.Series) -> str:
     if pd.api.types.is_datetime64_any_dtype(series):
         return "datetime"
     # Try parsing as date
-    try:
-        pd.to_datetime(series.dropna().head(20), format="mixed")
+    if non_null is None:
+        non_null = series.dropna()
+    sample = non_null.head(20)
+    as_str = sample.astype(str)
+    if (
+        as_str.str.fullmatch(_ISO_DATE_RE).all()
+        and pd.to_datetime(as_str, format="ISO8601", errors="coerce").notna().all()
+    ):
+        return "datetime"
+    if pd.to_datetime(sample, format="mixed", errors="coerce").notna().all():
         return "datetime"
-    except (ValueError, TypeError):
-        pass
-    n_unique = series.nunique()
+    if n_unique is None:
+        n_unique = _n_unique(series)
     if n_unique <= 50 or n_unique / len(series) < 0.05:
         return "categorical"
     return "unknown"
@@ -64,17 +92,20 @@ def validate_dataset(df: pd.DataFrame, module: ModuleConfig) -> ValidationResult
             result.errors.append(f"Missing required column: '{col}'")
             result.valid = False
 
-    # Column info
-    for col_name in df.columns:
+    # Column info — missing counts for every column in one frame-level
+    # aggregate, then per-column assembly.
+    na_counts = df.isna().sum()
+    for col_name, missing in zip(df.columns, na_counts.tolist()):
         series = df[col_name]
-        missing = int(series.isna().sum())
+        non_null = series.dropna() if missing else series
+        n_unique = _n_unique(series)
         info = ColumnInfo(
             name=col_name,
-            dtype=_infer_dtype(series),
+            dtype=_infer_dtype(series, non_null, n_unique),
             missing_count=missing,
             missing_pct=round(missing / len(df) * 100, 1) if len(df) > 0 else 0.0,
-            n_unique=int(series.nunique()),
-            sample_values=series.dropna().head(3).tolist(),
+            n_unique=n_unique,
+            sample_values=non_null.head(3).tolist(),
         )
         result.columns.append(info)
 
@@ -101,9 +132,8 @@ def validate_dataset(df: pd.DataFrame, module: ModuleConfig) -> ValidationResult
 
     # Timestamp check
     if module.timestamp_column in df.columns:
-        try:
-            pd.to_datetime(df[module.timestamp_column].dropna().head(20), format="mixed")
-        except (ValueError, TypeError):
+        ts_sample = df[module.timestamp_column].dropna().head(20)
+        if not pd.to_datetime(ts_sample, format="mixed", errors="coerce").notna().all():
             result.warnings.append(
                 f"Timestamp column '{module.timestamp_column}' may not be parseable as dates."
             )
@@ -3,14 +3,16 @@ from __future__ import annotations
 
 import json
 import os
+import pickle
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-import joblib
 import numpy as np
 import pandas as pd
 
+from ..io_utils import dump_joblib_atomic, dump_json
 from .config import ModuleConfig, get_module
+from .evaluate import _chunk_stats, _compute_lift_table
 from .features import prepare_features
 
 
@@ -23,6 +25,7 @@ def train_model(
     run_id: str | None = None,
     version_str: str | None = None,
     min_rows: int = 50,
+    save_base_model: bool = False,
 ) -> Dict[str, Any]:
     """Train a binary classifier for the given module.
 
@@ -31,6 +34,9 @@ def train_model(
         module: Module configuration.
         val_frac: Fraction for time-based validation holdout.
         model_type: "logistic", "gradient_boosting", or "auto" (picks based on data size).
+        save_base_model: Always write base_model.joblib. By default it is only
+            written for CV-calibrated models; a prefit-calibrated model.joblib
+            already contains the fitted base model (see predict.load_model).
 
     Returns:
         Report dict with metrics and artifact paths.
@@ -38,6 +44,7 @@ def train_model(
     from sklearn.calibration import CalibratedClassifierCV
     from sklearn.linear_model import LogisticRegression
     from sklearn.ensemble import HistGradientBoostingClassifier
+    from sklearn.frozen import FrozenEstimator
     from sklearn.pipeline import Pipeline
     from sklearn.preprocessing import StandardScaler
     from sklearn.metrics import (
@@ -53,10 +60,13 @@ def train_model(
     training_warnings: list[str] = []
     if ts_col in df.columns:
         split_strategy = "time_based"
-        df = df.copy()
-        df["_ts_parsed"] = pd.to_datetime(df[ts_col], errors="coerce")
-        df = df.sort_values("_ts_parsed").reset_index(drop=True)
-        df = df.drop(columns=["_ts_parsed"])
+        # Sort positions from the parsed timestamps alone, then gather the
+        # frame once — no helper column, copy or drop on the full frame.
+        # Rows are reordered before prepare_features (not X/y after it) so
+        # fit-time category ranking sees the same row order as before.
+        ts_parsed = pd.to_datetime(df[ts_col], errors="coerce").reset_index(drop=True)
+        df = df.take(ts_parsed.sort_values().index.to_numpy())
+        df.index = pd.RangeIndex(len(df))
     else:
         split_strategy = "random"
         msg = (
@@ -75,6 +85,10 @@ def train_model(
 
     # Build features
     X, y, feature_names, feature_meta = prepare_features(df, module, fit=True)
+    # Labels are 0/1, so int8 is enough. X stays float64: both estimators
+    # validate to float64 internally, so a float32 X would be re-copied on
+    # every fit and scoring call.
+    y = y.astype(np.int8, copy=False)
     print(f"[train] Features: {len(feature_names)} columns")
     print(f"[train] Label distribution: {dict(zip(*np.unique(y, return_counts=True)))}")
 
@@ -106,9 +120,24 @@ def train_model(
         model_type = "gradient_boosting" if n >= 500 else "logistic"
     print(f"[train] Model type: {model_type}")
 
-    # Compute sample weights for class imbalance
-    from sklearn.utils.class_weight import compute_sample_weight
-    sample_weights = compute_sample_weight("balanced", y_train)
+    # Class imbalance is handled by class_weight="balanced" on both models,
+    # which CalibratedClassifierCV re-applies per fold.
+
+    # Calibration strategy — with enough rows, the base model is fit once on
+    # the earlier part of the training window and calibrated on its most
+    # recent slice; otherwise CV calibration refits it per fold.
+    cal_cfg = module.calibration
+    n_cal = int(len(y_train) * cal_cfg.prefit_holdout_frac)
+    prefit_calibration = (
+        len(y_train) >= cal_cfg.prefit_min_train
+        and n_cal > 0
+        and len(np.unique(y_train[:-n_cal])) == 2
+        and len(np.unique(y_train[-n_cal:])) == 2
+    )
+    if prefit_calibration:
+        X_fit, y_fit = X_train[:-n_cal], y_train[:-n_cal]
+    else:
+        X_fit, y_fit = X_train, y_train
 
     if model_type == "gradient_boosting":
         base_model = HistGradientBoostingClassifier(
@@ -119,7 +148,7 @@ def train_model(
             random_state=42,
             class_weight="balanced",
         )
-        base_model.fit(X_train, y_train)
+        base_model.fit(X_fit, y_fit)
     else:
         base_model = Pipeline([
             ("scaler", StandardScaler()),
@@ -129,7 +158,7 @@ def train_model(
                 class_weight="balanced",
             )),
         ])
-        base_model.fit(X_train, y_train)
+        base_model.fit(X_fit, y_fit)
 
     # SHAP background — sample X_train for per-account driver extraction at predict time.
     # Store before calibration wrapper so the base model can be used with TreeExplainer.
@@ -141,7 +170,7 @@ def train_model(
     # Feature stats — mean/std/null-rate from training data for model insights
     feature_stats: Dict[str, Any] = {}
     for i, fname in enumerate(feature_names):
-        col = X_train[:, i].astype(float)
+        col = X_train[:, i]
         finite = col[np.isfinite(col)]
         feature_stats[fname] = {
             "mean": round(float(np.mean(finite)), 4) if len(finite) > 0 else 0.0,
@@ -153,7 +182,7 @@ def train_model(
     # Requires at least 5 samples in each class per feature to be meaningful.
     feature_stats_by_outcome: Dict[str, Any] = {}
     for i, fname in enumerate(feature_names):
-        col = X_train[:, i].astype(float)
+        col = X_train[:, i]
         finite_mask = np.isfinite(col)
         retained_mask = (y_train == 0) & finite_mask
         churned_mask = (y_train == 1) & finite_mask
@@ -171,14 +200,27 @@ def train_model(
                 "n_churned": int(len(c_vals)),
             }
 
-    # Calibrate with Platt scaling (sigmoid) via cross-validation
-    print(f"[train] Calibrating with CalibratedClassifierCV (sigmoid, cv={module.calibration.cv_folds})")
-    calibrated_model = CalibratedClassifierCV(
-        estimator=base_model,
-        method=module.calibration.method,
-        cv=module.calibration.cv_folds,
-    )
-    calibrated_model.fit(X_train, y_train)
+    if prefit_calibration:
+        # Calibrate the fitted base model on the held-out slice. ensemble=False
+        # keeps a single calibrated classifier, so inference calls the base
+        # model once rather than once per fold.
+        print(f"[train] Calibrating with CalibratedClassifierCV "
+              f"({cal_cfg.method}, prefit, holdout={n_cal})")
+        calibrated_model = CalibratedClassifierCV(
+            estimator=FrozenEstimator(base_model),
+            method=cal_cfg.method,
+            ensemble=False,
+        )
+        calibrated_model.fit(X_train[-n_cal:], y_train[-n_cal:])
+    else:
+        # Calibrate with Platt scaling (sigmoid) via cross-validation
+        print(f"[train] Calibrating with CalibratedClassifierCV ({cal_cfg.method}, cv={cal_cfg.cv_folds})")
+        calibrated_model = CalibratedClassifierCV(
+            estimator=base_model,
+            method=cal_cfg.method,
+            cv=cal_cfg.cv_folds,
+        )
+        calibrated_model.fit(X_train, y_train)
 
     # Clamp helper
     floor, ceil = module.calibration.prob_floor, module.calibration.prob_ceil
@@ -209,12 +251,19 @@ def train_model(
     artifact_dir = module.get_artifact_dir(tenant_id, run_id=run_id)
     os.makedirs(artifact_dir, exist_ok=True)
 
+    # Artifacts stay uncompressed: predict/scoring load them with
+    # mmap_mode="r", and joblib cannot memory-map a compressed pickle. See
+    # io_utils.write_atomic for why they are swapped in rather than rewritten.
     model_path = os.path.join(artifact_dir, "model.joblib")
-    joblib.dump(calibrated_model, model_path)
+    dump_joblib_atomic(calibrated_model, model_path, protocol=pickle.HIGHEST_PROTOCOL)
     print(f"\n[train] Saved model -> {model_path}")
 
-    base_model_path = os.path.join(artifact_dir, "base_model.joblib")
-    joblib.dump(base_model, base_model_path)
+    # CV calibration keeps only per-fold refits, so the full-data base model
+    # (used for SHAP) needs its own file. The prefit wrapper holds it already.
+    base_model_path: Optional[str] = None
+    if save_base_model or not prefit_calibration:
+        base_model_path = os.path.join(artifact_dir, "base_model.joblib")
+        dump_joblib_atomic(base_model, base_model_path, protocol=pickle.HIGHEST_PROTOCOL)
 
     shap_bg_path = os.path.join(artifact_dir, "shap_background.npy")
     np.save(shap_bg_path, X_background)
@@ -240,10 +289,7 @@ def train_model(
         print(f"[train] SHAP direction computation skipped: {_exc}")
 
     feature_meta_path = os.path.join(artifact_dir, "feature_meta.json")
-    # Convert numpy types for JSON serialization
-    serializable_meta = _make_serializable(feature_meta)
-    with open(feature_meta_path, "w") as f:
-        json.dump(serializable_meta, f, indent=2)
+    dump_json(feature_meta, feature_meta_path)
 
     # Model versioning — use caller-supplied version_str when available (preferred
     # path post-PR-3A: console_api derives this from model_runs history before
@@ -277,6 +323,7 @@ def train_model(
         "n_train": len(y_train),
         "n_val": len(y_val),
         "calibration_method": module.calibration.method,
+        "calibration_cv": "prefit" if prefit_calibration else cal_cfg.cv_folds,
         "prob_range": [floor, ceil],
         "train_metrics": train_metrics,
         "val_metrics": val_metrics,
@@ -293,8 +340,7 @@ def train_model(
     }
 
     meta_path = os.path.join(artifact_dir, "metadata.json")
-    with open(meta_path, "w") as f:
-        json.dump(metadata, f, indent=2, default=str)
+    dump_json(metadata, meta_path)
     print(f"[train] Saved metadata -> {meta_path}")
 
     print(f"\n{'=' * 60}")
@@ -335,26 +381,30 @@ def _compute_metrics(probs: np.ndarray, y: np.ndarray, label: str = "") -> Dict[
     metrics["brier"] = round(float(brier_score_loss(y, probs)), 5)
     metrics["logloss"] = round(float(log_loss(y, probs_clipped)), 5)
 
+    # One descending sort shared by the calibration bins and the lift table
+    desc_order = np.argsort(-probs, kind="stable")
+    # The binned tables are rounded to 4 places, so their gathers run over
+    # narrow copies (sums still accumulate in float64/int64); the sklearn
+    # metrics above keep full precision.
+    probs32 = np.ascontiguousarray(probs, dtype=np.float32)
+    y8 = y.astype(np.int8, copy=False)
+
     # Calibration bins
     n_bins = min(10, max(2, n // 50))
-    sorted_idx = np.argsort(probs)
     chunk = max(1, n // n_bins)
-    cal_bins = []
-    for i in range(0, n, chunk):
-        sl = sorted_idx[i:i + chunk]
-        if len(sl) == 0:
-            continue
-        cal_bins.append({
-            "bin_lo": round(float(probs[sl].min()), 4),
-            "bin_hi": round(float(probs[sl].max()), 4),
-            "n": int(len(sl)),
-            "predicted_avg": round(float(probs[sl].mean()), 4),
-            "actual_rate": round(float(y[sl].mean()), 4),
-        })
-    metrics["calibration_bins"] = cal_bins
+    counts, bin_lo, bin_hi, prob_sums, pos_counts = _chunk_stats(
+        probs32, y8, desc_order[::-1], chunk,
+    )
+    metrics["calibration_bins"] = pd.DataFrame({
+        "bin_lo": bin_lo,
+        "bin_hi": bin_hi,
+        "n": counts,
+        "predicted_avg": prob_sums / counts,
+        "actual_rate": pos_counts / counts,
+    }).round(4).to_dict("records")
 
     # Lift by decile
-    decile_table = _compute_lift_table(probs, y)
+    decile_table = _compute_lift_table(probs32, y8, desc_order)
     metrics["lift_table"] = decile_table
 
     # Confusion matrix at 0.5 threshold
@@ -369,38 +419,6 @@ def _compute_metrics(probs: np.ndarray, y: np.ndarray, label: str = "") -> Dict[
     return metrics
 
 
-def _compute_lift_table(probs: np.ndarray, y: np.ndarray) -> List[Dict[str, Any]]:
-    """Compute lift/decile table."""
-    n = len(y)
-    n_deciles = min(10, max(2, n // 20))
-    sorted_idx = np.argsort(-probs)  # descending
-    chunk = max(1, n // n_deciles)
-    base_rate = float(y.mean())
-    table = []
-    cumulative_positives = 0
-    total_positives = int(y.sum())
-
-    for i in range(0, n, chunk):
-        sl = sorted_idx[i:i + chunk]
-        if len(sl) == 0:
-            continue
-        decile = len(table) + 1
-        actual_rate = float(y[sl].mean())
-        cumulative_positives += int(y[sl].sum())
-        capture_rate = cumulative_positives / total_positives if total_positives > 0 else 0.0
-        lift = actual_rate / base_rate if base_rate > 0 else 0.0
-        table.append({
-            "decile": decile,
-            "n": int(len(sl)),
-            "avg_prob": round(float(probs[sl].mean()), 4),
-            "actual_rate": round(actual_rate, 4),
-            "lift": round(lift, 2),
-            "cumulative_capture": round(capture_rate, 4),
-        })
-
-    return table
-
-
 def _extract_importance(
     model: Any, feature_names: List[str], model_type: str,
     X_train: Optional[np.ndarray] = None, y_train: Optional[np.ndarray] = None,
@@ -446,41 +464,60 @@ def _extract_importance(
 def _permutation_importance(
     model: Any, X: np.ndarray, y: np.ndarray, feature_names: List[str],
 ) -> List[Dict[str, Any]]:
-    """Compute permutation importance as a fallback."""
-    from sklearn.metrics import roc_auc_score
+    """Compute permutation importance as a fallback.
+
+    Importance is the ROC-AUC drop from one shuffle of each feature (the
+    shuffle ``permutation_importance(random_state=42)`` would draw). With
+    several cores each feature is scored as its own joblib task on a copy of
+    ``X``; on a single core one column of ``X`` is shuffled in place, scored
+    and restored, avoiding a full copy per feature. Either way a feature whose
+    scoring fails gets 0.0, and only a failed base score zeroes every feature.
+    """
+    from joblib import Parallel, delayed, effective_n_jobs
+    from sklearn.metrics import get_scorer
 
+    scorer = get_scorer("roc_auc")
     try:
-        base_probs = model.predict_proba(X)[:, 1]
-        base_auc = roc_auc_score(y, base_probs)
+        base_score = scorer(model, X, y)
     except Exception:
         return [{"feature": n, "importance": 0.0} for n in feature_names]
 
-    importance = []
-    rng = np.random.RandomState(42)
-    for i, name in enumerate(feature_names):
-        X_perm = X.copy()
-        X_perm[:, i] = rng.permutation(X_perm[:, i])
-        try:
-            perm_probs = model.predict_proba(X_perm)[:, 1]
-            perm_auc = roc_auc_score(y, perm_probs)
-            drop = base_auc - perm_auc
-        except Exception:
-            drop = 0.0
-        importance.append({"feature": name, "importance": round(float(drop), 5)})
-
-    return importance
+    shuffle_seed = np.random.RandomState(42).randint(np.iinfo(np.int32).max + 1)
+    shuffle_idx = np.arange(X.shape[0])
+    np.random.RandomState(shuffle_seed).shuffle(shuffle_idx)
 
+    if effective_n_jobs(-1) > 1:
+        drops = Parallel(n_jobs=-1)(
+            delayed(_permuted_score_drop)(model, X, y, i, shuffle_idx, scorer, base_score)
+            for i in range(X.shape[1])
+        )
+    else:
+        drops = []
+        for i in range(X.shape[1]):
+            col = X[:, i].copy()
+            X[:, i] = col[shuffle_idx]
+            try:
+                drops.append(base_score - scorer(model, X, y))
+            except Exception:
+                drops.append(0.0)
+            finally:
+                X[:, i] = col
+
+    return [
+        {"feature": name, "importance": round(float(drop), 5)}
+        for name, drop in zip(feature_names, drops)
+    ]
+
+
+def _permuted_score_drop(
+    model: Any, X: np.ndarray, y: np.ndarray, i: int,
+    shuffle_idx: np.ndarray, scorer: Any, base_score: float,
+) -> float:
+    """Score drop with column ``i`` of a copy of ``X`` shuffled; 0.0 if scoring fails."""
+    X_perm = X.copy()
+    X_perm[:, i] = X[shuffle_idx, i]
+    try:
+        return base_score - scorer(model, X_perm, y)
+    except Exception:
+        return 0.0
 
-def _make_serializable(obj: Any) -> Any:
-    """Convert numpy types for JSON serialization."""
-    if isinstance(obj, dict):
-        return {k: _make_serializable(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_make_serializable(v) for v in obj]
-    if isinstance(obj, (np.integer,)):
-        return int(obj)
-    if isinstance(obj, (np.floating,)):
-        return float(obj)
-    if isinstance(obj, np.ndarray):
-        return obj.tolist()
-    return obj
@@ -19,14 +19,22 @@ Required env vars:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import math
 import os
 import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+from app.io_utils import json_bytes, write_atomic
 
 # ---------------------------------------------------------------------------
 # ENV + Supabase helpers (mirrors app/backtest pattern)
@@ -54,7 +62,9 @@ def _get_sb_config() -> Tuple[str, str]:
     return _supabase_url, _supabase_key  # type: ignore[return-value]
 
 
+@functools.lru_cache(maxsize=None)
 def _headers() -> Dict[str, str]:
+    """Request headers, built once per process (callers must not mutate)."""
     _, key = _get_sb_config()
     return {
         "Authorization": f"Bearer {key}",
@@ -63,23 +73,50 @@ def _headers() -> Dict[str, str]:
     }
 
 
-def _sb_get(path: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body, via orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(content)
+    return orjson.loads(content)
+
+
+# One keep-alive session for every Supabase call, so pages after the first
+# skip the TCP+TLS handshake. The pool holds every parallel page fetch below
+# (_SB_FETCH_WORKERS plus the caller's thread) with room to spare.
+_SB_FETCH_WORKERS = 8
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+def _sb_request(
+    path: str, params: Dict[str, str], extra_headers: Optional[Dict[str, str]] = None,
+) -> Tuple[List[Dict[str, Any]], requests.Response]:
     base_url, _ = _get_sb_config()
     url = f"{base_url.rstrip('/')}{path}"
-    r = requests.get(url, headers=_headers(), params=params, timeout=60)
-    if not r.ok:
-        raise RuntimeError(f"Supabase GET {r.status_code}: {r.text[:300]}")
-    data = r.json()
+    headers = {**_headers(), **extra_headers} if extra_headers else _headers()
+    with _SESSION.get(url, headers=headers, params=params, timeout=60, stream=True) as r:
+        if not r.ok:
+            raise RuntimeError(f"Supabase GET {r.status_code}: {r.text[:300]}")
+        # One read of the decompressed body straight into the parser;
+        # r.content would first collect 10 KB chunks and join them.
+        data = _loads(r.raw.read(decode_content=True))
     if not isinstance(data, list):
         raise RuntimeError(f"Unexpected Supabase response: {str(data)[:300]}")
-    return data
+    return data, r
+
+
+def _sb_get(path: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+    return _sb_request(path, params)[0]
 
 
-def _sb_get_all(path: str, params: Dict[str, str], limit: int = 50_000) -> List[Dict[str, Any]]:
+def _sb_get_all(
+    path: str, params: Dict[str, str], limit: int = 50_000, offset: int = 0,
+) -> List[Dict[str, Any]]:
     """Paginated fetch."""
     out: List[Dict[str, Any]] = []
     page_size = 1000
-    offset = 0
     while len(out) < limit:
         take = min(page_size, limit - len(out))
         batch = _sb_get(path, {**params, "limit": str(take), "offset": str(offset)})
@@ -90,6 +127,102 @@ def _sb_get_all(path: str, params: Dict[str, str], limit: int = 50_000) -> List[
     return out
 
 
+def _content_range_total(header: Optional[str]) -> Optional[int]:
+    """Total row count from a PostgREST ``Content-Range: 0-999/12345`` header."""
+    if not header or "/" not in header:
+        return None
+    total = header.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+def _sb_get_all_parallel(
+    path: str, params: Dict[str, str], limit: int = 50_000,
+) -> List[Dict[str, Any]]:
+    """Paginated fetch that requests every page after the first concurrently."""
+    return _sb_get_all_many(path, [params], limit)[0]
+
+
+def _sb_get_all_many(
+    path: str, params_list: List[Dict[str, str]], limit: int = 50_000,
+) -> List[List[Dict[str, Any]]]:
+    """Paginated fetch of several queries, with every page on one flat thread pool.
+
+    Each query's first page asks for ``Prefer: count=exact`` so the response
+    carries the total row count; its remaining offsets are then known up front
+    and go onto the same pool. Pages are concatenated in offset order, so each
+    result matches ``_sb_get_all``; a query with no count falls back to serial
+    paging. At most ``_SB_FETCH_WORKERS`` requests are in flight (plus one
+    serial fallback), within the session's connection pool.
+    """
+    page_size = 1000
+    first = min(page_size, limit)
+    with ThreadPoolExecutor(max_workers=_SB_FETCH_WORKERS) as pool:
+        heads = [
+            pool.submit(
+                _sb_request, path, {**params, "limit": str(first), "offset": "0"},
+                {"Prefer": "count=exact"},
+            )
+            for params in params_list
+        ]
+
+        results: List[List[Dict[str, Any]]] = []
+        tails: List[Optional[list]] = []
+        for params, head in zip(params_list, heads):
+            rows, r = head.result()
+            results.append(rows)
+            total = _content_range_total(r.headers.get("Content-Range"))
+            if len(rows) < first:
+                tails.append([])
+            elif total is None:
+                tails.append(None)
+            else:
+                total = min(total, limit)
+                tails.append([
+                    pool.submit(_sb_get, path, {
+                        **params, "limit": str(min(page_size, total - off)), "offset": str(off),
+                    })
+                    for off in range(first, total, page_size)
+                ])
+
+        for out, params, tail in zip(results, params_list, tails):
+            if tail is None:
+                out.extend(_sb_get_all(path, params, limit - len(out), offset=len(out)))
+            else:
+                for page in tail:
+                    out.extend(page.result())
+    return results
+
+
+# PostgREST ``in.(...)`` filters ride in the query string; this keeps each
+# request URL comfortably under proxy/server length limits.
+_IN_FILTER_CHUNK = 200
+
+
+def _in_filter(values: List[str]) -> str:
+    """PostgREST ``in.(...)`` filter with each value double-quoted.
+
+    Quoting keeps ids containing ``,``, ``.``, ``(`` or ``)`` from splitting or
+    closing the list; backslashes and quotes inside a value are escaped.
+    """
+    quoted = (
+        '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values
+    )
+    return f"in.({','.join(quoted)})"
+
+
+def _sb_get_in(
+    path: str, params: Dict[str, str], column: str, values: List[str],
+) -> List[Dict[str, Any]]:
+    """Paginated fetch restricted to ``column in values``, all chunks' pages fetched concurrently."""
+    if not values:
+        return []
+    chunks = [values[i:i + _IN_FILTER_CHUNK] for i in range(0, len(values), _IN_FILTER_CHUNK)]
+    pages = _sb_get_all_many(
+        path, [{**params, column: _in_filter(chunk)} for chunk in chunks],
+    )
+    return [row for rows in pages for row in rows]
+
+
 # ---------------------------------------------------------------------------
 # Data fetch
 # ---------------------------------------------------------------------------
@@ -110,22 +243,28 @@ RESULT_COLS = ",".join([
 
 
 def fetch_picks(since: str) -> List[Dict[str, Any]]:
-    """Fetch live NBA pick_snapshots since a run_date."""
-    return _sb_get_all("/rest/v1/pick_snapshots", {
+    """Fetch live NBA pick_snapshots since a run_date.
+
+    ``event_id`` is cast to str once here, matching the result/closing keys.
+    """
+    picks = _sb_get_all_parallel("/rest/v1/pick_snapshots", {
         "select": PICK_COLS,
         "sport": "eq.nba",
         "source": "eq.live",
         "run_date": f"gte.{since}",
         "order": "run_date.desc",
     })
+    for p in picks:
+        p["event_id"] = str(p.get("event_id", ""))
+    return picks
 
 
-def fetch_results() -> Dict[str, Dict[str, Any]]:
-    """Fetch all NBA game_results, keyed by event_id."""
-    rows = _sb_get_all("/rest/v1/game_results", {
+def fetch_results(event_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch NBA game_results for the given event_ids, keyed by event_id."""
+    rows = _sb_get_in("/rest/v1/game_results", {
         "select": RESULT_COLS,
         "sport": "eq.nba",
-    })
+    }, "event_id", event_ids)
     return {str(r["event_id"]): r for r in rows}
 
 
@@ -134,26 +273,47 @@ CLOSING_LINE_COLS = ",".join([
 ])
 
 
-def fetch_closing_lines(book: str = "fanduel") -> Dict[str, List[Dict[str, Any]]]:
-    """Fetch closing_lines for NBA from preferred book, keyed by event_id."""
-    rows = _sb_get_all("/rest/v1/closing_lines", {
+# event_id -> (market, lowercased outcome_name) -> (price, point)
+ClosingIndex = Dict[str, Dict[Tuple[str, str], Tuple[Any, Any]]]
+
+
+def fetch_closing_lines(event_ids: List[str], book: str = "fanduel") -> ClosingIndex:
+    """Fetch NBA closing_lines for the given event_ids from preferred book.
+
+    Returned as an index keyed by event_id, then by ``(market, outcome)``
+    with the outcome name normalized once here. When a key repeats, the
+    first line carrying a value (price for h2h, point for spreads) wins.
+    """
+    rows = _sb_get_in("/rest/v1/closing_lines", {
         "select": CLOSING_LINE_COLS,
         "sport": "eq.nba",
         "bookmaker_key": f"eq.{book}",
-    })
-    by_eid: Dict[str, List[Dict[str, Any]]] = {}
+    }, "event_id", event_ids)
+    index: ClosingIndex = {}
     for r in rows:
-        by_eid.setdefault(str(r["event_id"]), []).append(r)
-    return by_eid
+        mkt = r.get("market", "")
+        key = (mkt, (r.get("outcome_name") or "").strip().lower())
+        lines = index.setdefault(str(r["event_id"]), {})
+        prev = lines.get(key)
+        if prev is None or prev[0 if mkt == "h2h" else 1] is None:
+            lines[key] = (r.get("price"), r.get("point"))
+    return index
+
+
+# Once these are set, _enrich_result has nothing to fill (spread prices are
+# only ever filled together with their point).
+_ENRICHED_KEYS = (
+    "closing_ml_home", "closing_ml_away",
+    "closing_spread_home_point", "closing_spread_away_point",
+)
 
 
-def _enrich_result(
-    result: Dict[str, Any],
-    closing: Dict[str, List[Dict[str, Any]]],
-) -> Dict[str, Any]:
+def _enrich_result(result: Dict[str, Any], closing: ClosingIndex) -> Dict[str, Any]:
     """Fill null closing odds in game_results from closing_lines table."""
+    if all(result.get(k) is not None for k in _ENRICHED_KEYS):
+        return result  # nothing left to fill
     eid = str(result.get("event_id", ""))
-    lines = closing.get(eid, [])
+    lines = closing.get(eid)
     if not lines:
         return result
 
@@ -161,27 +321,16 @@ def _enrich_result(
     home = (r.get("home_team") or "").strip().lower()
     away = (r.get("away_team") or "").strip().lower()
 
-    for cl in lines:
-        name = (cl.get("outcome_name") or "").strip().lower()
-        mkt = cl.get("market", "")
-        price = cl.get("price")
-        point = cl.get("point")
-
-        is_home = home and name == home
-        is_away = away and name == away
-
-        if mkt == "h2h":
-            if is_home and r.get("closing_ml_home") is None:
-                r["closing_ml_home"] = price
-            elif is_away and r.get("closing_ml_away") is None:
-                r["closing_ml_away"] = price
-        elif mkt == "spreads":
-            if is_home and r.get("closing_spread_home_point") is None:
-                r["closing_spread_home_point"] = point
-                r["closing_spread_home_price"] = price
-            elif is_away and r.get("closing_spread_away_point") is None:
-                r["closing_spread_away_point"] = point
-                r["closing_spread_away_price"] = price
+    for side, team in (("home", home), ("away", away)):
+        if not team:
+            continue
+        ml = lines.get(("h2h", team))
+        if ml is not None and r.get(f"closing_ml_{side}") is None:
+            r[f"closing_ml_{side}"] = ml[0]
+        sp = lines.get(("spreads", team))
+        if sp is not None and r.get(f"closing_spread_{side}_point") is None:
+            r[f"closing_spread_{side}_point"] = sp[1]
+            r[f"closing_spread_{side}_price"] = sp[0]
 
     return r
 
@@ -202,7 +351,9 @@ def _safe_int(x: Any) -> Optional[int]:
     return int(f) if f is not None and math.isfinite(f) else None
 
 
+@functools.lru_cache(maxsize=4096)
 def _american_profit(odds: int) -> float:
+    """Units won per unit staked at American ``odds`` (memoized: books quote few prices)."""
     if odds == 0:
         return 0.0
     return (100.0 / abs(odds)) if odds < 0 else (odds / 100.0)
@@ -210,9 +361,15 @@ def _american_profit(odds: int) -> float:
 
 def _resolve_side(pick: Dict[str, Any], result: Dict[str, Any]) -> Optional[str]:
     """Map the pick's side/selection_team to 'home' or 'away'."""
-    sel = (pick.get("selection_team") or pick.get("side") or "").strip().lower()
-    home = (result.get("home_team") or "").strip().lower()
-    away = (result.get("away_team") or "").strip().lower()
+    return _side_from_names(
+        (pick.get("selection_team") or pick.get("side") or "").strip().lower(),
+        (result.get("home_team") or "").strip().lower(),
+        (result.get("away_team") or "").strip().lower(),
+    )
+
+
+def _side_from_names(sel: str, home: str, away: str) -> Optional[str]:
+    """'home'/'away' for a normalized selection against normalized team names."""
     if not sel:
         return None
     # direct containment
@@ -291,18 +448,163 @@ def grade_pick(pick: Dict[str, Any], result: Dict[str, Any]) -> Optional[Dict[st
     }
 
 
+# Market and outcome codes for the vectorized grader
+_MARKET_CODES = {"moneyline": 0, "spread": 1}
+_SIDE_CODES = {"home": 0, "away": 1, None: -1}
+_OUTCOMES = ("push", "win", "loss")
+
+# game_results fields the grader reads; the four odds columns come last
+_GRADE_COLS = (
+    "home_score", "away_score",
+    "closing_spread_home_point", "closing_spread_away_point",
+    "closing_ml_home", "closing_ml_away",
+    "closing_spread_home_price", "closing_spread_away_price",
+)
+
+
+def _numeric_columns(rows: List[Dict[str, Any]], keys: Tuple[str, ...]) -> np.ndarray:
+    """``(len(keys), len(rows))`` float array of ``row[key]``; NaN where missing.
+
+    One ``np.array`` call converts the whole block (None -> NaN, numeric
+    strings parsed); only a block holding an unparsable value falls back
+    to per-value ``_safe_float``.
+    """
+    raw = [tuple(map(r.get, keys)) for r in rows]
+    try:
+        block = np.array(raw, dtype=np.float64)
+    except (ValueError, TypeError):
+        block = np.array([[_safe_float(v) for v in row] for row in raw], dtype=np.float64)
+    return block.reshape(len(rows), len(keys)).T
+
+
+def _grade_kernel(
+    is_ml: np.ndarray, own: np.ndarray, opp: np.ndarray, odds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Outcome codes (int8 index into ``_OUTCOMES``) and units for gradable picks.
+
+    ``own`` is the picked side's score (spread-adjusted for spread picks),
+    ``opp`` the opponent's, ``odds`` the truncated American closing price.
+    """
+    diff = own - opp
+    push = np.where(is_ml, diff == 0, np.abs(diff) < 1e-9)
+    win = diff > 0
+    # Closing odds take few distinct values: convert each once, then gather
+    uniq, inv = np.unique(odds, return_inverse=True)
+    profit = np.array([_american_profit(int(o)) for o in uniq.tolist()], dtype=np.float64)
+
+    outcome = np.full(len(odds), 2, dtype=np.int8)
+    outcome[win] = 1
+    outcome[push] = 0
+    units = np.where(win, profit[inv], -1.0)
+    units[push] = 0.0
+    return outcome, units
+
+
+def grade_picks(
+    picks: List[Dict[str, Any]], results: Dict[str, Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Grade every pick against its game result in one vectorized pass.
+
+    Same rules as ``grade_pick``, applied over parallel NumPy arrays (one
+    per field) instead of per-pick dict work. Returns the graded records in
+    pick order and the number of picks left ungraded (no result row, game
+    not final, unknown side/market or missing closing odds). Pick
+    ``event_id`` values must be strings, as ``fetch_picks`` returns them.
+    """
+    # Join on integer game positions: each game's fields are converted once
+    # and gathered per pick, however many picks share the game. Picks in
+    # markets the grader does not handle drop out here.
+    games = list(results.values())
+    game_pos = {eid: i for i, (eid, r) in enumerate(results.items()) if r}
+    matched: List[Dict[str, Any]] = []
+    pick_game: List[int] = []
+    market_codes: List[int] = []
+    side_codes: List[int] = []
+    # Per game: normalized (home, away) and a selection -> side code map,
+    # seeded with both team names; other selections fall back to the
+    # containment rules once and are cached.
+    team_to_side: Dict[int, Tuple[str, str, Dict[str, int]]] = {}
+    for p in picks:
+        m = _MARKET_CODES.get(p.get("market", ""))
+        i = game_pos.get(p["event_id"])
+        if m is None or i is None:
+            continue
+        teams = team_to_side.get(i)
+        if teams is None:
+            home = (games[i].get("home_team") or "").strip().lower()
+            away = (games[i].get("away_team") or "").strip().lower()
+            teams = team_to_side[i] = (home, away, {
+                name: _SIDE_CODES[_side_from_names(name, home, away)]
+                for name in (home, away) if name
+            })
+        sel = (p.get("selection_team") or p.get("side") or "").strip().lower()
+        side_code = teams[2].get(sel)
+        if side_code is None:
+            side_code = teams[2][sel] = _SIDE_CODES[_side_from_names(sel, teams[0], teams[1])]
+        matched.append(p)
+        pick_game.append(i)
+        market_codes.append(m)
+        side_codes.append(side_code)
+    if not matched:
+        return [], len(picks)
+
+    cols = _numeric_columns(games, _GRADE_COLS)[:, pick_game]
+    hs, as_, sp_home_pt, sp_away_pt = cols[:4]
+    # Odds columns follow _safe_int: truncated toward zero, non-finite -> missing
+    with np.errstate(invalid="ignore"):
+        odds_cols = np.where(np.isfinite(cols[4:]), np.trunc(cols[4:]), np.nan)
+    ml_home, ml_away, sp_home_pr, sp_away_pr = odds_cols
+
+    side = np.array(side_codes, dtype=np.int8)
+    has_side, is_home = side >= 0, side == 0
+    is_ml = np.array(market_codes, dtype=np.int8) == 0
+    is_sp = ~is_ml
+
+    sp_pt = np.where(is_home, sp_home_pt, sp_away_pt)
+    sp_pr = np.where(is_home, sp_home_pr, sp_away_pr)
+    ok = (
+        ~np.isnan(hs) & ~np.isnan(as_) & has_side
+        & ((is_ml & ~np.isnan(ml_home) & ~np.isnan(ml_away))
+           | (is_sp & ~np.isnan(sp_pt) & ~np.isnan(sp_pr)))
+    )
+
+    idx = np.flatnonzero(ok)
+    odds = np.where(is_ml, np.where(is_home, ml_home, ml_away), sp_pr)[idx]
+    own = (np.where(is_home, hs, as_) + np.where(is_sp, sp_pt, 0.0))[idx]
+    opp = np.where(is_home, as_, hs)[idx]
+    outcome, units = _grade_kernel(is_ml[idx], own, opp, odds)
+
+    graded: List[Dict[str, Any]] = []
+    for i, code, u, o in zip(idx.tolist(), outcome.tolist(), units.tolist(), odds.tolist()):
+        pick = matched[i]
+        graded.append({
+            "event_id": pick["event_id"],
+            "market": pick.get("market", ""),
+            "tier": pick.get("tier"),
+            "side": pick.get("side"),
+            "score": pick.get("score"),
+            "confidence": pick.get("confidence"),
+            "run_date": pick.get("run_date"),
+            "outcome": _OUTCOMES[code],
+            "units": u,
+            "closing_odds": int(o),
+        })
+    return graded, len(picks) - len(graded)
+
+
 # ---------------------------------------------------------------------------
 # Metrics
 # ---------------------------------------------------------------------------
 
-def _record(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
-    wins = sum(1 for r in rows if r["outcome"] == "win")
-    losses = sum(1 for r in rows if r["outcome"] == "loss")
-    pushes = sum(1 for r in rows if r["outcome"] == "push")
-    total_units = sum(r["units"] for r in rows)
+# Tally layout shared by _record and build_report: [n, wins, losses, pushes, units]
+_OUTCOME_SLOT = {"win": 1, "loss": 2, "push": 3}
+
+
+def _record_from_tally(tally: List[Any]) -> Dict[str, Any]:
+    n, wins, losses, pushes, total_units = tally
     bets = wins + losses  # pushes excluded from denominator
     return {
-        "n": len(rows),
+        "n": n,
         "wins": wins,
         "losses": losses,
         "pushes": pushes,
@@ -312,12 +614,14 @@ def _record(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def _group_by(rows: List[Dict[str, Any]], key: str) -> Dict[str, List[Dict[str, Any]]]:
-    groups: Dict[str, List[Dict[str, Any]]] = {}
+def _record(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    tally: List[Any] = [len(rows), 0, 0, 0, 0]
     for r in rows:
-        k = str(r.get(key, "unknown"))
-        groups.setdefault(k, []).append(r)
-    return groups
+        slot = _OUTCOME_SLOT.get(r["outcome"])
+        if slot:
+            tally[slot] += 1
+        tally[4] += r["units"]
+    return _record_from_tally(tally)
 
 
 def _calibration_bins(rows: List[Dict[str, Any]], n_bins: int = 5) -> List[Dict[str, Any]]:
@@ -325,27 +629,45 @@ def _calibration_bins(rows: List[Dict[str, Any]], n_bins: int = 5) -> List[Dict[
     Bin picks by predicted confidence, compare to actual win rate.
     Only includes rows with a usable confidence value.
     """
-    usable = [(r["confidence"], 1 if r["outcome"] == "win" else 0)
-              for r in rows
-              if r["confidence"] is not None and r["outcome"] in ("win", "loss")]
-    if not usable:
+    # One pass into two contiguous typed buffers, no per-row tuples
+    conf_buf, wins_buf = array("d"), array("b")
+    for r in rows:
+        c, outcome = r["confidence"], r["outcome"]
+        if c is not None and (outcome == "win" or outcome == "loss"):
+            conf_buf.append(c)
+            wins_buf.append(outcome == "win")
+    if not conf_buf:
         return []
-    usable.sort(key=lambda t: t[0])
-
-    bins: List[Dict[str, Any]] = []
-    chunk = max(1, len(usable) // n_bins)
-    for i in range(0, len(usable), chunk):
-        sl = usable[i:i + chunk]
-        confs = [c for c, _ in sl]
-        actuals = [a for _, a in sl]
-        bins.append({
-            "bin_lo": round(min(confs), 3),
-            "bin_hi": round(max(confs), 3),
-            "n": len(sl),
-            "predicted_avg": round(sum(confs) / len(confs), 3),
-            "actual_win_rate": round(sum(actuals) / len(actuals), 3),
-        })
-    return bins
+    conf = np.frombuffer(conf_buf, dtype=np.float64)
+    wins = np.frombuffer(wins_buf, dtype=np.int8)
+
+    # Stable sort keeps tied confidences in row order, as list.sort did
+    order = np.argsort(conf, kind="stable")
+    conf, wins = conf[order], wins[order]
+    chunk = max(1, len(conf) // n_bins)
+    starts = np.arange(0, len(conf), chunk)
+    counts = np.diff(np.r_[starts, len(conf)])
+    # Confidence sums stay sequential (builtin sum over each bin) so averages
+    # round exactly as before; NumPy's pairwise sum can differ in the last ulp.
+    conf_list = conf.tolist()
+    bounds = np.r_[starts, len(conf)].tolist()
+    stats = zip(
+        counts.tolist(),
+        np.minimum.reduceat(conf, starts).tolist(),
+        np.maximum.reduceat(conf, starts).tolist(),
+        [sum(conf_list[lo:hi]) / (hi - lo) for lo, hi in zip(bounds, bounds[1:])],
+        (np.add.reduceat(wins, starts, dtype=np.int64) / counts).tolist(),
+    )
+    return [
+        {
+            "bin_lo": round(lo, 3),
+            "bin_hi": round(hi, 3),
+            "n": n,
+            "predicted_avg": round(avg, 3),
+            "actual_win_rate": round(rate, 3),
+        }
+        for n, lo, hi, avg, rate in stats
+    ]
 
 
 def build_report(graded: List[Dict[str, Any]], days: int) -> Dict[str, Any]:
@@ -355,22 +677,30 @@ def build_report(graded: List[Dict[str, Any]], days: int) -> Dict[str, Any]:
         "total_graded": len(graded),
     }
 
-    # overall
-    report["overall"] = _record(graded)
-
-    # by market
-    by_market = _group_by(graded, "market")
-    report["by_market"] = {k: _record(v) for k, v in sorted(by_market.items())}
-
-    # by tier
-    by_tier = _group_by(graded, "tier")
-    report["by_tier"] = {k: _record(v) for k, v in sorted(by_tier.items())}
-
-    # by market × tier
+    # One pass fills a tally per overall / market / tier / market × tier bucket
+    tallies: Dict[Tuple[str, ...], List[Any]] = defaultdict(lambda: [0, 0, 0, 0, 0])
+    for r in graded:
+        mkt = str(r.get("market", "unknown"))
+        tier = str(r.get("tier", "unknown"))
+        slot = _OUTCOME_SLOT.get(r["outcome"])
+        units = r["units"]
+        for key in (("overall",), ("market", mkt), ("tier", tier), ("cross", mkt, tier)):
+            tally = tallies[key]
+            tally[0] += 1
+            if slot:
+                tally[slot] += 1
+            tally[4] += units
+
+    report["overall"] = _record_from_tally(tallies[("overall",)])
+    by_scope: Dict[str, Dict[Any, Dict[str, Any]]] = {"market": {}, "tier": {}, "cross": {}}
+    for key in sorted(k for k in tallies if k[0] != "overall"):
+        bucket = key[1] if len(key) == 2 else key[1:]
+        by_scope[key[0]][bucket] = _record_from_tally(tallies[key])
+    report["by_market"] = by_scope["market"]
+    report["by_tier"] = by_scope["tier"]
     cross: Dict[str, Any] = {}
-    for mkt, mkt_rows in sorted(by_market.items()):
-        sub = _group_by(mkt_rows, "tier")
-        cross[mkt] = {k: _record(v) for k, v in sorted(sub.items())}
+    for (mkt, tier), rec in by_scope["cross"].items():
+        cross.setdefault(mkt, {})[tier] = rec
     report["by_market_tier"] = cross
 
     # calibration (5 bins)
@@ -383,45 +713,54 @@ def build_report(graded: List[Dict[str, Any]], days: int) -> Dict[str, Any]:
 # Output
 # ---------------------------------------------------------------------------
 
-def report_to_markdown(rpt: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"# PickPulse NBA Evaluation Report")
-    lines.append(f"Generated: {rpt['generated_at']}")
-    lines.append(f"Lookback: {rpt['lookback_days']} days")
-    lines.append(f"Total graded picks: **{rpt['total_graded']}**")
-    lines.append("")
+_RECORD_MD = (
+    "{wins}W-{losses}L ({pushes}P) | Win%: {wp} | Units: {units:+.3f} | ROI: {roi} | N={n}"
+)
+_CALIBRATION_ROW_MD = (
+    "| {bin_lo:.3f}–{bin_hi:.3f} | {n} | {predicted_avg:.3f} | {actual_win_rate:.3f} |"
+)
+_OVERALL_TXT = (
+    "OVERALL:  {wins}W-{losses}L ({pushes}P)  |  Win%: {wp}  |  ROI: {roi}  |  Units: {units:+.3f}  |  N={n}"
+)
+_GROUP_TXT = "  {label:{width}s}  {wins}W-{losses}L  Win%: {wp}  ROI: {roi}  N={n}"
+_CALIBRATION_ROW_TXT = (
+    "  [{bin_lo:.3f}–{bin_hi:.3f}]  N={n:3d}  pred={predicted_avg:.3f}  actual={actual_win_rate:.3f}"
+)
 
-    def _fmt(rec: Dict[str, Any]) -> str:
-        wp = f"{rec['win_pct']}%" if rec['win_pct'] is not None else "—"
-        roi = f"{rec['roi_pct']}%" if rec['roi_pct'] is not None else "—"
-        return (
-            f"{rec['wins']}W-{rec['losses']}L"
-            f" ({rec['pushes']}P)"
-            f" | Win%: {wp}"
-            f" | Units: {rec['units']:+.3f}"
-            f" | ROI: {roi}"
-            f" | N={rec['n']}"
-        )
-
-    lines.append("## Overall")
-    lines.append(_fmt(rpt["overall"]))
-    lines.append("")
 
-    lines.append("## By Market")
-    for mkt, rec in rpt["by_market"].items():
-        lines.append(f"- **{mkt}**: {_fmt(rec)}")
+def _pct(value: Optional[float]) -> str:
+    return "—" if value is None else f"{value}%"
+
+
+def _fmt_record(rec: Dict[str, Any], template: str = _RECORD_MD, **extra: Any) -> str:
+    return template.format_map(
+        {**rec, **extra, "wp": _pct(rec["win_pct"]), "roi": _pct(rec["roi_pct"])}
+    )
+
+
+def report_to_markdown(rpt: Dict[str, Any]) -> str:
+    lines: List[str] = [
+        "# PickPulse NBA Evaluation Report",
+        f"Generated: {rpt['generated_at']}",
+        f"Lookback: {rpt['lookback_days']} days",
+        f"Total graded picks: **{rpt['total_graded']}**",
+        "",
+        "## Overall",
+        _fmt_record(rpt["overall"]),
+        "",
+        "## By Market",
+    ]
+    lines.extend(f"- **{mkt}**: {_fmt_record(rec)}" for mkt, rec in rpt["by_market"].items())
     lines.append("")
 
     lines.append("## By Tier")
-    for tier, rec in rpt["by_tier"].items():
-        lines.append(f"- **{tier}**: {_fmt(rec)}")
+    lines.extend(f"- **{tier}**: {_fmt_record(rec)}" for tier, rec in rpt["by_tier"].items())
     lines.append("")
 
     lines.append("## By Market × Tier")
     for mkt, subs in rpt["by_market_tier"].items():
         lines.append(f"### {mkt}")
-        for tier, rec in subs.items():
-            lines.append(f"- **{tier}**: {_fmt(rec)}")
+        lines.extend(f"- **{tier}**: {_fmt_record(rec)}" for tier, rec in subs.items())
         lines.append("")
 
     cal = rpt.get("calibration", [])
@@ -429,13 +768,7 @@ def report_to_markdown(rpt: Dict[str, Any]) -> str:
         lines.append("## Calibration (predicted confidence vs actual win rate)")
         lines.append("| Bin | N | Predicted Avg | Actual Win% |")
         lines.append("|-----|---|--------------|-------------|")
-        for b in cal:
-            lines.append(
-                f"| {b['bin_lo']:.3f}–{b['bin_hi']:.3f} "
-                f"| {b['n']} "
-                f"| {b['predicted_avg']:.3f} "
-                f"| {b['actual_win_rate']:.3f} |"
-            )
+        lines.extend(map(_CALIBRATION_ROW_MD.format_map, cal))
     else:
         lines.append("## Calibration")
         lines.append("Not enough data for calibration bins.")
@@ -444,6 +777,25 @@ def report_to_markdown(rpt: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def report_to_console(rpt: Dict[str, Any]) -> str:
+    rule = "=" * 50
+    lines: List[str] = ["", rule, _fmt_record(rpt["overall"], _OVERALL_TXT), rule]
+    lines.extend(
+        _fmt_record(rec, _GROUP_TXT, label=mkt, width=12) for mkt, rec in rpt["by_market"].items()
+    )
+    lines.append("")
+    lines.extend(
+        _fmt_record(rec, _GROUP_TXT, label=tier, width=14) for tier, rec in rpt["by_tier"].items()
+    )
+
+    cal = rpt.get("calibration", [])
+    if cal:
+        lines.append("")
+        lines.append(f"Calibration ({len(cal)} bins):")
+        lines.extend(map(_CALIBRATION_ROW_TXT.format_map, cal))
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -463,30 +815,21 @@ def main():
         print("No picks found. Nothing to evaluate.")
         sys.exit(0)
 
-    results = fetch_results()
+    # Only games that were actually picked need results and closing odds
+    eids = sorted({p["event_id"] for p in picks})
+
+    results = fetch_results(eids)
     print(f"  game_results rows:   {len(results)}")
 
-    closing = fetch_closing_lines()
+    closing = fetch_closing_lines(eids)
     print(f"  closing_lines eids:  {len(closing)}")
 
     # Enrich game_results with closing_lines odds where missing
-    for eid in results:
+    for eid in results.keys() & closing.keys():
         results[eid] = _enrich_result(results[eid], closing)
 
     # Grade
-    graded: List[Dict[str, Any]] = []
-    ungraded = 0
-    for p in picks:
-        eid = str(p.get("event_id", ""))
-        r = results.get(eid)
-        if not r:
-            ungraded += 1
-            continue
-        g = grade_pick(p, r)
-        if g is None:
-            ungraded += 1
-            continue
-        graded.append(g)
+    graded, ungraded = grade_picks(picks, results)
 
     print(f"  graded: {len(graded)}  |  ungraded/skipped: {ungraded}")
 
@@ -498,29 +841,7 @@ def main():
     rpt = build_report(graded, args.days)
 
     # Print summary
-    o = rpt["overall"]
-    wp = f"{o['win_pct']}%" if o["win_pct"] is not None else "—"
-    roi = f"{o['roi_pct']}%" if o["roi_pct"] is not None else "—"
-    print(f"\n{'='*50}")
-    print(f"OVERALL:  {o['wins']}W-{o['losses']}L ({o['pushes']}P)  |  Win%: {wp}  |  ROI: {roi}  |  Units: {o['units']:+.3f}  |  N={o['n']}")
-    print(f"{'='*50}")
-
-    for mkt, rec in rpt["by_market"].items():
-        mwp = f"{rec['win_pct']}%" if rec["win_pct"] is not None else "—"
-        mroi = f"{rec['roi_pct']}%" if rec["roi_pct"] is not None else "—"
-        print(f"  {mkt:12s}  {rec['wins']}W-{rec['losses']}L  Win%: {mwp}  ROI: {mroi}  N={rec['n']}")
-
-    print()
-    for tier, rec in rpt["by_tier"].items():
-        twp = f"{rec['win_pct']}%" if rec["win_pct"] is not None else "—"
-        troi = f"{rec['roi_pct']}%" if rec["roi_pct"] is not None else "—"
-        print(f"  {tier:14s}  {rec['wins']}W-{rec['losses']}L  Win%: {twp}  ROI: {troi}  N={rec['n']}")
-
-    cal = rpt.get("calibration", [])
-    if cal:
-        print(f"\nCalibration ({len(cal)} bins):")
-        for b in cal:
-            print(f"  [{b['bin_lo']:.3f}–{b['bin_hi']:.3f}]  N={b['n']:3d}  pred={b['predicted_avg']:.3f}  actual={b['actual_win_rate']:.3f}")
+    sys.stdout.write(report_to_console(rpt) + "\n")
 
     # Write files
     today = date.today().isoformat()
@@ -528,12 +849,9 @@ def main():
     json_path = f"reports/{today}_nba_eval.json"
     md_path = f"reports/{today}_nba_eval.md"
 
-    with open(json_path, "w") as f:
-        json.dump(rpt, f, indent=2)
+    write_atomic(json_path, json_bytes(rpt))
+    write_atomic(md_path, report_to_markdown(rpt).encode("utf-8"))
     print(f"\nWrote: {json_path}")
-
-    with open(md_path, "w") as f:
-        f.write(report_to_markdown(rpt))
     print(f"Wrote: {md_path}")
 
 
@@ -11,7 +11,8 @@ Usage:
 
 Modes:
   --once   : Run once, compare to baseline, exit. (default)
-  --watch  : Poll artifacts every 10s, re-run on change.
+  --watch  : Re-run on artifact change (filesystem events via watchdog when
+             installed, else polls every 10s; --poll N forces polling).
 """
 from __future__ import annotations
 
@@ -19,8 +20,9 @@ import argparse
 import hashlib
 import os
 import sys
+import threading
 import time
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 from app.experiments.edge_sweep import main as run_edge_sweep
 
@@ -35,17 +37,25 @@ WATCHED_FILES = [
 ]
 
 
-def _fingerprint() -> str:
-    """SHA256 hash of watched artifact files."""
-    h = hashlib.sha256()
+def _fingerprint() -> Tuple[Tuple[int, int], ...]:
+    """(mtime_ns, size) per watched artifact file, (0, 0) when missing.
+
+    One stat per file per poll; compare fingerprints directly.
+    """
+    fp = []
     for path in WATCHED_FILES:
-        if os.path.exists(path):
-            h.update(path.encode())
-            h.update(str(os.path.getmtime(path)).encode())
-            h.update(str(os.path.getsize(path)).encode())
+        try:
+            st = os.stat(path)
+        except OSError:
+            fp.append((0, 0))
         else:
-            h.update(f"MISSING:{path}".encode())
-    return h.hexdigest()[:16]
+            fp.append((st.st_mtime_ns, st.st_size))
+    return tuple(fp)
+
+
+def _fingerprint_hex(fp: Tuple[Tuple[int, int], ...]) -> str:
+    """Short SHA256 digest of a fingerprint, for log lines."""
+    return hashlib.sha256(repr(fp).encode()).hexdigest()[:16]
 
 
 # ---------------------------------------------------------------------------
@@ -59,18 +69,15 @@ def _run_and_compare(
 ) -> dict:
     """Run edge sweep with baseline comparison.
 
-    Forces the ML predict module to reload artifacts by clearing its cache.
+    Reloads the ML predict module's artifacts first so the sweep scores with
+    the model that triggered the run.
     """
-    # Force reload of ML model (clear per-process cache)
     try:
-        from app.ml import predict as pred_mod
-        pred_mod._LOADED = False
-        pred_mod._MODEL = None
-        pred_mod._CALIBRATOR = None
-        pred_mod._FEATURES = None
-        pred_mod._FORMAT = None
+        from app.ml.predict import reload_artifacts
     except ImportError:
         pass
+    else:
+        reload_artifacts()
 
     return run_edge_sweep(
         csv_path=csv_path,
@@ -84,15 +91,30 @@ def _run_and_compare(
 # Watch loop
 # ---------------------------------------------------------------------------
 
+# Quiet period after the last filesystem event before re-running, so a
+# model + calibrator save lands as one run.
+_DEBOUNCE_SECONDS = 0.5
+
+
 def watch_loop(
     csv_path: Optional[str],
     days: int,
-    poll_seconds: int = 10,
+    poll_seconds: Optional[int] = None,
 ):
-    """Poll for artifact changes, re-run on each change."""
+    """Re-run on each artifact change.
+
+    Uses filesystem events (watchdog: inotify/FSEvents) when watchdog is
+    installed and no poll interval is forced; otherwise polls every
+    ``poll_seconds`` (default 10s).
+    """
     last_fp = _fingerprint()
-    print(f"[auto_run] Watching artifacts for changes (poll={poll_seconds}s)")
-    print(f"[auto_run] Initial fingerprint: {last_fp}")
+    observer, changed = (None, None) if poll_seconds else _start_observer()
+    if observer is None:
+        poll_seconds = poll_seconds or 10
+        print(f"[auto_run] Watching artifacts for changes (poll={poll_seconds}s)")
+    else:
+        print("[auto_run] Watching artifacts for changes (filesystem events)")
+    print(f"[auto_run] Initial fingerprint: {_fingerprint_hex(last_fp)}")
     print(f"[auto_run] Press Ctrl+C to stop.\n")
 
     # Initial run
@@ -102,20 +124,71 @@ def watch_loop(
     run_count = 1
     try:
         while True:
-            time.sleep(poll_seconds)
+            if observer is None:
+                time.sleep(poll_seconds)
+            else:
+                _wait_for_quiet_change(changed)
             fp = _fingerprint()
             if fp != last_fp:
                 run_count += 1
                 print(f"\n[auto_run] === Model change detected (run #{run_count}) ===")
-                print(f"[auto_run] Old fingerprint: {last_fp}")
-                print(f"[auto_run] New fingerprint: {fp}")
+                print(f"[auto_run] Old fingerprint: {_fingerprint_hex(last_fp)}")
+                print(f"[auto_run] New fingerprint: {_fingerprint_hex(fp)}")
                 last_fp = fp
                 _run_and_compare(csv_path, days, save_baseline=False)
-            else:
+            elif observer is None:
                 sys.stdout.write(".")
                 sys.stdout.flush()
     except KeyboardInterrupt:
         print(f"\n[auto_run] Stopped after {run_count} run(s).")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+
+def _start_observer() -> Tuple[Optional[Any], Optional[threading.Event]]:
+    """Start a watchdog observer on the watched files' directories.
+
+    Returns ``(observer, changed)``, where ``changed`` is set on any event
+    touching a watched file, or ``(None, None)`` when watchdog is not
+    installed or the directories cannot be watched.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None, None
+
+    watched = {os.path.abspath(p) for p in WATCHED_FILES}
+    changed = threading.Event()
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Atomic saves show up as a move onto the watched path
+            paths = {event.src_path, getattr(event, "dest_path", "")}
+            if any(os.path.abspath(p) in watched for p in paths if p):
+                changed.set()
+
+    observer = Observer()
+    try:
+        for directory in {os.path.dirname(p) for p in watched}:
+            observer.schedule(_Handler(), directory, recursive=False)
+        observer.start()
+    except OSError as e:
+        print(f"[auto_run] Filesystem events unavailable ({e}); falling back to polling")
+        return None, None
+    return observer, changed
+
+
+def _wait_for_quiet_change(changed: threading.Event) -> None:
+    """Block until a watched file changes and events settle for the debounce window."""
+    # Short timeouts keep Ctrl+C responsive on every platform
+    while not changed.wait(timeout=1.0):
+        pass
+    changed.clear()
+    while changed.wait(timeout=_DEBOUNCE_SECONDS):
+        changed.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -131,11 +204,13 @@ def cli():
     parser.add_argument("--once", action="store_true", default=True,
                         help="Run once, compare to baseline, exit (default)")
     parser.add_argument("--watch", action="store_true",
-                        help="Poll for artifact changes and re-run")
+                        help="Watch for artifact changes and re-run")
     parser.add_argument("--save-baseline", action="store_true",
                         help="Overwrite baseline with current results")
-    parser.add_argument("--poll", type=int, default=10,
-                        help="Poll interval in seconds (watch mode)")
+    parser.add_argument("--poll", type=int, default=None,
+                        help="Force polling at this interval in seconds (watch mode); "
+                             "default uses filesystem events when watchdog is installed, "
+                             "else polls every 10s")
     args = parser.parse_args()
 
     csv = args.csv
@@ -7,22 +7,29 @@ Tests simple CLV-based filtering rules on historical locked picks:
   - keep bets where clv_prob > 0 (positive CLV picks only)
 
 Outputs summary tables to reports/experiments/{ts}/clv_filter_sweep.md
+Timing features are cached under cache/ keyed by the picks, their events'
+closing lines and the feature code; only the latest entry is kept.
 
 Data source: Supabase locked_picks + closing_lines (--days N)
 
 CLI:
   python -m app.experiments.clv_filter_sweep --days 365
+  python -m app.experiments.clv_filter_sweep --days 365 --no-cache
 """
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
+import importlib
 import json
-import math
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -32,75 +39,128 @@ from app.agents._supabase import (
     fetch_pick_results,
     since_date,
 )
-from app.agents._math import implied_prob, normalize_no_vig, american_profit, safe_float
+from app.agents._math import safe_float
 from app.clv_timing.features import compute_batch
 from app.clv_timing.report import summarize_features
+from app.io_utils import dump_json
 
 
 # ---------------------------------------------------------------------------
 # Filter definitions
 # ---------------------------------------------------------------------------
 
-FILTERS = {
-    "baseline": lambda f, p: True,
-    "steam_15m >= 0": lambda f, p: f.get("steam_15m") is not None and f["steam_15m"] >= 0,
-    "steam_15m >= 0.005": lambda f, p: f.get("steam_15m") is not None and f["steam_15m"] >= 0.005,
-    "range_30m <= 0.03": lambda f, p: f.get("range_30m") is not None and f["range_30m"] <= 0.03,
-    "range_30m <= 0.02": lambda f, p: f.get("range_30m") is not None and f["range_30m"] <= 0.02,
-    "snap_gap_close <= 300s": lambda f, p: f.get("snap_gap_close_sec") is not None and f["snap_gap_close_sec"] <= 300,
-    "snap_gap_close <= 120s": lambda f, p: f.get("snap_gap_close_sec") is not None and f["snap_gap_close_sec"] <= 120,
-    "clv_prob > 0": lambda f, p: f.get("clv_prob") is not None and f["clv_prob"] > 0,
-    "clv_prob > 0.01": lambda f, p: f.get("clv_prob") is not None and f["clv_prob"] > 0.01,
-}
+# (name, feature column, comparison, threshold). A None column keeps every pick.
+# Missing feature values are NaN, and NaN compares False, so a pick without
+# the feature never passes a threshold filter.
+FILTERS: List[Tuple[str, Optional[str], Any, float]] = [
+    ("baseline", None, None, 0.0),
+    ("steam_15m >= 0", "steam_15m", np.greater_equal, 0.0),
+    ("steam_15m >= 0.005", "steam_15m", np.greater_equal, 0.005),
+    ("range_30m <= 0.03", "range_30m", np.less_equal, 0.03),
+    ("range_30m <= 0.02", "range_30m", np.less_equal, 0.02),
+    ("snap_gap_close <= 300s", "snap_gap_close_sec", np.less_equal, 300),
+    ("snap_gap_close <= 120s", "snap_gap_close_sec", np.less_equal, 120),
+    ("clv_prob > 0", "clv_prob", np.greater, 0.0),
+    ("clv_prob > 0.01", "clv_prob", np.greater, 0.01),
+]
+
+# clv_prob feeds the CLV stats of every filter; the rest are what FILTERS compares
+_FEATURE_COLS = tuple(dict.fromkeys(
+    ["clv_prob"] + [col for _, col, _, _ in FILTERS if col is not None]
+))
 
 
 # ---------------------------------------------------------------------------
 # Metric computation
 # ---------------------------------------------------------------------------
 
-def _compute_filter_metrics(
+def _index_results(
+    results: List[Dict[str, Any]],
+) -> Dict[str, Tuple[Optional[float], bool]]:
+    """Map event_id -> (units, won) with units parsed once; the last row per event wins."""
+    indexed = {
+        str(r.get("event_id", "")): (safe_float(r.get("units")), r.get("result") == "win")
+        for r in results
+    }
+    indexed.pop("", None)
+    return indexed
+
+
+def _filter_columns(
     features: List[Dict[str, Any]],
     picks: List[Dict[str, Any]],
-    results_by_eid: Dict[str, Dict[str, Any]],
-    filter_fn,
-) -> Dict[str, Any]:
-    """Compute metrics for picks passing a filter."""
-    passing = []
-    for feat, pick in zip(features, picks):
-        if filter_fn(feat, pick):
-            passing.append((feat, pick))
-
-    n = len(passing)
+    results_by_eid: Dict[str, Tuple[Optional[float], bool]],
+) -> Dict[str, np.ndarray]:
+    """Pull the filtered features and graded outcomes into aligned arrays.
+
+    Feature columns are float64 with NaN for missing values, and the CLV
+    finiteness/sign masks are computed once for all filters. ``graded`` marks
+    picks with a parseable ``units`` result; ``units`` and ``won`` are only
+    meaningful where ``graded`` is set.
+    """
+    nan = float("nan")
+    cols = {
+        key: np.array([nan if f.get(key) is None else f[key] for f in features], dtype=np.float64)
+        for key in _FEATURE_COLS
+    }
+
+    n = len(picks)
+    units = np.zeros(n, dtype=np.float64)
+    graded = np.zeros(n, dtype=bool)
+    won = np.zeros(n, dtype=bool)
+    for i, pick in enumerate(picks):
+        res = results_by_eid.get(str(pick.get("event_id", "")))
+        if res is not None and res[0] is not None:
+            units[i], won[i] = res
+            graded[i] = True
+
+    clv = cols["clv_prob"]
+    cols.update(
+        clv_finite=np.isfinite(clv),
+        clv_positive=clv > 0,
+        units=units,
+        graded=graded,
+        won=won,
+    )
+    return cols
+
+
+def _filter_mask(
+    cols: Dict[str, np.ndarray],
+    column: Optional[str],
+    op: Any,
+    threshold: float,
+) -> np.ndarray:
+    """Boolean mask of the picks passing one FILTERS entry."""
+    if column is None:
+        return np.ones(len(cols["units"]), dtype=bool)
+    return op(cols[column], threshold)
+
+
+def _compute_filter_metrics(cols: Dict[str, np.ndarray], mask: np.ndarray) -> Dict[str, Any]:
+    """Compute metrics for the picks selected by a filter mask."""
+    n = int(np.count_nonzero(mask))
     if n == 0:
         return {"n": 0}
 
-    # CLV stats
-    clvs = [f["clv_prob"] for f, _ in passing
-            if f.get("clv_prob") is not None and math.isfinite(f["clv_prob"])]
-    mean_clv = sum(clvs) / len(clvs) if clvs else None
-    pct_positive = sum(1 for c in clvs if c > 0) / len(clvs) * 100 if clvs else None
+    # CLV stats, reduced in place under combined masks (no per-filter subarrays)
+    has_clv = mask & cols["clv_finite"]
+    n_clv = int(np.count_nonzero(has_clv))
+    mean_clv = float(cols["clv_prob"].sum(where=has_clv)) / n_clv if n_clv else None
+    pct_positive = np.count_nonzero(has_clv & cols["clv_positive"]) / n_clv * 100 if n_clv else None
 
     # ROI from pick_results
-    total_units = 0.0
-    graded = 0
-    wins = 0
-    for feat, pick in passing:
-        eid = str(pick.get("event_id", ""))
-        res = results_by_eid.get(eid)
-        if res and res.get("units") is not None:
-            u = safe_float(res["units"])
-            if u is not None:
-                total_units += u
-                graded += 1
-                if res.get("result") == "win":
-                    wins += 1
+    graded_mask = mask & cols["graded"]
+    graded = int(np.count_nonzero(graded_mask))
+    total_units = float(cols["units"].sum(where=graded_mask))
+    wins = int(np.count_nonzero(graded_mask & cols["won"]))
 
     roi_pct = (total_units / graded * 100) if graded > 0 else None
     win_rate = (wins / graded * 100) if graded > 0 else None
 
     return {
         "n": n,
-        "n_with_clv": len(clvs),
+        "n_with_clv": n_clv,
         "mean_clv": round(mean_clv, 5) if mean_clv is not None else None,
         "pct_positive_clv": round(pct_positive, 1) if pct_positive is not None else None,
         "n_graded": graded,
@@ -111,40 +171,121 @@ def _compute_filter_metrics(
     }
 
 
+# ---------------------------------------------------------------------------
+# Feature cache
+# ---------------------------------------------------------------------------
+
+FEATURE_CACHE_DIR = "cache"
+
+# Modules whose code decides compute_batch's output; editing any of them
+# changes the cache key.
+_FEATURE_CODE_MODULES = ("app.clv_timing.features", "app.clv_timing.snapshots", "app.agents._math")
+
+
+def _feature_code_digest() -> str:
+    """Hash of the feature-computation source files."""
+    h = hashlib.blake2b(digest_size=8)
+    for name in _FEATURE_CODE_MODULES:
+        with open(importlib.import_module(name).__file__, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _features_cache_path(
+    picks: List[Dict[str, Any]],
+    closing: Dict[str, List[Dict[str, Any]]],
+) -> Optional[str]:
+    """Cache file for compute_batch on these inputs, or None if picks lack unique ids.
+
+    Locked picks do not change once locked, and closing lines only grow by new
+    snapshots, so pick ids plus (event_id, captured_at) of the picked events'
+    lines identify the inputs; the feature code digest covers the logic.
+    """
+    pick_ids = sorted(str(p.get("id")) for p in picks)
+    if len(set(pick_ids)) != len(picks) or any(p.get("id") is None for p in picks):
+        return None
+    event_ids = {str(p.get("event_id", "")) for p in picks}
+    closing_keys = sorted(
+        f"{eid}@{r.get('captured_at')}"
+        for eid in event_ids
+        for r in closing.get(eid, [])
+    )
+    digest = hashlib.blake2b(
+        json.dumps([_feature_code_digest(), pick_ids, closing_keys]).encode(), digest_size=8
+    ).hexdigest()
+    return os.path.join(FEATURE_CACHE_DIR, f"clv_features_{digest}.json")
+
+
+def _prune_features_cache(keep: str) -> None:
+    """Delete every cached feature file except ``keep``."""
+    for path in glob.glob(os.path.join(FEATURE_CACHE_DIR, "clv_features_*.json")):
+        if os.path.abspath(path) != os.path.abspath(keep):
+            os.remove(path)
+
+
+def _compute_features_cached(
+    picks: List[Dict[str, Any]],
+    closing: Dict[str, List[Dict[str, Any]]],
+    use_cache: bool = True,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """compute_batch, memoized on disk by _features_cache_path."""
+    path = _features_cache_path(picks, closing) if use_cache else None
+    if path and os.path.exists(path):
+        with open(path) as f:
+            cached = json.load(f)
+        print(f"[clv_filter] Features from cache {path}")
+        by_id = cached["features"]
+        return [by_id[str(p["id"])] for p in picks], cached["coverage"]
+
+    features, coverage = compute_batch(picks, closing)
+    if path:
+        os.makedirs(FEATURE_CACHE_DIR, exist_ok=True)
+        payload = {
+            "features": {str(p["id"]): feat for p, feat in zip(picks, features)},
+            "coverage": coverage,
+        }
+        with open(path + ".tmp", "w") as f:
+            json.dump(payload, f)
+        os.replace(path + ".tmp", path)
+        _prune_features_cache(keep=path)
+    return features, coverage
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def run(days: int = 365) -> Dict[str, Any]:
+def run(days: int = 365, use_cache: bool = True) -> Dict[str, Any]:
     """Run CLV filter sweep."""
     since = since_date(days)
 
-    print(f"[clv_filter] Fetching locked picks since {since}...")
-    picks = fetch_locked_picks(since)
+    # The three reads are independent, so overlap their network time
+    print(f"[clv_filter] Fetching locked picks, closing lines and pick results since {since}...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        picks_f = pool.submit(fetch_locked_picks, since)
+        closing_f = pool.submit(fetch_closing_lines)
+        results_f = pool.submit(fetch_pick_results, since)
+        picks, closing, results = picks_f.result(), closing_f.result(), results_f.result()
     print(f"[clv_filter] Locked picks: {len(picks)}")
-
-    print("[clv_filter] Fetching closing lines...")
-    closing = fetch_closing_lines()
     print(f"[clv_filter] Events with closing lines: {len(closing)}")
 
-    print("[clv_filter] Fetching pick results...")
-    results = fetch_pick_results(since)
-    results_by_eid: Dict[str, Dict[str, Any]] = {}
-    for r in results:
-        eid = str(r.get("event_id", ""))
-        if eid:
-            results_by_eid[eid] = r
+    results_by_eid = _index_results(results)
     print(f"[clv_filter] Pick results: {len(results)}")
 
     print("[clv_filter] Computing timing features...")
-    features, coverage = compute_batch(picks, closing)
+    features, coverage = _compute_features_cached(picks, closing, use_cache)
     print(f"[clv_filter] Coverage: {coverage}")
 
     # Run each filter
+    cols = _filter_columns(features, picks, results_by_eid)
     filter_results = {}
-    for name, fn in FILTERS.items():
-        metrics = _compute_filter_metrics(features, picks, results_by_eid, fn)
-        filter_results[name] = metrics
+    by_mask: Dict[bytes, Dict[str, Any]] = {}  # filters selecting the same picks share metrics
+    for name, column, op, threshold in FILTERS:
+        mask = _filter_mask(cols, column, op, threshold)
+        key = np.packbits(mask).tobytes()
+        if key not in by_mask:
+            by_mask[key] = _compute_filter_metrics(cols, mask)
+        metrics = filter_results[name] = dict(by_mask[key])
         print(f"  {name:30s}: n={metrics['n']:4d}, "
               f"CLV={metrics.get('mean_clv', 'n/a')}, "
               f"pct+={metrics.get('pct_positive_clv', 'n/a')}%, "
@@ -168,8 +309,7 @@ def run(days: int = 365) -> Dict[str, Any]:
     os.makedirs(report_dir, exist_ok=True)
 
     json_path = os.path.join(report_dir, "clv_filter_sweep.json")
-    with open(json_path, "w") as f:
-        json.dump(report, f, indent=2)
+    dump_json(report, json_path)
     print(f"\n[clv_filter] JSON -> {json_path}")
 
     md = _render_markdown(report, feat_summary)
@@ -181,6 +321,27 @@ def run(days: int = 365) -> Dict[str, Any]:
     return report
 
 
+_FILTER_ROW_MD = "| {name} | {n} | {clv} | {pct} | {n_graded} | {wr} | {roi} |"
+
+
+def _fmt_opt(value: Optional[float], spec: str, suffix: str = "") -> str:
+    return "—" if value is None else format(value, spec) + suffix
+
+
+def _filter_row_md(name: str, m: Dict[str, Any]) -> str:
+    if m["n"] == 0:
+        return f"| {name} | 0 | — | — | — | — | — |"
+    return _FILTER_ROW_MD.format(
+        name=name,
+        n=m["n"],
+        clv=_fmt_opt(m.get("mean_clv"), ".4f"),
+        pct=_fmt_opt(m.get("pct_positive_clv"), ".0f", "%"),
+        n_graded=m.get("n_graded", 0),
+        wr=_fmt_opt(m.get("win_rate"), ".0f", "%"),
+        roi=_fmt_opt(m.get("roi_pct"), "+.1f", "%"),
+    )
+
+
 def _render_markdown(report: Dict[str, Any], feat_summary: str) -> str:
     """Render filter sweep as markdown."""
     lines = []
@@ -207,16 +368,7 @@ def _render_markdown(report: Dict[str, Any], feat_summary: str) -> str:
     lines.append("")
     lines.append("| Filter | N | Mean CLV | % CLV+ | N Graded | Win Rate | ROI |")
     lines.append("|--------|---|----------|--------|----------|----------|-----|")
-    for name, m in report.get("filters", {}).items():
-        if m["n"] == 0:
-            lines.append(f"| {name} | 0 | — | — | — | — | — |")
-            continue
-        clv = f"{m['mean_clv']:.4f}" if m.get("mean_clv") is not None else "—"
-        pct = f"{m['pct_positive_clv']:.0f}%" if m.get("pct_positive_clv") is not None else "—"
-        wr = f"{m['win_rate']:.0f}%" if m.get("win_rate") is not None else "—"
-        roi = f"{m['roi_pct']:+.1f}%" if m.get("roi_pct") is not None else "—"
-        lines.append(f"| {name} | {m['n']} | {clv} | {pct} | {m.get('n_graded', 0)} | {wr} | {roi} |")
-
+    lines.extend(_filter_row_md(name, m) for name, m in report.get("filters", {}).items())
     lines.append("")
 
     # Feature distributions
@@ -233,9 +385,11 @@ def cli():
     parser = argparse.ArgumentParser(description="CLV filter sweep experiment")
     parser.add_argument("--days", type=int, default=365,
                         help="Lookback days (default: 365)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Recompute timing features instead of reusing {FEATURE_CACHE_DIR}/")
     args = parser.parse_args()
 
-    report = run(days=args.days)
+    report = run(days=args.days, use_cache=not args.no_cache)
     if report.get("n_picks", 0) == 0:
         print("\nNo picks found.")
         sys.exit(1)
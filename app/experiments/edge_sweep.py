@@ -17,17 +17,19 @@ CLI:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
-# Reuse existing math helpers
-from app.agents._math import implied_prob, normalize_no_vig, american_profit
+from app.agents._math import american_profit_array
+from app.io_utils import dump_json
 
 
 # ---------------------------------------------------------------------------
@@ -42,17 +44,31 @@ BASELINE_FILENAME = "edge_sweep_baseline.json"
 # Data loading
 # ---------------------------------------------------------------------------
 
+# The only CSV columns the sweep reads; match_status is just for the row filter
+_SWEEP_COLS = ["date", "p_home_nv", "p_away_nv", "home_win", "home_odds", "away_odds"]
+_CSV_COLS = ["match_status"] + _SWEEP_COLS
+
+
 def _load_csv(csv_path: str) -> pd.DataFrame:
-    """Load historical CSV, keep only matched rows with valid odds."""
-    df = pd.read_csv(csv_path)
+    """Load historical CSV, keep only matched rows with valid odds.
+
+    Parses just _CSV_COLS, with pyarrow's multithreaded reader when installed.
+    """
+    try:
+        import pyarrow  # noqa: F401
+        engine = "pyarrow"
+    except ImportError:
+        engine = "c"
+    df = pd.read_csv(csv_path, usecols=_CSV_COLS, dtype={"date": str}, engine=engine)
     df = df[df["match_status"] == "matched"].copy()
     df = df.dropna(subset=["p_home_nv", "p_away_nv", "home_win", "home_odds", "away_odds"])
     df["p_home_nv"] = df["p_home_nv"].astype(float)
     df["p_away_nv"] = df["p_away_nv"].astype(float)
-    df["home_win"] = df["home_win"].astype(int)
+    df["home_win"] = df["home_win"].astype(np.int8)
     df["home_odds"] = df["home_odds"].astype(float)
     df["away_odds"] = df["away_odds"].astype(float)
-    df = df.sort_values("date").reset_index(drop=True)
+    # match_status has done its job; keep only what the sweep reads downstream
+    df = df[_SWEEP_COLS].sort_values("date").reset_index(drop=True)
     return df
 
 
@@ -72,55 +88,47 @@ def _load_supabase(days: int = 365) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 
 def _predict_batch(df: pd.DataFrame) -> pd.DataFrame:
-    """Run production ML predict on each game (home perspective).
+    """Run production ML predict on all games in one batch (home perspective).
 
     Adds columns: p_model_home, p_model_away, edge_home, edge_away,
-                  best_side, best_edge, best_prob, best_won, best_odds.
+                  best_side, best_edge, best_prob, best_won, best_odds,
+                  best_market_nv, best_profit.
     """
-    from app.ml.predict import is_available, predict_win_prob
+    from app.ml.predict import is_available, predict_win_probs
 
     if not is_available():
         raise RuntimeError("ML model artifacts not found. Run: python -m app.ml.train --csv data/nba_calibration_ml.csv")
 
-    p_model_home = []
-    p_model_away = []
-
-    for _, row in df.iterrows():
-        ph = predict_win_prob(
-            locked_home_nv=row["p_home_nv"],
-            locked_away_nv=row["p_away_nv"],
-            is_home=1,
-        )
-        pa = predict_win_prob(
-            locked_home_nv=row["p_home_nv"],
-            locked_away_nv=row["p_away_nv"],
-            is_home=0,
-        )
-        p_model_home.append(ph if ph is not None else 0.5)
-        p_model_away.append(pa if pa is not None else 0.5)
+    # One model call for every game; a failed batch falls back to 0.5 like a failed row did
+    probs = predict_win_probs(df["p_home_nv"].to_numpy(), df["p_away_nv"].to_numpy())
+    if probs is None:
+        probs = (np.full(len(df), 0.5), np.full(len(df), 0.5))
+    p_model_home, p_model_away = probs
 
-    work = df.copy()
-    work["p_model_home"] = p_model_home
-    work["p_model_away"] = p_model_away
-    work["edge_home"] = work["p_model_home"] - work["p_home_nv"]
-    work["edge_away"] = work["p_model_away"] - work["p_away_nv"]
+    p_home_nv = df["p_home_nv"].to_numpy()
+    p_away_nv = df["p_away_nv"].to_numpy()
+    home_win = df["home_win"].to_numpy(dtype=np.float64)
+    edge_home = p_model_home - p_home_nv
+    edge_away = p_model_away - p_away_nv
 
     # Best side: pick the one with higher edge
-    work["best_side"] = np.where(work["edge_home"] >= work["edge_away"], "home", "away")
-    work["best_edge"] = np.where(
-        work["best_side"] == "home", work["edge_home"], work["edge_away"]
-    )
-    work["best_prob"] = np.where(
-        work["best_side"] == "home", work["p_model_home"], work["p_model_away"]
-    )
-    work["best_won"] = np.where(
-        work["best_side"] == "home", work["home_win"], 1 - work["home_win"]
-    )
-    work["best_odds"] = np.where(
-        work["best_side"] == "home", work["home_odds"], work["away_odds"]
-    )
-    work["best_market_nv"] = np.where(
-        work["best_side"] == "home", work["p_home_nv"], work["p_away_nv"]
+    home_best = edge_home >= edge_away
+    best_odds = np.where(home_best, df["home_odds"].to_numpy(), df["away_odds"].to_numpy())
+
+    # All new columns in one assign rather than a copy plus column-at-a-time inserts
+    work = df.assign(
+        p_model_home=p_model_home,
+        p_model_away=p_model_away,
+        edge_home=edge_home,
+        edge_away=edge_away,
+        best_side=np.where(home_best, "home", "away").astype(object),
+        best_edge=np.where(home_best, edge_home, edge_away),
+        best_prob=np.where(home_best, p_model_home, p_model_away),
+        best_won=np.where(home_best, home_win, 1.0 - home_win),
+        best_odds=best_odds,
+        best_market_nv=np.where(home_best, p_home_nv, p_away_nv),
+        # Win profit per unit, priced once here rather than per bet per threshold
+        best_profit=american_profit_array(best_odds),
     )
 
     return work
@@ -130,63 +138,108 @@ def _predict_batch(df: pd.DataFrame) -> pd.DataFrame:
 # Metrics computation
 # ---------------------------------------------------------------------------
 
+# Per-bet terms summed by _edge_prefix_sums, in column order
+_TERM_COLS = ("wins", "units", "brier", "logloss", "edge", "prob", "market_nv")
+
+
+def _edge_prefix_sums(bets: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Order bets by best_edge (descending) and accumulate per-bet terms.
+
+    Every MIN_EDGE threshold keeps a prefix of this order, so the totals for
+    the top k bets are the cumulative sums at index k - 1.
+    """
+    # Zero-copy views when the columns are already float64, as _predict_batch leaves them
+    edges = bets["best_edge"].to_numpy(dtype=np.float64, copy=False)
+    order = np.argsort(-edges, kind="stable")
+
+    y = bets["best_won"].to_numpy(dtype=np.float64, copy=False)
+    probs = bets["best_prob"].to_numpy(dtype=np.float64, copy=False)
+    profit = bets["best_profit"].to_numpy(dtype=np.float64, copy=False)
+    market_nv = bets["best_market_nv"].to_numpy(dtype=np.float64, copy=False)
+
+    ys, ps = y[order], probs[order]
+    eps = 1e-15
+    clipped = np.clip(ps, eps, 1 - eps)
+
+    # One (n, len(_TERM_COLS)) matrix of per-bet terms, accumulated in a single cumsum
+    terms = np.empty((len(order), len(_TERM_COLS)), dtype=np.float64)
+    terms[:, 0] = ys
+    terms[:, 1] = np.where(ys >= 0.5, profit[order], -1.0)  # ROI (units): +profit on win, -1 on loss
+    terms[:, 2] = (ys - ps) ** 2
+    terms[:, 3] = -(ys * np.log(clipped) + (1 - ys) * np.log(1 - clipped))
+    terms[:, 4] = edges[order]
+    terms[:, 5] = ps
+    terms[:, 6] = market_nv[order]
+    return {
+        "neg_edge": -edges[order],  # ascending, for searchsorted
+        "order": order,
+        "y": y,
+        "prob": probs,
+        "cum": np.cumsum(terms, axis=0),
+    }
+
+
+def _n_at_threshold(sums: Dict[str, np.ndarray], threshold: float) -> int:
+    """Number of bets with best_edge >= threshold."""
+    return int(np.searchsorted(sums["neg_edge"], -threshold, side="right"))
+
+
 def _compute_metrics(bets: pd.DataFrame) -> Dict[str, Any]:
     """Compute full metrics for a filtered set of bets."""
-    n = len(bets)
+    return _compute_prefix_metrics(_edge_prefix_sums(bets), len(bets))
+
+
+def _compute_prefix_metrics(sums: Dict[str, np.ndarray], n: int) -> Dict[str, Any]:
+    """Compute full metrics for the n highest-edge bets."""
     if n == 0:
         return {"n_bets": 0}
-
-    y = bets["best_won"].values.astype(float)
-    probs = bets["best_prob"].values.astype(float)
-    odds = bets["best_odds"].values.astype(float)
-    edges = bets["best_edge"].values.astype(float)
-    market_nv = bets["best_market_nv"].values.astype(float)
+    totals = dict(zip(_TERM_COLS, sums["cum"][n - 1].tolist()))
 
     # Win rate
-    wins = int(y.sum())
+    wins = int(totals["wins"])
     win_rate = wins / n
 
-    # ROI (units): +profit on win, -1 on loss
-    units = 0.0
-    for i in range(n):
-        if y[i] >= 0.5:
-            units += american_profit(odds[i])
-        else:
-            units -= 1.0
-    roi_pct = (units / n) * 100 if n > 0 else 0.0
-
-    # Brier score
-    brier = float(np.mean((y - probs) ** 2))
+    units = totals["units"]
+    roi_pct = (units / n) * 100
 
-    # Log loss
-    eps = 1e-15
-    clipped = np.clip(probs, eps, 1 - eps)
-    logloss = float(-np.mean(y * np.log(clipped) + (1 - y) * np.log(1 - clipped)))
+    brier = totals["brier"] / n
+    logloss = totals["logloss"] / n
 
     # Average edge and probability
-    avg_edge = float(np.mean(edges))
-    avg_prob = float(np.mean(probs))
-    avg_market_nv = float(np.mean(market_nv))
-
-    # Calibration bins (10 quantile bins)
+    avg_edge = totals["edge"] / n
+    avg_prob = totals["prob"] / n
+    avg_market_nv = totals["market_nv"] / n
+
+    # Calibration bins (10 quantile bins), over the bets in their original order
+    rows = np.sort(sums["order"][:n])
+    probs = sums["prob"][rows]
+    y = sums["y"][rows]
     n_bins = min(10, max(2, n // 20))
-    cal_bins = []
-    sorted_idx = np.argsort(probs)
     chunk = max(1, n // n_bins)
-    for i in range(0, n, chunk):
-        sl = sorted_idx[i:i + chunk]
-        if len(sl) == 0:
-            continue
-        p_sl = probs[sl]
-        y_sl = y[sl]
-        cal_bins.append({
-            "bin_lo": round(float(p_sl.min()), 4),
-            "bin_hi": round(float(p_sl.max()), 4),
-            "n": len(sl),
-            "predicted_avg": round(float(p_sl.mean()), 4),
-            "actual_win_rate": round(float(y_sl.mean()), 4),
-            "cal_error": round(abs(float(p_sl.mean()) - float(y_sl.mean())), 4),
-        })
+    sorted_idx = np.argsort(probs)
+    p_sorted, y_sorted = probs[sorted_idx], y[sorted_idx]
+    # Bins are consecutive chunk-sized runs of the sorted bets (the last may be short)
+    starts = np.arange(0, n, chunk)
+    counts = np.diff(np.append(starts, n))
+    pred_avg = np.add.reduceat(p_sorted, starts) / counts
+    actual = np.add.reduceat(y_sorted, starts) / counts
+    cal_bins = [
+        {
+            "bin_lo": round(lo, 4),
+            "bin_hi": round(hi, 4),
+            "n": c,
+            "predicted_avg": round(pa, 4),
+            "actual_win_rate": round(aw, 4),
+            "cal_error": round(abs(pa - aw), 4),
+        }
+        for lo, hi, c, pa, aw in zip(
+            np.minimum.reduceat(p_sorted, starts).tolist(),
+            np.maximum.reduceat(p_sorted, starts).tolist(),
+            counts.tolist(),
+            pred_avg.tolist(),
+            actual.tolist(),
+        )
+    ]
 
     return {
         "n_bets": n,
@@ -203,6 +256,22 @@ def _compute_metrics(bets: pd.DataFrame) -> Dict[str, Any]:
     }
 
 
+def _prefix_metrics_parallel(
+    sums: Dict[str, np.ndarray],
+    sizes: List[int],
+) -> List[Dict[str, Any]]:
+    """_compute_prefix_metrics for each prefix size, in order.
+
+    The per-threshold cost is the calibration argsort, which runs without the
+    GIL, so a thread pool overlaps thresholds when there is more than one core.
+    """
+    workers = min(len(sizes), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_compute_prefix_metrics(sums, n) for n in sizes]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(functools.partial(_compute_prefix_metrics, sums), sizes))
+
+
 # ---------------------------------------------------------------------------
 # Sweep
 # ---------------------------------------------------------------------------
@@ -219,20 +288,19 @@ def run_sweep(
           f"std={work['best_edge'].std():.4f}, "
           f"max={work['best_edge'].max():.4f}")
 
-    results = []
-    for t in thresholds:
-        bets = work[work["best_edge"] >= t]
-        metrics = _compute_metrics(bets)
+    # Thresholds select nested top-edge prefixes: sort once, read metrics off prefix sums
+    sums = _edge_prefix_sums(work)
+    # The last size is the "all games" baseline (threshold=0)
+    sizes = [_n_at_threshold(sums, t) for t in thresholds] + [len(work)]
+    *results, all_metrics = _prefix_metrics_parallel(sums, sizes)
+
+    for t, metrics in zip(thresholds, results):
         metrics["threshold"] = t
-        results.append(metrics)
         print(f"  MIN_EDGE={t:.3f}: n={metrics['n_bets']:5d}, "
               f"WR={metrics.get('win_rate',0):.3f}, "
               f"ROI={metrics.get('roi_pct',0):+.1f}%, "
               f"LL={metrics.get('logloss','n/a')}, "
               f"Brier={metrics.get('brier','n/a')}")
-
-    # Also compute "all games" baseline (threshold=0)
-    all_metrics = _compute_metrics(work)
     all_metrics["threshold"] = 0.0
 
     # Date range
@@ -312,8 +380,7 @@ def _load_baseline(report_dir: str) -> Optional[Dict[str, Any]]:
 def _save_baseline(report_dir: str, report: Dict[str, Any]) -> str:
     """Save current results as the new baseline."""
     path = os.path.join(os.path.dirname(report_dir), BASELINE_FILENAME)
-    with open(path, "w") as f:
-        json.dump(report, f, indent=2)
+    dump_json(report, path)
     return path
 
 
@@ -356,6 +423,22 @@ def _compare_to_baseline(
 # Markdown report
 # ---------------------------------------------------------------------------
 
+_RESULT_ROW_MD = (
+    "| {threshold:.3f} | {n_bets} | {win_rate:.1%} | {roi_pct:+.1f} "
+    "| {avg_edge:.4f} | {avg_prob:.4f} | {brier:.5f} | {logloss:.5f} |"
+)
+_EMPTY_RESULT_ROW_MD = "| {threshold:.3f} | 0 | — | — | — | — | — | — |"
+_CALIBRATION_ROW_MD = (
+    "| {bin_lo:.3f}–{bin_hi:.3f} | {n} | {predicted_avg:.3f} | {actual_win_rate:.3f} | {cal_error:.3f} |"
+)
+_DELTA_KEYS = ("roi", "brier", "logloss", "wr")
+_BASELINE_ROW_MD = (
+    "| {threshold:.3f} | {n_bets_baseline}/{n_bets_current} "
+    "| {roi_arrow}{roi_delta:.1f}pp | {brier_arrow}{brier_delta:.5f} "
+    "| {logloss_arrow}{logloss_delta:.5f} | {wr_arrow}{wr_delta:.3f} |"
+)
+
+
 def _render_markdown(
     report: Dict[str, Any],
     recommendation: Dict[str, Any],
@@ -375,20 +458,10 @@ def _render_markdown(
     lines.append("")
     lines.append("| MIN_EDGE | N Bets | Win Rate | ROI (%) | Avg Edge | Avg Prob | Brier | LogLoss |")
     lines.append("|----------|--------|----------|---------|----------|----------|-------|---------|")
-    for r in report["results"]:
-        if r["n_bets"] == 0:
-            lines.append(f"| {r['threshold']:.3f} | 0 | — | — | — | — | — | — |")
-            continue
-        lines.append(
-            f"| {r['threshold']:.3f} "
-            f"| {r['n_bets']} "
-            f"| {r['win_rate']:.1%} "
-            f"| {r['roi_pct']:+.1f} "
-            f"| {r['avg_edge']:.4f} "
-            f"| {r['avg_prob']:.4f} "
-            f"| {r['brier']:.5f} "
-            f"| {r['logloss']:.5f} |"
-        )
+    lines.extend(
+        (_RESULT_ROW_MD if r["n_bets"] else _EMPTY_RESULT_ROW_MD).format_map(r)
+        for r in report["results"]
+    )
 
     # All-games baseline
     ab = report["all_games_baseline"]
@@ -407,14 +480,7 @@ def _render_markdown(
         lines.append("")
         lines.append("| Bin Range | N | Predicted | Actual | Error |")
         lines.append("|-----------|---|-----------|--------|-------|")
-        for b in rec_result["calibration_bins"]:
-            lines.append(
-                f"| {b['bin_lo']:.3f}–{b['bin_hi']:.3f} "
-                f"| {b['n']} "
-                f"| {b['predicted_avg']:.3f} "
-                f"| {b['actual_win_rate']:.3f} "
-                f"| {b['cal_error']:.3f} |"
-            )
+        lines.extend(map(_CALIBRATION_ROW_MD.format_map, rec_result["calibration_bins"]))
 
     # Baseline comparison
     if baseline_comparison:
@@ -423,19 +489,13 @@ def _render_markdown(
         lines.append("")
         lines.append("| MIN_EDGE | N (base/cur) | ROI Delta | Brier Delta | LL Delta | WR Delta |")
         lines.append("|----------|--------------|-----------|-------------|----------|----------|")
-        for d in baseline_comparison:
-            roi_arrow = "+" if d["roi_delta"] > 0 else ""
-            brier_arrow = "+" if d["brier_delta"] > 0 else ""
-            ll_arrow = "+" if d["logloss_delta"] > 0 else ""
-            wr_arrow = "+" if d["wr_delta"] > 0 else ""
-            lines.append(
-                f"| {d['threshold']:.3f} "
-                f"| {d['n_bets_baseline']}/{d['n_bets_current']} "
-                f"| {roi_arrow}{d['roi_delta']:.1f}pp "
-                f"| {brier_arrow}{d['brier_delta']:.5f} "
-                f"| {ll_arrow}{d['logloss_delta']:.5f} "
-                f"| {wr_arrow}{d['wr_delta']:.3f} |"
-            )
+        lines.extend(
+            _BASELINE_ROW_MD.format_map({
+                **d,
+                **{f"{k}_arrow": "+" if d[f"{k}_delta"] > 0 else "" for k in _DELTA_KEYS},
+            })
+            for d in baseline_comparison
+        )
 
     # Recommendation
     lines.append("")
@@ -504,8 +564,7 @@ def main(
 
     # Save JSON
     json_path = os.path.join(report_dir, "edge_sweep.json")
-    with open(json_path, "w") as f:
-        json.dump(report, f, indent=2)
+    dump_json(report, json_path)
     print(f"\n[edge_sweep] JSON -> {json_path}")
 
     # Save markdown
@@ -2,18 +2,42 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Shared read-only "no injury data" features; providers return this instead of
+# allocating a fresh zero dict per team.
+ZERO_INJURY_FEATURES: Mapping[str, float] = MappingProxyType({
+    "injury_count": 0.0,
+    "injury_impact": 0.0,
+    "star_out": 0.0,
+})
+
+_ZERO_GAME_INJURY_FEATURES: Mapping[str, float] = MappingProxyType({
+    f"{side}_{k}": v for side in ("home", "away") for k, v in ZERO_INJURY_FEATURES.items()
+})
+
+
+def zero_games_injury_frame(n_games: int) -> pd.DataFrame:
+    """Batch counterpart of ZERO_INJURY_FEATURES: an all-zero frame for n games."""
+    import pandas as pd
+
+    return pd.DataFrame(0.0, index=range(n_games), columns=list(_ZERO_GAME_INJURY_FEATURES))
 
 
 class InjuryProvider(ABC):
     """Interface for pluggable injury feature providers.
 
-    Implementations return a dict of numeric features for a given team on a date.
-    Default values should be 0 (no injury impact).
+    Implementations return a mapping of numeric features for a given team on a date.
+    Default values should be 0 (no injury impact). Returned mappings are
+    read-only to callers and may be shared between calls.
     """
 
     @abstractmethod
-    def get_team_injury_features(self, date: str, team: str) -> Dict[str, float]:
+    def get_team_injury_features(self, date: str, team: str) -> Mapping[str, float]:
         """Return injury features for a team on a specific date.
 
         Args:
@@ -30,16 +54,38 @@ class InjuryProvider(ABC):
 
     def get_game_injury_features(
         self, date: str, home_team: str, away_team: str,
-    ) -> Dict[str, float]:
+    ) -> Mapping[str, float]:
         """Return injury features for both teams.
 
-        Returns dict with home_injury_* and away_injury_* prefixes.
+        Returns a mapping with home_injury_* and away_injury_* prefixes.
         """
         home = self.get_team_injury_features(date, home_team)
         away = self.get_team_injury_features(date, away_team)
+        if home is ZERO_INJURY_FEATURES and away is ZERO_INJURY_FEATURES:
+            return _ZERO_GAME_INJURY_FEATURES
         out: Dict[str, float] = {}
         for k, v in home.items():
             out[f"home_{k}"] = v
         for k, v in away.items():
             out[f"away_{k}"] = v
         return out
+
+    def get_games_injury_features(
+        self,
+        dates: Sequence[str],
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+    ) -> pd.DataFrame:
+        """Return injury features for a batch of games, one row per game.
+
+        Columns match the keys of :meth:`get_game_injury_features`, rows follow
+        the input order. The default loops over games; providers backed by a
+        real data source should override this with a single bulk fetch.
+        """
+        import pandas as pd
+
+        rows = [
+            dict(self.get_game_injury_features(d, h, a))
+            for d, h, a in zip(dates, home_teams, away_teams)
+        ]
+        return pd.DataFrame(rows)
@@ -7,13 +7,19 @@ Values:
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 from .base import InjuryProvider
 from .null_provider import NullInjuryProvider
 
 
+@lru_cache(maxsize=1)
 def get_injury_provider() -> InjuryProvider:
-    """Return injury provider based on INJURY_PROVIDER env var."""
+    """Return the cached injury provider selected by the INJURY_PROVIDER env var.
+
+    The env var is read on first call; use ``get_injury_provider.cache_clear()``
+    to pick up a change.
+    """
     provider_name = os.getenv("INJURY_PROVIDER", "null").lower().strip()
 
     if provider_name == "scrape":
@@ -9,18 +9,25 @@ For now, falls back to NullInjuryProvider behavior.
 """
 from __future__ import annotations
 
-from typing import Dict
+from typing import TYPE_CHECKING, Mapping, Sequence
 
-from .base import InjuryProvider
+from .base import ZERO_INJURY_FEATURES, InjuryProvider, zero_games_injury_frame
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ScrapeInjuryProvider(InjuryProvider):
     """Stub: returns zeros until a real data source is wired up."""
 
-    def get_team_injury_features(self, date: str, team: str) -> Dict[str, float]:
+    def get_team_injury_features(self, date: str, team: str) -> Mapping[str, float]:
         # TODO: query injury data source for `team` on `date`
-        return {
-            "injury_count": 0.0,
-            "injury_impact": 0.0,
-            "star_out": 0.0,
-        }
+        return ZERO_INJURY_FEATURES
+
+    def get_games_injury_features(
+        self,
+        dates: Sequence[str],
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+    ) -> pd.DataFrame:
+        return zero_games_injury_frame(len(dates))
@@ -19,10 +19,13 @@ from __future__ import annotations
 import json
 import math
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
 
-import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ---------------------------------------------------------------------------
 # Team geo data
@@ -40,17 +43,45 @@ _TZ_OFFSETS: Dict[str, float] = {
     "America/Los_Angeles": -8,
 }
 
+# Struct-of-arrays view of the geo table, filled by _load_geo: a team's row in
+# _LATS/_LONS/_TZS is _TEAM_IDX[team]. Each array ends with a NaN slot, so
+# index -1 reads as "unknown".
+_TEAM_IDX: Dict[str, int] = {}
+_LATS: np.ndarray = np.full(1, np.nan)
+_LONS: np.ndarray = np.full(1, np.nan)
+_TZS: np.ndarray = np.full(1, np.nan)
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, via orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path) as f:
+            return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())  # orjson.JSONDecodeError subclasses json's
+
 
 def _load_geo() -> Dict[str, Dict[str, Any]]:
-    global _GEO_CACHE
+    global _GEO_CACHE, _TEAM_IDX, _LATS, _LONS, _TZS
     if _GEO_CACHE is not None:
         return _GEO_CACHE
     geo_path = os.path.join(os.path.dirname(__file__), "nba_team_geo.json")
     try:
-        with open(geo_path) as f:
-            _GEO_CACHE = json.load(f)
+        _GEO_CACHE = _read_json(geo_path)
     except (FileNotFoundError, json.JSONDecodeError):
         _GEO_CACHE = {}
+
+    _TEAM_IDX = {team: i for i, team in enumerate(_GEO_CACHE)}
+    _LATS, _LONS, _TZS = (np.full(len(_TEAM_IDX) + 1, np.nan) for _ in range(3))
+    for team, i in _TEAM_IDX.items():
+        info = _GEO_CACHE[team]
+        if "lat" in info and "lon" in info:
+            _LATS[i], _LONS[i] = info["lat"], info["lon"]
+        offset = _TZ_OFFSETS.get(info["tz"]) if "tz" in info else None
+        if offset is not None:
+            _TZS[i] = offset
     return _GEO_CACHE
 
 
@@ -97,121 +128,122 @@ def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     return 2 * R * math.asin(math.sqrt(a))
 
 
-# ---------------------------------------------------------------------------
-# Build per-team game history
-# ---------------------------------------------------------------------------
-
-def _build_team_history(df: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
-    """Build sorted game history per team.
+def haversine_miles_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorized :func:`haversine_miles` over arrays of coordinates.
 
-    Each entry: {date, opponent, is_home, venue_team (team whose city hosts)}.
+    NaN coordinates propagate to NaN distances.
     """
-    history: Dict[str, List[Dict[str, Any]]] = {}
-
-    for _, row in df.iterrows():
-        d = row["date"]
-        home = row["home_team"]
-        away = row["away_team"]
-
-        # Home team plays at home city
-        history.setdefault(home, []).append({
-            "date": d,
-            "opponent": away,
-            "is_home": True,
-            "venue_team": home,
-        })
-        # Away team travels to home team's city
-        history.setdefault(away, []).append({
-            "date": d,
-            "opponent": home,
-            "is_home": False,
-            "venue_team": home,
-        })
-
-    # Sort each team's history by date
-    for team in history:
-        history[team].sort(key=lambda g: g["date"])
-
-    return history
-
-
-def _compute_team_features(
-    team: str,
-    game_date: str,
-    history: List[Dict[str, Any]],
-) -> Dict[str, Any]:
-    """Compute schedule features for one team on a given date.
-
-    Uses games strictly BEFORE game_date.
+    R = 3958.8  # Earth radius in miles
+    lat1, lon1, lat2, lon2 = (np.asarray(x, dtype=np.float64) for x in (lat1, lon1, lat2, lon2))
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = np.radians(lat2 - lat1)
+    dlam = np.radians(lon2 - lon1)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlam / 2) ** 2
+    return 2 * R * np.arcsin(np.sqrt(a))
+
+
+def _team_geo_arrays(teams: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Latitude, longitude and UTC offset per team (NaN where unknown).
+
+    Each array has one extra trailing NaN slot, so an index of -1 ("no
+    previous venue") looks up as unknown.
     """
-    try:
-        gd = datetime.strptime(game_date, "%Y-%m-%d")
-    except (ValueError, TypeError):
-        return _default_features()
+    _load_geo()
+    geo_idx = np.array([_TEAM_IDX.get(team, -1) for team in teams] + [-1], dtype=np.intp)
+    return _LATS[geo_idx], _LONS[geo_idx], _TZS[geo_idx]
 
-    # Filter to games before this date
-    prior = [g for g in history if g["date"] < game_date]
 
-    if not prior:
-        return _default_features()
+# ---------------------------------------------------------------------------
+# Dates
+# ---------------------------------------------------------------------------
 
-    last = prior[-1]
+def _date_ordinal(date_str: Any) -> Optional[int]:
+    """Proleptic ordinal of a YYYY-MM-DD string, or None if it doesn't parse."""
     try:
-        last_date = datetime.strptime(last["date"], "%Y-%m-%d")
+        if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+            # C fast path for the canonical zero-padded form
+            return date.fromisoformat(date_str).toordinal()
+        # strptime also accepts unpadded months/days (2024-1-5)
+        return datetime.strptime(date_str, "%Y-%m-%d").toordinal()
     except (ValueError, TypeError):
-        return _default_features()
+        return None
 
-    rest_days = (gd - last_date).days
 
-    # Back-to-back, 3-in-4, 4-in-6
-    b2b = 1 if rest_days <= 1 else 0
+def _date_ordinals(dates: pd.Series) -> Dict[Any, Optional[int]]:
+    """Parse each distinct date string once: {date_str: ordinal or None}."""
+    return {d: _date_ordinal(d) for d in dates.unique()}
 
-    cutoff_4 = (gd - timedelta(days=3)).strftime("%Y-%m-%d")
-    games_in_4 = sum(1 for g in prior if g["date"] >= cutoff_4)
-    three_in_four = 1 if games_in_4 >= 2 else 0  # this game would be 3rd
 
-    cutoff_6 = (gd - timedelta(days=5)).strftime("%Y-%m-%d")
-    games_in_6 = sum(1 for g in prior if g["date"] >= cutoff_6)
-    four_in_six = 1 if games_in_6 >= 3 else 0
+# ---------------------------------------------------------------------------
+# Per-team schedule features
+# ---------------------------------------------------------------------------
 
-    # Games in last 7 days
-    cutoff_7 = (gd - timedelta(days=7)).strftime("%Y-%m-%d")
-    games_last_7 = sum(1 for g in prior if g["date"] >= cutoff_7)
+# Used when a team has no earlier game in the frame (or the date didn't parse)
+_DEFAULT_REST_DAYS = 3
+_DEFAULT_GAMES_LAST_7 = 2
 
-    # Travel: distance from previous game venue to current game venue
-    # Previous venue = last["venue_team"]'s city
-    prev_venue = last.get("venue_team", "")
-    prev_coords = _team_coords(prev_venue)
 
-    travel_miles = 0.0
-    if prev_coords:
-        # Current venue: we'll set this when we know if this team is home/away
-        # For now, store prev_coords for later
-        pass  # handled in add_schedule_features
+def _team_game_index(
+    day: np.ndarray,
+    valid: np.ndarray,
+    home_id: np.ndarray,
+    away_id: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Sorted (team, date) keys over every team-game with a parseable date.
 
-    # Timezone shift from previous venue
-    prev_tz = _team_tz_offset(prev_venue) if prev_venue else None
+    Each game contributes a home and an away entry. Keys are
+    ``team_id * stride + date_ordinal``, so one sorted array holds every
+    team's history back to back. The sort is stable on entries laid out in
+    row order, so same-day games keep their input order.
 
-    return {
-        "rest_days": rest_days,
-        "back_to_back": b2b,
-        "three_in_four": three_in_four,
-        "four_in_six": four_in_six,
-        "games_last_7": games_last_7,
-        "_prev_venue_team": prev_venue,
-        "_prev_tz": prev_tz,
-    }
+    Returns (keys, day, venue_id, stride), all aligned with the sort order.
+    """
+    team = np.column_stack((home_id, away_id)).ravel()[np.repeat(valid, 2)]
+    game_day = np.repeat(day[valid], 2)
+    venue = np.repeat(home_id[valid], 2)
+
+    stride = int(game_day.max()) + 1 if game_day.size else 1
+    keys = team * stride + game_day
+    order = np.argsort(keys, kind="stable")
+    return keys[order], game_day[order], venue[order], stride
+
+
+def _team_features(
+    index: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+    team_id: np.ndarray,
+    day: np.ndarray,
+    valid: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Schedule features for one side of every game, from games strictly BEFORE its date.
+
+    Every window count is a binary search into the team's block of ``index``.
+    """
+    keys, game_day, venue, stride = index
+    base = team_id * stride
 
+    # Games this team played before today (0 when the date didn't parse)
+    prior_end = np.searchsorted(keys, base + day)
+    n_prior = np.where(valid, prior_end - np.searchsorted(keys, base), 0)
+    has_prior = n_prior > 0
+
+    def games_since(days_back: int) -> np.ndarray:
+        return prior_end - np.searchsorted(keys, base + np.maximum(day - days_back, 0))
+
+    last = np.where(has_prior, prior_end - 1, 0)
+    if keys.size:
+        rest_days = np.where(has_prior, day - game_day[last], _DEFAULT_REST_DAYS)
+        prev_venue = np.where(has_prior, venue[last], -1)
+    else:
+        rest_days = np.full(len(day), _DEFAULT_REST_DAYS)
+        prev_venue = np.full(len(day), -1)
 
-def _default_features() -> Dict[str, Any]:
     return {
-        "rest_days": 3,
-        "back_to_back": 0,
-        "three_in_four": 0,
-        "four_in_six": 0,
-        "games_last_7": 2,
-        "_prev_venue_team": "",
-        "_prev_tz": None,
+        "rest_days": rest_days,
+        "back_to_back": has_prior & (rest_days <= 1),
+        "three_in_four": has_prior & (games_since(3) >= 2),  # this game would be 3rd
+        "four_in_six": has_prior & (games_since(5) >= 3),
+        "games_last_7": np.where(has_prior, games_since(7), _DEFAULT_GAMES_LAST_7),
+        "_prev_venue": prev_venue,
     }
 
 
@@ -227,6 +259,9 @@ def add_schedule_features(df: pd.DataFrame) -> pd.DataFrame:
 
     Safe: defaults to 0 on any error, never raises.
     """
+    # Deferred so importing the module (e.g. for SCHEDULE_FEATURE_COLS) stays cheap
+    import pandas as pd
+
     if df.empty:
         return df
 
@@ -237,60 +272,59 @@ def add_schedule_features(df: pd.DataFrame) -> pd.DataFrame:
         return work
     work["date"] = work["date"].astype(str)
 
-    # Build per-team history
-    history = _build_team_history(work)
-
     # Feature columns to add
     feat_cols = [
         "rest_days", "back_to_back", "three_in_four", "four_in_six",
         "games_last_7", "travel_miles", "tz_shift_hours",
     ]
 
-    # Initialize columns
-    for side in ["home", "away"]:
-        for col in feat_cols:
-            work[f"{side}_{col}"] = 0.0
+    new_cols = [f"{side}_{col}" for side in ["home", "away"] for col in feat_cols]
+    new_cols.append("rest_diff")  # derived
 
-    # Derived columns
-    work["rest_diff"] = 0.0
-
-    for idx, row in work.iterrows():
-        try:
-            home = row["home_team"]
-            away = row["away_team"]
-            game_date = row["date"]
-
-            # Home team features
-            h_feats = _compute_team_features(home, game_date, history.get(home, []))
-            a_feats = _compute_team_features(away, game_date, history.get(away, []))
-
-            for col in ["rest_days", "back_to_back", "three_in_four", "four_in_six", "games_last_7"]:
-                work.at[idx, f"home_{col}"] = h_feats.get(col, 0)
-                work.at[idx, f"away_{col}"] = a_feats.get(col, 0)
-
-            # Travel: from previous venue to THIS game's venue (home team's city)
-            venue_coords = _team_coords(home)
-
-            for side, feats, prefix in [(home, h_feats, "home"), (away, a_feats, "away")]:
-                prev_venue = feats.get("_prev_venue_team", "")
-                prev_coords = _team_coords(prev_venue) if prev_venue else None
-                if prev_coords and venue_coords:
-                    miles = haversine_miles(prev_coords[0], prev_coords[1], venue_coords[0], venue_coords[1])
-                    work.at[idx, f"{prefix}_travel_miles"] = round(miles, 1)
-
-                prev_tz = feats.get("_prev_tz")
-                curr_tz = _team_tz_offset(home)  # venue is home team's city
-                if prev_tz is not None and curr_tz is not None:
-                    work.at[idx, f"{prefix}_tz_shift_hours"] = abs(curr_tz - prev_tz)
-
-            # Rest differential (home advantage in rest)
-            work.at[idx, "rest_diff"] = h_feats.get("rest_days", 0) - a_feats.get("rest_days", 0)
-
-        except Exception:
-            # Safety: never crash, defaults are already 0
-            continue
-
-    return work
+    out: Dict[str, np.ndarray] = {}
+    try:
+        n = len(work)
+        day = work["date"].map(_date_ordinals(work["date"])).to_numpy(dtype=np.float64)
+        valid = ~np.isnan(day)
+        day = np.where(valid, day, 0).astype(np.int64)
+
+        # Integer team ids shared by both sides; ``teams[i]`` is the name for id i
+        team_ids, teams = pd.factorize(
+            pd.concat([work["home_team"], work["away_team"]], ignore_index=True),
+            use_na_sentinel=False,
+        )
+        ids = {"home": team_ids[:n].astype(np.int64), "away": team_ids[n:].astype(np.int64)}
+
+        index = _team_game_index(day, valid, ids["home"], ids["away"])
+        lat, lon, tz = _team_geo_arrays(list(teams))
+        venue = ids["home"]  # this game is played in the home team's city
+
+        for side, team_id in ids.items():
+            feats = _team_features(index, team_id, day, valid)
+            prev = feats.pop("_prev_venue")
+            for col, values in feats.items():
+                out[f"{side}_{col}"] = values
+
+            # Travel: from previous venue to THIS game's venue
+            miles = haversine_miles_vec(lat[prev], lon[prev], lat[venue], lon[venue])
+            out[f"{side}_travel_miles"] = np.where(np.isnan(miles), 0.0, np.round(miles, 1))
+
+            # Timezone shift from previous venue
+            shift = np.abs(tz[venue] - tz[prev])
+            out[f"{side}_tz_shift_hours"] = np.where(np.isnan(shift), 0.0, shift)
+
+        # Rest differential (home advantage in rest)
+        out["rest_diff"] = out["home_rest_days"] - out["away_rest_days"]
+
+    except Exception:
+        # Safety: never crash, every feature falls back to 0
+        out = {}
+
+    # One assign for all feature columns instead of a setitem per column
+    return work.assign(**{
+        col: np.asarray(out[col], dtype=np.float64) if col in out else 0.0
+        for col in new_cols
+    })
 
 
 # ---------------------------------------------------------------------------
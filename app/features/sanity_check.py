@@ -64,7 +64,7 @@ def main():
     provider = get_injury_provider()
     print(f"  Provider: {type(provider).__name__}")
     test = provider.get_game_injury_features("2024-01-01", "Boston Celtics", "Los Angeles Lakers")
-    print(f"  Sample output: {test}")
+    print(f"  Sample output: {dict(test)}")
 
     print("\n" + "=" * 60)
     print("  SANITY CHECK PASSED")
@@ -152,8 +152,9 @@ def score_accounts(
     df = add_derived_features(df)
 
     from app.engine.features import prepare_features
+    from app.engine.predict import base_model_from_calibrated
 
-    model = joblib.load(model_path)
+    model = joblib.load(model_path, mmap_mode="r")
 
     X, _y, feat_names, _meta = prepare_features(
         df, module, fit=False, feature_meta=feature_meta,
@@ -194,7 +195,12 @@ def score_accounts(
     import numpy as _np
     shap_vals_arr = None
     raw_drivers_all: list = []
-    if not os.path.exists(base_model_path):
+    # Prefit-calibrated models carry the base model inside model.joblib
+    if os.path.exists(base_model_path):
+        base_model = joblib.load(base_model_path, mmap_mode="r")
+    else:
+        base_model = base_model_from_calibrated(model)
+    if base_model is None:
         logger.warning(
             "score_accounts: base_model.joblib not found at %s — SHAP drivers disabled. "
             "Retrain the model to generate this artifact.", base_model_path
@@ -205,9 +211,8 @@ def score_accounts(
             "Retrain the model to generate this artifact.", shap_bg_path
         )
 
-    if os.path.exists(base_model_path) and os.path.exists(shap_bg_path):
+    if base_model is not None and os.path.exists(shap_bg_path):
         try:
-            base_model = joblib.load(base_model_path)
             shap_background = _np.load(shap_bg_path)
             explainer = build_explainer(base_model, shap_background)
             shap_vals_arr = compute_shap_values(explainer, X)
@@ -0,0 +1,56 @@
+"""File-writing helpers shared by training, evaluation and experiment scripts."""
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import numpy as np
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` via ``<path>.tmp`` and ``os.replace``.
+
+    Readers never see a partial file. A process that already has the old file
+    open or memory-mapped (model artifacts are loaded with ``mmap_mode="r"``)
+    keeps reading the old inode, instead of having its arrays rewritten or
+    truncated underneath it.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def dump_joblib_atomic(obj: Any, path: str, **kwargs: Any) -> None:
+    """``joblib.dump`` with the same temp-file + rename swap as :func:`write_atomic`."""
+    import joblib
+
+    tmp_path = f"{path}.tmp"
+    joblib.dump(obj, tmp_path, **kwargs)
+    os.replace(tmp_path, path)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for types orjson can't encode: numpy scalars it doesn't
+    know become native numbers, anything else a string."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def json_bytes(obj: Any) -> bytes:
+    """``obj`` as indented JSON bytes. NaN and infinities are written as ``null``."""
+    return orjson.dumps(obj, default=_json_default, option=_JSON_OPTIONS)
+
+
+def dump_json(obj: Any, path: str) -> None:
+    """Write ``obj`` to ``path`` as indented JSON (see :func:`json_bytes`)."""
+    with open(path, "wb") as f:
+        f.write(json_bytes(obj))
@@ -26,6 +26,19 @@ _FORMAT = None         # "joblib" or "json"
 _LOADED = False
 
 
+def _joblib_load(path: str) -> Any:
+    """joblib.load with numpy arrays memory-mapped read-only.
+
+    Repeated reloads then share the file's pages instead of copying arrays
+    onto the heap. Compressed dumps cannot be mapped; load those normally.
+    """
+    import joblib
+    try:
+        return joblib.load(path, mmap_mode="r")
+    except ValueError:
+        return joblib.load(path)
+
+
 def _load_artifacts():
     global _MODEL, _CALIBRATOR, _FEATURES, _FORMAT, _LOADED
     if _LOADED:
@@ -37,8 +50,7 @@ def _load_artifacts():
 
     if os.path.exists(model_joblib):
         try:
-            import joblib
-            _MODEL = joblib.load(model_joblib)
+            _MODEL = _joblib_load(model_joblib)
             print(f"[ml.predict] Loaded model from {model_joblib}")
 
             # Load features from metadata
@@ -49,7 +61,7 @@ def _load_artifacts():
                 _FEATURES = meta.get("features", [])
 
             if os.path.exists(cal_joblib):
-                _CALIBRATOR = joblib.load(cal_joblib)
+                _CALIBRATOR = _joblib_load(cal_joblib)
                 print(f"[ml.predict] Loaded calibrator from {cal_joblib}")
 
             _FORMAT = "joblib"
@@ -86,6 +98,19 @@ def _load_artifacts():
     _LOADED = True  # Don't retry
 
 
+def reload_artifacts() -> bool:
+    """Drop the cached model/calibrator and load them again from disk.
+
+    For callers that retrain in-process or watch the artifact files.
+    Returns True when a model is available after the reload.
+    """
+    global _MODEL, _CALIBRATOR, _FEATURES, _FORMAT, _LOADED
+    _MODEL = _CALIBRATOR = _FEATURES = _FORMAT = None
+    _LOADED = False
+    _load_artifacts()
+    return _MODEL is not None
+
+
 def is_available() -> bool:
     """Check if ML model artifacts are available."""
     _load_artifacts()
@@ -123,28 +148,73 @@ def predict_win_prob(
         return _predict_json(locked_home_nv, locked_away_nv, spread_home_point, is_home)
 
 
-def _predict_joblib(
-    locked_home_nv: float,
-    locked_away_nv: float,
-    is_home: int,
-    structural_features: Optional[Dict[str, float]] = None,
-) -> Optional[float]:
-    """Predict using sklearn joblib artifacts.
+def predict_win_probs(
+    locked_home_nv: np.ndarray,
+    locked_away_nv: np.ndarray,
+    spread_home_point: Optional[np.ndarray] = None,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Batch form of predict_win_prob for many games at once.
 
-    The model is trained on home-win labels with is_home=1 for all rows.
-    It always outputs P(home wins). When is_home=0 (asking for away side),
-    we return 1 - P(home wins).
+    Scores every row with a single model call and returns calibrated
+    (p_home, p_away) arrays, or None if the model is unavailable or the
+    prediction fails. Prefer this over two predict_win_prob calls even for
+    one game: the joblib model scores both sides with one predict_proba.
+    spread_home_point is only used by the legacy JSON model.
     """
-    eps = 1e-6
+    _load_artifacts()
+    if _MODEL is None:
+        return None
 
-    # Always build features from home perspective (matching training)
-    feature_map = {
+    home = np.asarray(locked_home_nv, dtype=np.float64)
+    away = np.asarray(locked_away_nv, dtype=np.float64)
+
+    try:
+        if _FORMAT == "joblib":
+            feature_map = _home_feature_map(home, away)
+            features = _FEATURES or list(feature_map.keys())
+            x = np.empty((len(home), len(features)), dtype=np.float64)
+            for j, f in enumerate(features):
+                x[:, j] = feature_map.get(f, 0.0)
+
+            raw_prob = _MODEL.predict_proba(x)[:, 1]  # P(home wins)
+            p_home = _CALIBRATOR.predict(raw_prob) if _CALIBRATOR is not None else raw_prob
+            p_home = np.clip(p_home, 0.01, 0.99)
+            return p_home, np.clip(1.0 - p_home, 0.01, 0.99)
+
+        # JSON legacy: the model is side-aware, so score home and away rows together
+        n = len(home)
+        spread = (
+            np.zeros(n) if spread_home_point is None
+            else np.asarray(spread_home_point, dtype=np.float64)
+        )
+        probs = _predict_json_batch(
+            np.concatenate([home, home]),
+            np.concatenate([away, away]),
+            np.concatenate([spread, spread]),
+            np.repeat([1.0, 0.0], n),
+        )
+        if probs is None:
+            return None
+        return probs[:n], probs[n:]
+
+    except Exception as e:
+        print(f"[ml.predict] Prediction error: {e}")
+        return None
+
+
+def _home_feature_map(locked_home_nv: Any, locked_away_nv: Any) -> Dict[str, Any]:
+    """Joblib model features, always from the home perspective (matching training).
+
+    Works elementwise, so the values may be floats or equal-length arrays.
+    """
+    eps = 1e-6
+    return {
         "p_home_nv": locked_home_nv,
         "p_away_nv": locked_away_nv,
         "is_home": 1.0,  # Always predict from home perspective
-        "favorite_nv": max(locked_home_nv, locked_away_nv),
-        "underdog_nv": min(locked_home_nv, locked_away_nv),
-        "log_odds_ratio": float(np.log((locked_home_nv + eps) / (locked_away_nv + eps))),
+        "favorite_nv": np.maximum(locked_home_nv, locked_away_nv),
+        "underdog_nv": np.minimum(locked_home_nv, locked_away_nv),
+        "log_odds_ratio": np.log((locked_home_nv + eps) / (locked_away_nv + eps)),
         "snapshot_offset_minutes": 15.0,  # Assume T-15 in production
         # Legacy feature names (for JSON model compat)
         "locked_home_nv": locked_home_nv,
@@ -154,6 +224,21 @@ def _predict_joblib(
         "opponent_nv": locked_away_nv,
     }
 
+
+def _predict_joblib(
+    locked_home_nv: float,
+    locked_away_nv: float,
+    is_home: int,
+    structural_features: Optional[Dict[str, float]] = None,
+) -> Optional[float]:
+    """Predict using sklearn joblib artifacts.
+
+    The model is trained on home-win labels with is_home=1 for all rows.
+    It always outputs P(home wins). When is_home=0 (asking for away side),
+    we return 1 - P(home wins).
+    """
+    feature_map = _home_feature_map(locked_home_nv, locked_away_nv)
+
     # Structural features default to 0.0 (safe for production)
     if structural_features:
         feature_map.update(structural_features)
@@ -218,3 +303,41 @@ def _predict_json(
         return float(np.clip(calibrated, 0.01, 0.99))
 
     return float(np.clip(raw_prob, 0.01, 0.99))
+
+
+def _predict_json_batch(
+    locked_home_nv: np.ndarray,
+    locked_away_nv: np.ndarray,
+    spread_home_point: np.ndarray,
+    is_home: np.ndarray,
+) -> Optional[np.ndarray]:
+    """Vectorized _predict_json over aligned arrays (legacy path)."""
+    model_info = _MODEL.get("model", {})
+    features = model_info.get("features", [])
+    coef = model_info.get("coefficients", [])
+    intercept = model_info.get("intercept", 0.0)
+
+    if not coef or not features:
+        return None
+
+    home_side = is_home == 1
+    feature_map = {
+        "locked_home_nv": locked_home_nv,
+        "locked_away_nv": locked_away_nv,
+        "spread_home_point": spread_home_point,
+        "is_home": is_home,
+        "selected_nv": np.where(home_side, locked_home_nv, locked_away_nv),
+        "opponent_nv": np.where(home_side, locked_away_nv, locked_home_nv),
+    }
+
+    x = np.empty((len(is_home), len(features)), dtype=np.float64)
+    for j, f in enumerate(features):
+        x[:, j] = feature_map.get(f, 0.0)
+    logit = x @ np.asarray(coef, dtype=np.float64) + intercept
+    raw_prob = 1.0 / (1.0 + np.exp(-logit))
+
+    if _CALIBRATOR is not None and isinstance(_CALIBRATOR, dict):
+        from .calibrate import apply_calibrator
+        raw_prob = apply_calibrator(_CALIBRATOR, raw_prob)
+
+    return np.clip(raw_prob, 0.01, 0.99)
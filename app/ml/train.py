@@ -24,10 +24,10 @@ import sys
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-import joblib
 import numpy as np
 import pandas as pd
 
+from ..io_utils import dump_joblib_atomic
 from .calibrate import fit_calibrator, apply_calibrator, save_calibrator
 from ..features.nba_schedule_features import add_schedule_features, SCHEDULE_FEATURE_COLS
 from ..features.injuries.factory import get_injury_provider
@@ -124,13 +124,15 @@ def _add_structural_features(df: pd.DataFrame) -> pd.DataFrame:
         for col in injury_cols:
             work[col] = 0.0
 
-        for idx, row in work.iterrows():
-            feats = provider.get_game_injury_features(
-                str(row["date"]), str(row["home_team"]), str(row["away_team"]),
-            )
-            for k, v in feats.items():
-                if k in work.columns:
-                    work.at[idx, k] = v
+        # One batch call for every game, then a column-wise write back
+        feats = provider.get_games_injury_features(
+            work["date"].map(str).tolist(),
+            work["home_team"].map(str).tolist(),
+            work["away_team"].map(str).tolist(),
+        )
+        for k in feats.columns:
+            if k in work.columns:
+                work[k] = feats[k].to_numpy(dtype=np.float64)
 
         nonzero = sum(1 for col in injury_cols if work[col].sum() > 0)
         print(f"[train] Added injury features ({nonzero}/{len(injury_cols)} cols have data)")
@@ -359,11 +361,11 @@ def train(
     os.makedirs("artifacts", exist_ok=True)
 
     model_path = "artifacts/ml_model.joblib"
-    joblib.dump(model, model_path)
+    dump_joblib_atomic(model, model_path)
     print(f"\n[train] Saved model -> {model_path}")
 
     cal_path = "artifacts/ml_calibrator.joblib"
-    joblib.dump(calibrator, cal_path)
+    dump_joblib_atomic(calibrator, cal_path)
     print(f"[train] Saved calibrator -> {cal_path}")
 
     # Also save JSON calibrator for backward compat with existing predict.py JSON loader
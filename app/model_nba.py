@@ -108,7 +108,7 @@ def good_bet_prob_from_edge(edge: float) -> float:
 def _try_ml_reco(game: GameIn) -> Optional[dict]:
     """Try the trained ML probability model. Returns pick dict or None if unavailable."""
     try:
-        from .ml.predict import is_available, predict_win_prob
+        from .ml.predict import is_available, predict_win_probs
     except ImportError:
         return None
 
@@ -128,22 +128,11 @@ def _try_ml_reco(game: GameIn) -> Optional[dict]:
     if game.odds.spread and game.odds.spread.home and game.odds.spread.home.point is not None:
         sp_point = float(game.odds.spread.home.point)
 
-    # Predict for both sides, pick the higher probability
-    p_home = predict_win_prob(
-        locked_home_nv=p_home_nv,
-        locked_away_nv=p_away_nv,
-        spread_home_point=sp_point,
-        is_home=1,
-    )
-    p_away = predict_win_prob(
-        locked_home_nv=p_home_nv,
-        locked_away_nv=p_away_nv,
-        spread_home_point=sp_point,
-        is_home=0,
-    )
-
-    if p_home is None or p_away is None:
+    # Predict for both sides in one model call, pick the higher probability
+    probs = predict_win_probs([p_home_nv], [p_away_nv], spread_home_point=[sp_point])
+    if probs is None:
         return None
+    p_home, p_away = float(probs[0][0]), float(probs[1][0])
 
     # Pick side with higher win probability
     if p_home >= p_away:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from app.engine.config import CHURN_MODULE, ModuleConfig
@@ -130,6 +131,18 @@ def compute_renewal_window_label(days_until_renewal: float) -> str:
     return ">90d"
 
 
+RENEWAL_WINDOW_LABELS: List[str] = ["<30d", "30-90d", ">90d", "unknown"]
+_RENEWAL_WINDOW_EDGES = np.array([30.0, 90.0])
+
+
+def compute_renewal_window_codes(days_until_renewal: np.ndarray) -> np.ndarray:
+    """Vectorized renewal window as indexes into RENEWAL_WINDOW_LABELS."""
+    days = np.asarray(days_until_renewal, dtype=float)
+    codes = np.searchsorted(_RENEWAL_WINDOW_EDGES, days, side="left")
+    codes[np.isnan(days)] = 3
+    return codes
+
+
 def compute_recommended_action(
     churn_risk_pct: float,
     renewal_window_label: str,
@@ -0,0 +1,101 @@
+"""Tests for the CLV filter sweep experiment."""
+import math
+import os
+
+from app.experiments.clv_filter_sweep import (
+    FILTERS, _compute_filter_metrics, _filter_columns, _filter_mask, _index_results,
+)
+
+
+def _sample():
+    features = [
+        {"clv_prob": 0.02, "steam_15m": 0.01, "range_30m": 0.01, "snap_gap_close_sec": 60.0},
+        {"clv_prob": -0.01, "steam_15m": -0.002, "range_30m": 0.04, "snap_gap_close_sec": 200.0},
+        {"clv_prob": None, "steam_15m": None, "range_30m": None, "snap_gap_close_sec": None},
+        {"clv_prob": math.nan, "steam_15m": 0.0, "range_30m": 0.025},
+    ]
+    picks = [{"event_id": "a"}, {"event_id": "b"}, {"event_id": "c"}, {"event_id": 4}]
+    results = [
+        {"event_id": "a", "units": 5.0, "result": "win"},
+        {"event_id": "a", "units": 0.91, "result": "win"},
+        {"event_id": "b", "units": "-1", "result": "loss"},
+        {"event_id": "c", "units": "n/a", "result": "win"},
+        {"event_id": 4, "units": None, "result": "win"},
+    ]
+    return features, picks, _index_results(results)
+
+
+# ---------------------------------------------------------------------------
+# Filter metrics
+# ---------------------------------------------------------------------------
+
+def test_filter_metrics():
+    cols = _filter_columns(*_sample())
+    masks = {name: _filter_mask(cols, *spec) for name, *spec in FILTERS}
+
+    base = _compute_filter_metrics(cols, masks["baseline"])
+    assert base == {
+        "n": 4, "n_with_clv": 2, "mean_clv": 0.005, "pct_positive_clv": 50.0,
+        "n_graded": 2, "wins": 1, "win_rate": 50.0, "units": -0.09, "roi_pct": -4.5,
+    }
+
+    steam = _compute_filter_metrics(cols, masks["steam_15m >= 0"])
+    assert (steam["n"], steam["n_with_clv"], steam["n_graded"]) == (2, 1, 1)
+
+    assert _compute_filter_metrics(cols, masks["snap_gap_close <= 120s"])["n"] == 1
+    assert _compute_filter_metrics(cols, masks["clv_prob > 0.01"])["wins"] == 1
+    assert _compute_filter_metrics(cols, cols["units"] > 5) == {"n": 0}
+
+
+# ---------------------------------------------------------------------------
+# Feature cache
+# ---------------------------------------------------------------------------
+
+def test_feature_cache_reuses_features_by_pick_id(tmp_path, monkeypatch):
+    from app.experiments import clv_filter_sweep as sweep
+
+    calls = []
+
+    def fake_compute_batch(picks, closing):
+        calls.append(len(picks))
+        return [{"pick": p["id"]} for p in picks], {"total": len(picks)}
+
+    monkeypatch.setattr(sweep, "compute_batch", fake_compute_batch)
+    monkeypatch.setattr(sweep, "FEATURE_CACHE_DIR", str(tmp_path))
+    picks = [{"id": i, "event_id": "e1"} for i in range(3)]
+    closing = {"e1": [{"captured_at": "2025-01-01T00:00:00Z"}]}
+
+    first = sweep._compute_features_cached(picks, closing)
+    again = sweep._compute_features_cached(picks[::-1], closing)
+    assert calls == [3]
+    assert again == (first[0][::-1], first[1])
+
+    closing["e1"].append({"captured_at": "2025-01-01T00:05:00Z"})
+    sweep._compute_features_cached(picks, closing)
+    sweep._compute_features_cached(picks, closing, use_cache=False)
+    assert calls == [3, 3, 3]
+
+
+def test_feature_cache_key_and_pruning(tmp_path, monkeypatch):
+    from app.experiments import clv_filter_sweep as sweep
+
+    monkeypatch.setattr(sweep, "compute_batch", lambda picks, closing: ([{}] * len(picks), {}))
+    monkeypatch.setattr(sweep, "FEATURE_CACHE_DIR", str(tmp_path))
+    picks = [{"id": 1, "event_id": "e1"}]
+    closing = {"e1": [{"captured_at": "2025-01-01T00:00:00Z"}]}
+    path = sweep._features_cache_path(picks, closing)
+
+    # Lines for events nobody picked don't change the key
+    closing["e2"] = [{"captured_at": "2025-01-01T00:00:00Z"}]
+    assert sweep._features_cache_path(picks, closing) == path
+
+    # Editing the feature code does
+    monkeypatch.setattr(sweep, "_feature_code_digest", lambda: "edited")
+    assert sweep._features_cache_path(picks, closing) != path
+
+    # Writing a new entry drops the old one
+    sweep._compute_features_cached(picks, closing)
+    first = os.listdir(tmp_path)
+    sweep._compute_features_cached([{"id": 2, "event_id": "e1"}], closing)
+    assert len(os.listdir(tmp_path)) == 1 and os.listdir(tmp_path) != first
+
@@ -0,0 +1,88 @@
+"""Tests for the MIN_EDGE threshold sweep experiment."""
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.agents._math import american_profit, american_profit_array
+from app.experiments.edge_sweep import (
+    _compute_metrics, _compute_prefix_metrics, _edge_prefix_sums, _n_at_threshold,
+    _prefix_metrics_parallel,
+)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def _random_bets(seed: int, n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    odds = rng.choice([-250.0, -150.0, -110.0, 105.0, 140.0, 220.0], n)
+    return pd.DataFrame({
+        "best_won": (rng.random(n) < 0.5).astype(int),
+        "best_prob": np.round(rng.uniform(0.3, 0.8, n), 2),  # rounding forces ties
+        "best_edge": np.round(rng.normal(0.02, 0.02, n), 3),
+        "best_market_nv": rng.uniform(0.3, 0.7, n),
+        "best_odds": odds,
+        "best_profit": american_profit_array(odds),
+    })
+
+
+def test_american_profit_array_matches_scalar():
+    odds = np.array([-110, -250, 100, 150, 135.0, 0, np.nan, np.inf, -0.5])
+    assert american_profit_array(odds).tolist() == [american_profit(o) for o in odds]
+
+
+def test_compute_metrics_units():
+    odds = np.array([-110.0, 150.0, -200.0, 120.0])
+    bets = pd.DataFrame({
+        "best_won": [1, 1, 0, 0],
+        "best_prob": [0.6, 0.45, 0.7, 0.5],
+        "best_edge": [0.02, 0.03, 0.01, 0.05],
+        "best_market_nv": [0.55, 0.4, 0.66, 0.45],
+        "best_odds": odds,
+        "best_profit": american_profit_array(odds),
+    })
+    m = _compute_metrics(bets)
+    assert (m["n_bets"], m["wins"], m["win_rate"]) == (4, 2, 0.5)
+    assert m["units"] == round(100 / 110 + 1.5 - 2, 2)
+    assert _compute_metrics(bets.iloc[:0]) == {"n_bets": 0}
+
+
+def test_prefix_metrics_match_filtered_frame():
+    bets = _random_bets(0)
+    sums = _edge_prefix_sums(bets)
+    for t in [-1.0, 0.0, 0.01, 0.02, 0.035, 0.5]:
+        subset = bets[bets["best_edge"] >= t]
+        n = _n_at_threshold(sums, t)
+        assert n == len(subset)
+
+        expected = _compute_metrics(subset)
+        actual = _compute_prefix_metrics(sums, n)
+        assert actual.pop("calibration_bins", []) == expected.pop("calibration_bins", [])
+        for key, value in expected.items():
+            assert actual[key] == pytest.approx(value, abs=1e-4)
+
+
+def test_calibration_bins_are_sorted_chunks():
+    bets = _random_bets(1, n=45)
+    bins = _compute_metrics(bets)["calibration_bins"]
+    assert [b["n"] for b in bins] == [22, 22, 1]  # n_bins=2 -> chunk of 22 plus the remainder
+
+    order = np.argsort(bets["best_prob"].to_numpy())
+    probs = bets["best_prob"].to_numpy()[order]
+    won = bets["best_won"].to_numpy()[order]
+    assert bins[0]["bin_lo"] == probs[0] and bins[-1]["bin_hi"] == probs[-1]
+    assert bins[1]["predicted_avg"] == round(probs[22:44].mean(), 4)
+    assert bins[1]["actual_win_rate"] == round(won[22:44].mean(), 4)
+
+
+def test_prefix_metrics_parallel_keeps_order():
+    sums = _edge_prefix_sums(_random_bets(2))
+    sizes = [300, 0, 120, 45, 7]
+    serial = [_compute_prefix_metrics(sums, n) for n in sizes]
+    with mock.patch("os.cpu_count", return_value=1):
+        assert _prefix_metrics_parallel(sums, sizes) == serial
+    with mock.patch("os.cpu_count", return_value=4):
+        assert _prefix_metrics_parallel(sums, sizes) == serial
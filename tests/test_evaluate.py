@@ -0,0 +1,61 @@
+"""Tests for the evaluation metric helpers."""
+import numpy as np
+import pytest
+from sklearn.metrics import confusion_matrix, f1_score, precision_recall_curve
+
+from app.engine.evaluate import _optimal_f1_threshold
+
+
+def _random_case(seed: int):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(20, 300))
+    probs = np.round(rng.random(n), 2)  # rounding forces tied probabilities
+    y = (rng.random(n) < probs).astype(int)
+    return probs, y
+
+
+# ---------------------------------------------------------------------------
+# Optimal F1 threshold
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("seed", range(10))
+def test_optimal_f1_matches_sklearn(seed):
+    probs, y = _random_case(seed)
+    threshold, (tn, fp, fn, tp) = _optimal_f1_threshold(probs, y)
+
+    pr, rc, _ = precision_recall_curve(y, probs)
+    denom = pr[:-1] + rc[:-1]
+    f1_curve = np.divide(2 * pr[:-1] * rc[:-1], denom, out=np.zeros_like(denom), where=denom > 0)
+
+    preds = (probs >= threshold).astype(int)
+    assert f1_score(y, preds) == pytest.approx(f1_curve.max())
+    assert confusion_matrix(y, preds, labels=[0, 1]).ravel().tolist() == [tn, fp, fn, tp]
+
+
+def test_optimal_f1_no_positives_defaults_to_half():
+    probs = np.array([0.1, 0.6, 0.7, 0.2])
+    y = np.zeros(4, dtype=int)
+    threshold, counts = _optimal_f1_threshold(probs, y)
+    assert threshold == 0.5
+    assert counts == (2, 2, 0, 0)
+
+
+# ---------------------------------------------------------------------------
+# Lift table
+# ---------------------------------------------------------------------------
+
+def test_lift_table_deciles():
+    from app.engine.evaluate import _compute_lift_table
+
+    probs = np.linspace(0.99, 0.0, 200)
+    y = np.zeros(200, dtype=int)
+    y[:20] = 1  # every positive sits in the top decile
+    table = _compute_lift_table(probs, y)
+
+    assert [row["decile"] for row in table] == list(range(1, 11))
+    assert all(row["n"] == 20 for row in table)
+    assert table[0]["actual_rate"] == 1.0
+    assert table[0]["lift"] == 10.0
+    assert table[0]["cumulative_capture"] == 1.0
+    assert table[-1]["cumulative_capture"] == 1.0
+    assert isinstance(table[0]["decile"], int)
@@ -0,0 +1,45 @@
+"""Tests for feature preparation."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.engine.config import CHURN_MODULE
+from app.engine.features import prepare_features
+from app.engine.sample_data import generate_churn_dataset
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    df = generate_churn_dataset(n=300, seed=7)
+    df["signup_date"] = pd.date_range("2022-01-01", periods=len(df), freq="2D").strftime("%Y-%m-%d")
+    df.loc[::5, "nps_score"] = np.nan
+    df.loc[::9, "plan"] = None
+    _, _, _, meta = prepare_features(df, CHURN_MODULE, fit=True)
+    # Round-trip through JSON as train_model does when persisting feature_meta
+    return df, json.loads(json.dumps(meta))
+
+
+# ---------------------------------------------------------------------------
+# Inference recipe
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("rows", [slice(None), slice(10, 60)])
+def test_recipe_matches_generic_path(fitted, rows):
+    df, meta = fitted
+    batch = df.iloc[rows]
+    generic_meta = {k: v for k, v in meta.items() if k != "inference_recipe"}
+
+    X_fast, y_fast, names_fast, _ = prepare_features(batch, CHURN_MODULE, fit=False, feature_meta=meta)
+    X_slow, y_slow, names_slow, _ = prepare_features(batch, CHURN_MODULE, fit=False, feature_meta=generic_meta)
+
+    assert names_fast == names_slow
+    np.testing.assert_array_equal(X_fast, X_slow)
+    np.testing.assert_array_equal(y_fast, y_slow)
+
+
+def test_recipe_missing_numeric_column_falls_back(fitted):
+    df, meta = fitted
+    _, _, names, _ = prepare_features(df.drop(columns=["seats"]), CHURN_MODULE, fit=False, feature_meta=meta)
+    assert "seats" not in names
@@ -0,0 +1,54 @@
+"""Tests for the pluggable injury feature providers."""
+import pytest
+
+from app.features.injuries.base import ZERO_INJURY_FEATURES, InjuryProvider
+from app.features.injuries.null_provider import NullInjuryProvider
+
+
+class _FixedProvider(InjuryProvider):
+    """Two players out for Boston, nobody else."""
+
+    def get_team_injury_features(self, date, team):
+        if team == "Boston Celtics":
+            return {"injury_count": 2.0, "injury_impact": 0.4, "star_out": 1.0}
+        return ZERO_INJURY_FEATURES
+
+
+# ---------------------------------------------------------------------------
+# Game features
+# ---------------------------------------------------------------------------
+
+def test_null_provider_shares_read_only_zeros():
+    provider = NullInjuryProvider()
+    game = provider.get_game_injury_features("2024-01-01", "Boston Celtics", "Miami Heat")
+
+    assert game is provider.get_game_injury_features("2024-01-02", "Utah Jazz", "Miami Heat")
+    assert dict(game) == {
+        "home_injury_count": 0.0, "home_injury_impact": 0.0, "home_star_out": 0.0,
+        "away_injury_count": 0.0, "away_injury_impact": 0.0, "away_star_out": 0.0,
+    }
+    with pytest.raises(TypeError):
+        game["home_star_out"] = 1.0
+
+
+def test_game_features_prefix_each_side():
+    game = _FixedProvider().get_game_injury_features("2024-01-01", "Miami Heat", "Boston Celtics")
+    assert game["home_injury_count"] == 0.0
+    assert game["away_injury_count"] == 2.0
+    assert game["away_star_out"] == 1.0
+
+
+# ---------------------------------------------------------------------------
+# Batch features
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("provider", [_FixedProvider(), NullInjuryProvider()])
+def test_batch_matches_per_game(provider):
+    games = [
+        ("2024-01-01", "Boston Celtics", "Miami Heat"),
+        ("2024-01-02", "Utah Jazz", "Boston Celtics"),
+        ("2024-01-02", "Miami Heat", "Utah Jazz"),
+    ]
+    frame = provider.get_games_injury_features(*zip(*games))
+
+    assert frame.to_dict("records") == [dict(provider.get_game_injury_features(*g)) for g in games]
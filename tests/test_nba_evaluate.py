@@ -0,0 +1,126 @@
+"""Tests for the NBA pick grading harness."""
+import random
+
+import pytest
+
+from app.evaluate import _record, build_report, grade_pick, grade_picks
+
+TEAMS = ["Boston Celtics", "Los Angeles Lakers", "Miami Heat", "Denver Nuggets"]
+
+
+def _random_slate(seed: int, n: int = 400):
+    rnd = random.Random(seed)
+    results = {}
+    for g in range(n // 4):
+        home, away = rnd.sample(TEAMS, 2)
+        final = rnd.random() < 0.9
+        hs = rnd.randint(95, 125) if final else None
+        spread = rnd.choice([-7.5, -3.5, -3.0, 0.0, 3.0, 3.5, 7.5, None])
+        results[f"ev{g}"] = {
+            "event_id": f"ev{g}",
+            "home_team": home,
+            "away_team": away,
+            "home_score": hs,
+            "away_score": (hs if rnd.random() < 0.1 else rnd.randint(95, 125)) if final else None,
+            "closing_ml_home": rnd.choice([-150, -110, 0, 120, "135", None]),
+            "closing_ml_away": rnd.choice([-130, 100, 140, None]),
+            "closing_spread_home_point": spread,
+            "closing_spread_home_price": rnd.choice([-110, -105, None]),
+            "closing_spread_away_point": -spread if spread is not None else None,
+            "closing_spread_away_price": rnd.choice([-110, -115.5, None]),
+        }
+    picks = []
+    for _ in range(n):
+        eid = f"ev{rnd.randrange(n // 4 + 10)}"
+        result = results.get(eid, {"home_team": "Nobody", "away_team": "Else"})
+        picks.append({
+            "event_id": eid,
+            "market": rnd.choice(["moneyline", "spread", "total", "prop"]),
+            "tier": rnd.choice(["top_pick", "strong_lean", None]),
+            "side": rnd.choice(["home", "away", None]),
+            "score": rnd.randint(40, 90),
+            "confidence": rnd.random(),
+            "run_date": "2025-01-01",
+            "selection_team": rnd.choice([
+                result["home_team"], result["away_team"], result["home_team"].split()[-1], None,
+            ]),
+        })
+    return picks, results
+
+
+# ---------------------------------------------------------------------------
+# Grading
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grade_picks_matches_grade_pick(seed):
+    picks, results = _random_slate(seed)
+    expected = []
+    for p in picks:
+        r = results.get(str(p["event_id"]))
+        g = grade_pick(p, r) if r else None
+        if g is not None:
+            expected.append(g)
+
+    graded, ungraded = grade_picks(picks, results)
+
+    assert graded == expected
+    assert ungraded == len(picks) - len(expected)
+    assert {g["outcome"] for g in graded} == {"win", "loss", "push"}
+
+
+def test_grade_picks_without_results():
+    picks, _ = _random_slate(0, n=20)
+    assert grade_picks(picks, {}) == ([], 20)
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def test_build_report_groups_match_record():
+    picks, results = _random_slate(3)
+    graded, _ = grade_picks(picks, results)
+    rpt = build_report(graded, days=30)
+
+    assert rpt["overall"] == _record(graded)
+    for mkt, rec in rpt["by_market"].items():
+        assert rec == _record([g for g in graded if str(g["market"]) == mkt])
+    for tier, rec in rpt["by_tier"].items():
+        assert rec == _record([g for g in graded if str(g["tier"]) == tier])
+    for mkt, subs in rpt["by_market_tier"].items():
+        assert list(subs) == sorted(subs)
+        for tier, rec in subs.items():
+            rows = [g for g in graded if str(g["market"]) == mkt and str(g["tier"]) == tier]
+            assert rec == _record(rows)
+    assert list(rpt["by_market"]) == ["moneyline", "spread"]
+
+
+def test_calibration_bins_equal_count_chunks():
+    from app.evaluate import _calibration_bins
+
+    rows = [{"confidence": c / 100, "outcome": "win" if c >= 50 else "loss"} for c in range(100)]
+    rows += [{"confidence": None, "outcome": "win"}, {"confidence": 0.5, "outcome": "push"}]
+    bins = _calibration_bins(rows, n_bins=4)
+
+    assert [b["n"] for b in bins] == [25, 25, 25, 25]
+    assert [b["actual_win_rate"] for b in bins] == [0.0, 0.0, 1.0, 1.0]
+    assert bins[0]["bin_lo"] == 0.0 and bins[-1]["bin_hi"] == 0.99
+    assert bins[1]["predicted_avg"] == 0.37
+    assert _calibration_bins([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Supabase filters
+# ---------------------------------------------------------------------------
+
+def test_in_filter_quotes_values(monkeypatch):
+    import app.evaluate as ev
+
+    assert ev._in_filter(["401", "a,b", "x(1).y", 'q"t']) == 'in.("401","a,b","x(1).y","q\\"t")'
+
+    def no_request(*args, **kwargs):
+        raise AssertionError("no request expected for an empty id list")
+
+    monkeypatch.setattr(ev, "_sb_request", no_request)
+    assert ev._sb_get_in("/rest/v1/game_results", {}, "event_id", []) == []
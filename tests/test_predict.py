@@ -0,0 +1,93 @@
+"""Tests for prediction-time helpers."""
+import numpy as np
+import pytest
+
+from app.engine.config import CHURN_MODULE
+
+
+# ---------------------------------------------------------------------------
+# Tier classification
+# ---------------------------------------------------------------------------
+
+def test_classify_codes_match_scalar_classify():
+    tiers = CHURN_MODULE.tiers
+    probs = np.array([
+        0.0, 0.05, tiers.medium_threshold - 1e-9, tiers.medium_threshold,
+        0.25, tiers.high_threshold - 1e-9, tiers.high_threshold, 0.95, 1.0,
+    ])
+    labels = np.array(tiers.labels, dtype=object)
+    assert labels[tiers.classify_codes(probs)].tolist() == [tiers.classify(p) for p in probs]
+
+
+# ---------------------------------------------------------------------------
+# Renewal window labels
+# ---------------------------------------------------------------------------
+
+def test_renewal_window_codes_match_scalar():
+    from app.modules.churn.adapter import (
+        RENEWAL_WINDOW_LABELS, compute_renewal_window_codes, compute_renewal_window_label,
+    )
+
+    days = np.array([-30, 0, 29.5, 30, 30.01, 90, 90.5, 400, np.nan])
+    expected = [compute_renewal_window_label(d) for d in days]
+    labels = np.array(RENEWAL_WINDOW_LABELS, dtype=object)
+    assert labels[compute_renewal_window_codes(days)].tolist() == expected
+
+
+# ---------------------------------------------------------------------------
+# Base model extraction
+# ---------------------------------------------------------------------------
+
+def test_base_model_from_calibrated():
+    from sklearn.calibration import CalibratedClassifierCV
+    from sklearn.frozen import FrozenEstimator
+    from sklearn.linear_model import LogisticRegression
+
+    from app.engine.predict import base_model_from_calibrated
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] + rng.normal(size=200) > 0).astype(int)
+    base = LogisticRegression().fit(X[:150], y[:150])
+
+    prefit = CalibratedClassifierCV(FrozenEstimator(base), ensemble=False).fit(X[150:], y[150:])
+    assert base_model_from_calibrated(prefit) is base
+
+    cv = CalibratedClassifierCV(LogisticRegression(), cv=3).fit(X, y)
+    assert base_model_from_calibrated(cv) is None
+
+
+# ---------------------------------------------------------------------------
+# NBA win probability batch
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("fmt", ["joblib", "json"])
+def test_predict_win_probs_matches_scalar(monkeypatch, fmt):
+    from sklearn.isotonic import IsotonicRegression
+    from sklearn.linear_model import LogisticRegression
+
+    from app.ml import predict
+
+    rng = np.random.default_rng(1)
+    home = rng.uniform(0.1, 0.9, 60)
+    away = 1.0 - home
+    if fmt == "joblib":
+        features = ["p_home_nv", "is_home", "favorite_nv", "log_odds_ratio", "home_rest_days"]
+        X = np.column_stack([home, np.ones(60), np.maximum(home, away), np.log(home / away), np.zeros(60)])
+        y = (rng.random(60) < home).astype(int)
+        model = LogisticRegression().fit(X, y)
+        calibrator = IsotonicRegression(out_of_bounds="clip").fit(model.predict_proba(X)[:, 1], y)
+    else:
+        features = ["selected_nv", "opponent_nv", "is_home"]
+        model = {"model": {"features": features, "coefficients": [3.0, -2.5, 0.2], "intercept": -0.1}}
+        calibrator = None
+    monkeypatch.setattr(predict, "_MODEL", model)
+    monkeypatch.setattr(predict, "_CALIBRATOR", calibrator)
+    monkeypatch.setattr(predict, "_FEATURES", features)
+    monkeypatch.setattr(predict, "_FORMAT", fmt)
+    monkeypatch.setattr(predict, "_LOADED", True)
+
+    p_home, p_away = predict.predict_win_probs(home, away)
+    for i in range(60):
+        assert p_home[i] == pytest.approx(predict.predict_win_prob(home[i], away[i], is_home=1))
+        assert p_away[i] == pytest.approx(predict.predict_win_prob(home[i], away[i], is_home=0))
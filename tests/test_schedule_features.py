@@ -0,0 +1,59 @@
+"""Tests for the NBA schedule feature builder."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.features.nba_schedule_features import (
+    add_schedule_features,
+    haversine_miles,
+    haversine_miles_vec,
+)
+
+BOS = (42.366, -71.062)
+LAL = (34.043, -118.267)
+MIA = (25.781, -80.187)
+
+
+# ---------------------------------------------------------------------------
+# Haversine
+# ---------------------------------------------------------------------------
+
+def test_haversine_vec_matches_scalar():
+    pairs = [(BOS, LAL), (LAL, MIA), (MIA, BOS), (BOS, BOS)]
+    lat1, lon1 = np.array([p for p, _ in pairs]).T
+    lat2, lon2 = np.array([q for _, q in pairs]).T
+    miles = haversine_miles_vec(lat1, lon1, lat2, lon2)
+
+    expected = [haversine_miles(*p, *q) for p, q in pairs]
+    assert miles.tolist() == pytest.approx(expected, rel=1e-12)
+    assert miles[-1] == 0.0
+    assert np.isnan(haversine_miles_vec([np.nan], [0.0], [1.0], [1.0])[0])
+
+
+# ---------------------------------------------------------------------------
+# Schedule features
+# ---------------------------------------------------------------------------
+
+def test_rest_and_density_counts():
+    games = pd.DataFrame({
+        "date": ["2024-01-01", "2024-01-02", "2024-01-04", "2024-01-05", "2024-01-05", "bad-date"],
+        "home_team": ["Boston Celtics", "Miami Heat", "Boston Celtics", "Boston Celtics", "Miami Heat",
+                      "Boston Celtics"],
+        "away_team": ["Miami Heat", "Boston Celtics", "Los Angeles Lakers", "Miami Heat",
+                      "Los Angeles Lakers", "Miami Heat"],
+    })
+    out = add_schedule_features(games)
+
+    # Boston: 01-01, 01-02 (@MIA), 01-04, then two games on 01-05
+    assert out["home_rest_days"].tolist()[:4] == [3.0, 1.0, 2.0, 1.0]
+    assert out["away_rest_days"].tolist()[1] == 1.0
+    assert out["home_back_to_back"].tolist()[:4] == [0.0, 1.0, 0.0, 1.0]
+    assert out.loc[3, "home_three_in_four"] == 1.0  # 01-02 and 01-04 inside 4 days
+    assert out.loc[3, "home_games_last_7"] == 3.0
+    assert out.loc[3, "rest_diff"] == -2.0  # Miami last played 01-02
+    # Miami flew home from Boston, then back to Boston
+    assert out.loc[1, "home_travel_miles"] == round(haversine_miles(*BOS, *MIA), 1)
+    assert out.loc[3, "away_travel_miles"] == round(haversine_miles(*MIA, *BOS), 1)
+    assert out.loc[1, "home_tz_shift_hours"] == 0.0
+    # Unparseable dates fall back to defaults
+    assert out.loc[5, ["home_rest_days", "home_games_last_7"]].tolist() == [3.0, 2.0]
@@ -0,0 +1,21 @@
+"""Tests for dataset schema validation."""
+import pandas as pd
+import pytest
+
+from app.engine.schema import _infer_dtype
+
+
+# ---------------------------------------------------------------------------
+# Column type inference
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("values, expected", [
+    (["2024-01-05", "2024-02-29"], "datetime"),
+    (["2024-01-05 10:00", "2024-01-06T11:22:33.5"], "datetime"),
+    (["01/05/2024", "2024-01-05"], "datetime"),
+    (["2024-99-99", "2024-13-45"], "categorical"),
+    (["1234-56-7890-A", "2345-67-8901-B"], "categorical"),
+    (["2024-01-05 garbage", "2024-01-06"], "categorical"),
+])
+def test_infer_dtype_dates(values, expected):
+    assert _infer_dtype(pd.Series(values * 10, dtype=object)) == expected
@@ -0,0 +1,65 @@
+"""Tests for training helpers."""
+from unittest import mock
+
+import numpy as np
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from app.engine.train import _permutation_importance
+
+
+@pytest.fixture(scope="module")
+def fitted_hgb():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(800, 6))
+    y = (X[:, 0] + 0.5 * X[:, 3] + rng.normal(size=800) > 0).astype(int)
+    model = HistGradientBoostingClassifier(max_iter=30, random_state=0).fit(X, y)
+    return model, X, y
+
+
+# ---------------------------------------------------------------------------
+# Permutation importance
+# ---------------------------------------------------------------------------
+
+def test_permutation_importance_paths_agree(fitted_hgb):
+    model, X, y = fitted_hgb
+    names = [f"f{i}" for i in range(X.shape[1])]
+    X_before = X.copy()
+
+    with mock.patch("joblib.effective_n_jobs", return_value=1):
+        in_place = _permutation_importance(model, X, y, names)
+    with mock.patch("joblib.effective_n_jobs", return_value=2):
+        parallel = _permutation_importance(model, X, y, names)
+
+    assert in_place == parallel
+    np.testing.assert_array_equal(X, X_before)  # in-place shuffles are restored
+    top = max(in_place, key=lambda r: r["importance"])
+    assert top["feature"] == "f0"
+
+
+def test_permutation_importance_failed_feature_scores_zero(fitted_hgb):
+    model, X, y = fitted_hgb
+    names = [f"f{i}" for i in range(X.shape[1])]
+    original = X[:, 2].copy()
+
+    class _FailsOnShuffledF2:
+        _estimator_type = "classifier"
+        classes_ = model.classes_
+
+        def fit(self, X, y):
+            return self
+
+        def predict_proba(self, X):
+            if not np.array_equal(X[:, 2], original):
+                raise ValueError("scoring failed")
+            return model.predict_proba(X)
+
+    results = []
+    for n_jobs in (1, 2):
+        with mock.patch("joblib.effective_n_jobs", return_value=n_jobs):
+            results.append({r["feature"]: r["importance"] for r in
+                            _permutation_importance(_FailsOnShuffledF2(), X, y, names)})
+
+    assert results[0] == results[1]
+    assert results[0]["f2"] == 0.0
+    assert results[0]["f0"] > 0.0  # one bad feature doesn't zero the rest